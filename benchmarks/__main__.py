@@ -0,0 +1,49 @@
+'''
+Runs the benchmarks once without asv, for a quick look on a development machine:
+
+    python -m benchmarks [name filter] [--stages]
+
+With ``--stages``, the time spent in each pandas_geojson stage (parse,
+validate, build, normalize, write, ...) is printed below every benchmark.
+'''
+import inspect
+import itertools
+import sys
+import time
+import pandas_geojson as pdg
+from benchmarks import bench_core, bench_io
+
+
+def main(argv):
+    stages = '--stages' in argv
+    names = [arg for arg in argv if not arg.startswith('--')]
+    for module in (bench_core, bench_io):
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            methods = [name for name in dir(cls) if name.startswith('time_')]
+            params = getattr(cls, 'params', ())
+            for values in itertools.product(*params) if params else [()]:
+                label = f"{cls.__name__}({', '.join(map(str, values))})"
+                selected = [name for name in methods if not names or any(n in f'{label}.{name}' for n in names)]
+                if not selected:
+                    continue
+                benchmark = cls()
+                benchmark.setup(*values)
+                try:
+                    for name in selected:
+                        with pdg.profile() as stats:
+                            start = time.perf_counter()
+                            getattr(benchmark, name)(*values)
+                            seconds = time.perf_counter() - start
+                        print(f"{label}.{name}: {seconds * 1000:.2f} ms")
+                        if stages:
+                            for stage, stage_seconds in stats.seconds.items():
+                                print(f"    {stage}: {stage_seconds * 1000:.2f} ms")
+                finally:
+                    if hasattr(benchmark, 'teardown'):
+                        benchmark.teardown(*values)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,71 @@
+import pandas_geojson as pdg
+from benchmarks.synthetic import KINDS, SIZES, collection
+
+
+class FromDict:
+    params = (KINDS, SIZES)
+    param_names = ['kind', 'size']
+    timeout = 600
+
+    def setup(self, kind, size):
+        self.data = collection(kind, size)
+
+    def time_from_dict(self, kind, size):
+        pdg.GeoJSON.from_dict(self.data)
+
+    def time_from_dict_columnar(self, kind, size):
+        pdg.GeoJSON.from_dict(self.data, columnar=True)
+
+    def time_from_dict_unvalidated(self, kind, size):
+        pdg.GeoJSON.from_dict(self.data, validate='none')
+
+    def peakmem_from_dict(self, kind, size):
+        pdg.GeoJSON.from_dict(self.data)
+
+
+class ToDataFrame:
+    params = (KINDS, SIZES)
+    param_names = ['kind', 'size']
+    timeout = 600
+
+    def setup(self, kind, size):
+        self.geojson = pdg.GeoJSON.from_dict(collection(kind, size))
+
+    def time_to_dataframe(self, kind, size):
+        self.geojson.to_dataframe()
+
+    def time_to_dataframe_without_geometry(self, kind, size):
+        self.geojson.to_dataframe(geometry=False)
+
+    def peakmem_to_dataframe(self, kind, size):
+        self.geojson.to_dataframe()
+
+
+class FromDataFrame:
+    params = (KINDS, SIZES)
+    param_names = ['kind', 'size']
+    timeout = 600
+
+    def setup(self, kind, size):
+        self.df = pdg.GeoJSON.from_dict(collection(kind, size)).to_dataframe()
+        self.columns = [column for column in self.df.columns if column.startswith('properties.')]
+
+    def time_from_dataframe(self, kind, size):
+        pdg.GeoJSON.from_dataframe(self.df, property_col_list=self.columns)
+
+
+class FilterGeoJSON:
+    params = (['points', 'wide'], SIZES)
+    param_names = ['kind', 'size']
+    timeout = 600
+
+    def setup(self, kind, size):
+        self.geojson = pdg.GeoJSON.from_dict(collection(kind, size))
+
+    def time_filter_cold(self, kind, size):
+        # Drops the cached property index so every run builds it again
+        self.geojson._invalidate_indexes()
+        self.geojson.filter_geojson(['category_3', 'category_7'], 'category')
+
+    def time_filter_warm(self, kind, size):
+        self.geojson.filter_geojson(['category_3', 'category_7'], 'category')
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import pandas_geojson as pdg
+from benchmarks.synthetic import DATASET, KINDS, SIZES, collection
+
+
+class ReadWrite:
+    params = (KINDS, SIZES)
+    param_names = ['kind', 'size']
+    timeout = 600
+
+    def setup(self, kind, size):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'collection.geojson')
+        self.output = os.path.join(self.directory, 'output.geojson')
+        self.geojson = pdg.GeoJSON.from_dict(collection(kind, size))
+        pdg.save_geojson(self.geojson, self.path)
+
+    def teardown(self, kind, size):
+        shutil.rmtree(self.directory)
+
+    def time_read_geojson(self, kind, size):
+        pdg.read_geojson(self.path)
+
+    def time_read_geojson_columnar(self, kind, size):
+        pdg.read_geojson(self.path, columnar=True)
+
+    def time_read_geojson_projection(self, kind, size):
+        pdg.read_geojson(self.path, properties=['category'], geometry=False)
+
+    def time_save_geojson(self, kind, size):
+        pdg.save_geojson(self.geojson, self.output)
+
+    def peakmem_read_geojson(self, kind, size):
+        pdg.read_geojson(self.path)
+
+
+class IncrementalSave:
+    params = (KINDS, SIZES)
+    param_names = ['kind', 'size']
+    timeout = 600
+
+    def setup(self, kind, size):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'collection.geojson')
+        self.geojson = pdg.GeoJSON.from_dict(collection(kind, size)).track_changes()
+        pdg.save_geojson(self.geojson, self.path)
+        self.edited = list(range(0, size, max(size // 100, 1)))
+
+    def teardown(self, kind, size):
+        shutil.rmtree(self.directory)
+
+    def time_save_after_edits(self, kind, size):
+        self.geojson.update_properties(self.edited, {'value': 0.0})
+        pdg.save_geojson(self.geojson, self.path)
+
+
+class Bundled:
+    '''
+    The National_Obesity_By_State.geojson dataset shipped with the repository.
+    '''
+    def setup(self):
+        self.directory = tempfile.mkdtemp()
+        self.output = os.path.join(self.directory, 'output.geojson')
+        self.geojson = pdg.read_geojson(DATASET)
+        self.df = self.geojson.to_dataframe()
+
+    def teardown(self):
+        shutil.rmtree(self.directory)
+
+    def time_read_geojson(self):
+        pdg.read_geojson(DATASET)
+
+    def time_to_dataframe(self):
+        self.geojson.to_dataframe()
+
+    def time_from_dataframe(self):
+        pdg.GeoJSON.from_dataframe(self.df, property_col_list=['properties.NAME', 'properties.Obesity'])
+
+    def time_filter_geojson(self):
+        self.geojson._invalidate_indexes()
+        self.geojson.filter_geojson(['Texas', 'Utah'], 'NAME')
+
+    def time_save_geojson(self):
+        pdg.save_geojson(self.geojson, self.output)
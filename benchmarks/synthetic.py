@@ -0,0 +1,57 @@
+'''
+Synthetic FeatureCollections for the benchmarks.
+
+Sizes above 100,000 features take minutes and several GB to build as
+Python dictionaries, so they only run when ``PANDAS_GEOJSON_BENCH_LARGE``
+is set.
+'''
+import os
+import numpy as np
+
+
+SIZES = [1000, 100000]
+if os.environ.get('PANDAS_GEOJSON_BENCH_LARGE'):
+    SIZES += [1000000, 10000000]
+
+KINDS = ['points', 'polygons', 'wide']
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+
+
+def collection(kind: str, size: int, seed: int = 0) -> dict:
+    '''
+    FeatureCollection dictionary of ``size`` features.
+
+    :param kind: 'points', 'polygons' with 64 vertices per ring, or 'wide' points with 50 properties
+    '''
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-125, -67, size)
+    y = rng.uniform(25, 49, size)
+    categories = [f'category_{i}' for i in range(20)]
+    category = rng.integers(0, len(categories), size).tolist()
+    values = rng.normal(size=size).round(4).tolist()
+
+    if kind == 'polygons':
+        angles = np.linspace(0, 2 * np.pi, 64)
+        angles[-1] = 0
+        radius = rng.uniform(0.01, 0.1, size)
+        rings = np.stack([x[:, None] + radius[:, None] * np.cos(angles),
+                          y[:, None] + radius[:, None] * np.sin(angles)], axis=-1).round(6).tolist()
+        geometries = [{'type': 'Polygon', 'coordinates': [ring]} for ring in rings]
+    elif kind in ('points', 'wide'):
+        geometries = [{'type': 'Point', 'coordinates': point} for point in np.column_stack([x, y]).round(6).tolist()]
+    else:
+        raise ValueError(f"Invalid kind: {kind}")
+
+    properties = [{'id': i, 'category': categories[c], 'value': v} for i, (c, v) in enumerate(zip(category, values))]
+    if kind == 'wide':
+        extra = rng.integers(0, 1000, (size, 47)).tolist()
+        names = [f'column_{i}' for i in range(47)]
+        for props, row in zip(properties, extra):
+            props.update(zip(names, row))
+
+    return {
+        'type': 'FeatureCollection',
+        'features': [{'type': 'Feature', 'geometry': geometry, 'properties': props}
+                     for geometry, props in zip(geometries, properties)],
+    }
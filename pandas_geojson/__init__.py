@@ -11,19 +11,80 @@ from pandas_geojson.core import(
 
 )
 
+from pandas_geojson.validation import (
+    GeoJSONValidationError,
+    validate_features,
+)
+
+from pandas_geojson.backend import (
+    set_json_engine,
+    get_json_engine,
+    available_engines,
+)
 
 from pandas_geojson.io import (
     save_geojson,
+    save_geojsonseq,
+    read_geojsonseq,
+    GeoJSONWriter,
     read_geojson,
     read_geojson_url,
+    read_geojson_many,
+    iter_geojson,
 
 )
+from pandas_geojson.arrow import (
+    read_geoparquet,
+    read_feather,
+)
+from pandas_geojson.topojson import (
+    read_topojson,
+)
+from pandas_geojson.changes import (
+    merge_patch,
+)
+from pandas_geojson.records import (
+    Feature,
+)
+from pandas_geojson.profiling import (
+    profile,
+)
+from pandas_geojson.tiles import (
+    TileSet,
+    tile_bounds,
+)
+from pandas_geojson.remote import (
+    aread_geojson_url,
+    aread_geojson_urls,
+    read_geojson_urls,
+)
 
 __all__ =[
     "GeoJSON",
+    "Feature",
+    "merge_patch",
     "read_geojson",
     "read_geojson_url",
+    "read_geojson_many",
+    "aread_geojson_url",
+    "aread_geojson_urls",
+    "read_geojson_urls",
+    "iter_geojson",
     "save_geojson",
+    "save_geojsonseq",
+    "read_geojsonseq",
+    "GeoJSONWriter",
+    "read_topojson",
+    "read_geoparquet",
+    "read_feather",
+    "TileSet",
+    "tile_bounds",
+    "profile",
+    "GeoJSONValidationError",
+    "validate_features",
+    "set_json_engine",
+    "get_json_engine",
+    "available_engines",
     "Point",
     "MultiPoint",
     "LineString",
@@ -0,0 +1,299 @@
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Union
+import numpy as np
+
+
+GEOMETRY_TYPES = ('Point', 'MultiPoint', 'LineString', 'MultiLineString', 'Polygon', 'MultiPolygon')
+POINT, MULTIPOINT, LINESTRING, MULTILINESTRING, POLYGON, MULTIPOLYGON = range(len(GEOMETRY_TYPES))
+TYPE_CODES = {name: code for code, name in enumerate(GEOMETRY_TYPES)}
+NULL_GEOMETRY = -1
+
+
+class GeometryArray:
+    '''
+    Columnar storage for a sequence of GeoJSON geometries.
+
+    The layout follows GeoArrow: one contiguous float64 ``(n_vertices, 2)``
+    coordinate array and three offset arrays. Every geometry is stored with
+    MultiPolygon nesting (geometry -> parts -> rings -> vertices), so a Point
+    is one part with one ring of one vertex, a LineString is one part with one
+    ring, a Polygon is one part, and so on. ``type_codes`` records the original
+    geometry type so the nested coordinates can be rebuilt exactly.
+
+    :param coords: Vertex coordinates
+    :param ring_offsets: Offsets of each ring into ``coords``
+    :param part_offsets: Offsets of each part into the rings
+    :param geometry_offsets: Offsets of each geometry into the parts
+    :param type_codes: Index into ``GEOMETRY_TYPES`` per geometry, -1 for null geometries
+    '''
+    __slots__ = ('coords', 'ring_offsets', 'part_offsets', 'geometry_offsets', 'type_codes')
+
+    def __init__(self, coords, ring_offsets, part_offsets, geometry_offsets, type_codes):
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        self.ring_offsets = np.asarray(ring_offsets, dtype=np.int64)
+        self.part_offsets = np.asarray(part_offsets, dtype=np.int64)
+        self.geometry_offsets = np.asarray(geometry_offsets, dtype=np.int64)
+        self.type_codes = np.asarray(type_codes, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+    def __getitem__(self, i: int) -> Union[Dict[str, Any], None]:
+        code = self.type_codes[i]
+        if code == NULL_GEOMETRY:
+            return None
+        return {'type': GEOMETRY_TYPES[code], 'coordinates': self.coordinates(i)}
+
+    def __iter__(self) -> Iterator[Union[Dict[str, Any], None]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
+
+    @classmethod
+    def from_geometries(cls, geometries: Iterable[Union[Dict[str, Any], None]]) -> 'GeometryArray':
+        '''
+        Packs geometry dictionaries into columnar arrays.
+        '''
+        vertices = []
+        ring_lengths = []
+        part_lengths = []
+        geometry_lengths = []
+        type_codes = []
+        for geometry in geometries:
+            if geometry is None:
+                type_codes.append(NULL_GEOMETRY)
+                geometry_lengths.append(0)
+                continue
+            code = TYPE_CODES.get(geometry['type'])
+            if code is None:
+                raise ValueError(f"Invalid geometry type: {geometry['type']}")
+            coordinates = geometry['coordinates']
+            if code == POINT:
+                polygons = [[[coordinates]]]
+            elif code in (MULTIPOINT, LINESTRING):
+                polygons = [[coordinates]]
+            elif code in (MULTILINESTRING, POLYGON):
+                polygons = [coordinates]
+            else:
+                polygons = coordinates
+            type_codes.append(code)
+            geometry_lengths.append(len(polygons))
+            for polygon in polygons:
+                part_lengths.append(len(polygon))
+                for ring in polygon:
+                    ring_lengths.append(len(ring))
+                    vertices.extend(ring)
+
+        coords = np.array(vertices, dtype=np.float64) if vertices else np.empty((0, 2))
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("Coordinates must be pairs of numerical values (longitude and latitude).")
+        return cls(coords,
+                   _offsets(ring_lengths),
+                   _offsets(part_lengths),
+                   _offsets(geometry_lengths),
+                   type_codes)
+
+    @classmethod
+    def concat(cls, arrays: List['GeometryArray']) -> 'GeometryArray':
+        '''
+        Concatenates several arrays into one.
+        '''
+        if not arrays:
+            return cls.from_geometries([])
+        return cls(np.concatenate([a.coords for a in arrays]),
+                   _concat_offsets([a.ring_offsets for a in arrays]),
+                   _concat_offsets([a.part_offsets for a in arrays]),
+                   _concat_offsets([a.geometry_offsets for a in arrays]),
+                   np.concatenate([a.type_codes for a in arrays]))
+
+    def take(self, indices) -> 'GeometryArray':
+        '''
+        Selects geometries by position or boolean mask without building lists.
+        '''
+        indices = _as_indices(indices, len(self))
+        geometry_offsets, parts = _take_ranges(self.geometry_offsets, indices)
+        part_offsets, rings = _take_ranges(self.part_offsets, parts)
+        ring_offsets, vertices = _take_ranges(self.ring_offsets, rings)
+        return GeometryArray(self.coords[vertices], ring_offsets, part_offsets,
+                             geometry_offsets, self.type_codes[indices])
+
+    def geometry_type(self, i: int) -> Union[str, None]:
+        code = self.type_codes[i]
+        return None if code == NULL_GEOMETRY else GEOMETRY_TYPES[code]
+
+    def coordinates(self, i: int) -> Any:
+        '''
+        Rebuilds the nested coordinate lists of one geometry.
+        '''
+        code = self.type_codes[i]
+        if code == NULL_GEOMETRY:
+            return None
+        ring_offsets = self.ring_offsets
+        polygons = []
+        for part in range(self.geometry_offsets[i], self.geometry_offsets[i + 1]):
+            polygons.append([
+                self.coords[ring_offsets[ring]:ring_offsets[ring + 1]].tolist()
+                for ring in range(self.part_offsets[part], self.part_offsets[part + 1])
+            ])
+        if code == MULTIPOLYGON:
+            return polygons
+        if code in (MULTILINESTRING, POLYGON):
+            return polygons[0]
+        if code in (MULTIPOINT, LINESTRING):
+            return polygons[0][0]
+        return polygons[0][0][0]
+
+    def bounds(self) -> np.ndarray:
+        '''
+        Bounding box of every geometry as ``(minx, miny, maxx, maxy)`` rows.
+        Empty and null geometries get NaN bounds.
+        '''
+        starts = self.ring_offsets[self.part_offsets[self.geometry_offsets]]
+        bounds = np.full((len(self), 4), np.nan)
+        nonempty = np.diff(starts) > 0
+        if nonempty.any():
+            segment_starts = starts[:-1][nonempty]
+            bounds[nonempty, :2] = np.minimum.reduceat(self.coords, segment_starts, axis=0)
+            bounds[nonempty, 2:] = np.maximum.reduceat(self.coords, segment_starts, axis=0)
+        return bounds
+
+    def part_geometry_index(self) -> np.ndarray:
+        '''
+        Position of the owning geometry for every part.
+        '''
+        return np.repeat(np.arange(len(self)), np.diff(self.geometry_offsets))
+
+    def ring_part_index(self) -> np.ndarray:
+        '''
+        Position of the owning part for every ring.
+        '''
+        return np.repeat(np.arange(len(self.part_offsets) - 1), np.diff(self.part_offsets))
+
+    def ring_geometry_index(self) -> np.ndarray:
+        '''
+        Position of the owning geometry for every ring.
+        '''
+        return self.part_geometry_index()[self.ring_part_index()]
+
+    def vertex_ring_index(self) -> np.ndarray:
+        '''
+        Position of the owning ring for every vertex.
+        '''
+        return np.repeat(np.arange(len(self.ring_offsets) - 1), np.diff(self.ring_offsets))
+
+    def vertex_geometry_index(self) -> np.ndarray:
+        '''
+        Position of the owning geometry for every vertex.
+        '''
+        vertices_per_geometry = np.diff(self.ring_offsets[self.part_offsets[self.geometry_offsets]])
+        return np.repeat(np.arange(len(self)), vertices_per_geometry)
+
+
+class ColumnarFeatures(Sequence):
+    '''
+    Feature sequence backed by a ``GeometryArray``.
+
+    Feature dictionaries are built on demand when items are accessed, so the
+    collection only holds the coordinate arrays and the property dictionaries.
+    '''
+    def __init__(self, geometries: GeometryArray, properties: List[Dict[str, Any]]):
+        if len(geometries) != len(properties):
+            raise ValueError("Geometries and properties must have the same length.")
+        self.geometries = geometries
+        self.properties = properties
+
+    def __len__(self) -> int:
+        return len(self.properties)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.take(range(*i.indices(len(self))))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Feature index out of range.")
+        return {
+            'type': 'Feature',
+            'geometry': self.geometries[i],
+            'properties': self.properties[i]
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f"ColumnarFeatures(n_features={len(self)}, n_vertices={len(self.geometries.coords)})"
+
+    @classmethod
+    def from_features(cls, features: Iterable[Dict[str, Any]]) -> 'ColumnarFeatures':
+        features = list(features)
+        geometries = GeometryArray.from_geometries(feature['geometry'] for feature in features)
+        properties = [feature.get('properties') or {} for feature in features]
+        return cls(geometries, properties)
+
+    @classmethod
+    def concat(cls, sequences: List['ColumnarFeatures']) -> 'ColumnarFeatures':
+        return cls(GeometryArray.concat([s.geometries for s in sequences]),
+                   [props for s in sequences for props in s.properties])
+
+    def take(self, indices) -> 'ColumnarFeatures':
+        indices = _as_indices(indices, len(self))
+        return ColumnarFeatures(self.geometries.take(indices),
+                                [self.properties[i] for i in indices.tolist()])
+
+    def append(self, feature: Dict[str, Any]):
+        self.extend([feature])
+
+    def extend(self, features: Iterable[Dict[str, Any]]):
+        other = ColumnarFeatures.from_features(features)
+        self.geometries = GeometryArray.concat([self.geometries, other.geometries])
+        self.properties.extend(other.properties)
+
+
+def expand_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    '''
+    Concatenates the ranges ``start:start + count``.
+    '''
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(counts.sum(), dtype=np.int64)
+
+
+def _offsets(lengths: List[int]) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _concat_offsets(offset_arrays: List[np.ndarray]) -> np.ndarray:
+    pieces = [np.zeros(1, dtype=np.int64)]
+    total = 0
+    for offsets in offset_arrays:
+        pieces.append(offsets[1:] - offsets[0] + total)
+        total += offsets[-1] - offsets[0]
+    return np.concatenate(pieces)
+
+
+def _take_ranges(offsets: np.ndarray, indices: np.ndarray):
+    '''
+    Gathers the child ranges of ``indices`` and returns the new offsets
+    together with the positions of the selected children.
+    '''
+    starts = offsets[indices]
+    lengths = offsets[indices + 1] - starts
+    new_offsets = _offsets(lengths)
+    children = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(new_offsets[-1])
+    return new_offsets, children
+
+
+def _as_indices(indices, length: int) -> np.ndarray:
+    indices = np.asarray(indices)
+    if indices.dtype == bool:
+        if len(indices) != length:
+            raise ValueError("Boolean mask must have the same length as the collection.")
+        return np.flatnonzero(indices)
+    indices = indices.astype(np.intp, copy=False).reshape(-1)
+    return np.where(indices < 0, indices + length, indices)
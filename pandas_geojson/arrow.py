@@ -0,0 +1,386 @@
+from typing import Any, List, Tuple, Union
+import json
+import numpy as np
+import pandas as pd
+from pandas_geojson.arrays import (
+    ColumnarFeatures,
+    GeometryArray,
+    GEOMETRY_TYPES,
+    LINESTRING,
+    MULTILINESTRING,
+    MULTIPOINT,
+    MULTIPOLYGON,
+    NULL_GEOMETRY,
+    POINT,
+    POLYGON,
+    TYPE_CODES,
+    _offsets,
+)
+from pandas_geojson.backend import dumps, loads
+from pandas_geojson.core import GeoJSON
+
+
+GEOMETRY_COLUMN = 'geometry'
+TYPE_COLUMN = 'geometry.type'
+BBOX_COLUMN = 'bbox'
+PROPERTY_PREFIX = 'properties.'
+
+# GeoArrow encoding of each geometry type
+_ENCODINGS = {
+    POINT: 'point',
+    MULTIPOINT: 'multipoint',
+    LINESTRING: 'linestring',
+    MULTILINESTRING: 'multilinestring',
+    POLYGON: 'polygon',
+    MULTIPOLYGON: 'multipolygon',
+}
+
+
+def to_parquet(geojson: GeoJSON, path: str, row_group_size: int = 10000, compression: str = 'snappy'):
+    '''
+    Saves a GeoJSON object as GeoParquet.
+
+    Coordinates are stored with the native GeoArrow encoding: nested lists of
+    ``x``/``y`` structs taken directly from the columnar offsets. Collections
+    mixing geometry types use the MultiPolygon nesting, and the
+    ``geometry.type`` column records the original types. Each property key
+    becomes one typed ``properties.*`` column. Nested objects and columns
+    mixing value types are stored as JSON text, so they read back unchanged.
+    A ``bbox``
+    column stores each feature's bounds, and its row group statistics let
+    ``read_geoparquet`` skip row groups outside a query box, so spatially
+    ordered data reads fastest.
+
+    Requires the ``pyarrow`` package.
+
+    :param row_group_size: Number of features per row group
+    :param compression: Parquet compression codec
+    '''
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+    table = _to_table(geojson, interleaved=False)
+    pq.write_table(table, path, row_group_size=row_group_size, compression=compression)
+
+
+def to_feather(geojson: GeoJSON, path: str, compression: str = 'uncompressed'):
+    '''
+    Saves a GeoJSON object as an Arrow IPC (Feather) file.
+
+    The layout matches ``to_parquet`` except that coordinates are stored
+    interleaved, so an uncompressed file can be memory-mapped by
+    ``read_feather`` and its coordinates used without copying.
+
+    Requires the ``pyarrow`` package.
+
+    :param compression: 'uncompressed', 'lz4' or 'zstd'. Compressed files cannot be read zero-copy.
+    '''
+    _import_pyarrow()
+    import pyarrow.feather as feather
+    feather.write_feather(_to_table(geojson, interleaved=True), path, compression=compression)
+
+
+def read_geoparquet(path: str,
+                    columns: List[str] = None,
+                    bbox: Tuple[float, float, float, float] = None,
+                    geometry: bool = True,
+                    as_dataframe: bool = False) -> Union[GeoJSON, pd.DataFrame]:
+    '''
+    Reads a GeoParquet file written by ``to_parquet``, or any GeoParquet file
+    with a GeoArrow-encoded geometry column.
+
+    Integer properties with missing values stay integers, as nullable
+    ``Int64`` columns in a DataFrame. Features lacking a property read back
+    with it set to None.
+
+    :param columns: Property keys to read, all by default
+    :param bbox: ``(minx, miny, maxx, maxy)``. Only features whose bounds intersect it are read,
+        and row groups entirely outside it are skipped.
+    :param geometry: Set to False to skip reading coordinates
+    :param as_dataframe: Return a DataFrame with the ``GeoJSON.to_dataframe`` layout
+    :return: Columnar GeoJSON or DataFrame
+    '''
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+    parquet_file = pq.ParquetFile(path)
+    schema = parquet_file.schema_arrow
+    row_groups = range(parquet_file.num_row_groups)
+    if bbox is not None:
+        row_groups = [i for i in row_groups if _row_group_intersects(parquet_file.metadata.row_group(i), bbox)]
+    names = _select_columns(schema, columns, geometry, bbox)
+    table = parquet_file.read_row_groups(row_groups, columns=names)
+    return _from_table(table, schema, bbox, geometry, as_dataframe)
+
+
+def read_feather(path: str,
+                 columns: List[str] = None,
+                 bbox: Tuple[float, float, float, float] = None,
+                 geometry: bool = True,
+                 as_dataframe: bool = False,
+                 memory_map: bool = True) -> Union[GeoJSON, pd.DataFrame]:
+    '''
+    Reads an Arrow IPC (Feather) file written by ``to_feather``.
+
+    With ``memory_map``, uncompressed files are mapped rather than read, and
+    the coordinate array of the result is a view of the mapped file.
+
+    Integer properties with missing values stay integers, as nullable
+    ``Int64`` columns in a DataFrame. Features lacking a property read back
+    with it set to None.
+
+    :param columns: Property keys to read, all by default
+    :param bbox: ``(minx, miny, maxx, maxy)``. Only features whose bounds intersect it are kept.
+    :param geometry: Set to False to skip reading coordinates
+    :param as_dataframe: Return a DataFrame with the ``GeoJSON.to_dataframe`` layout
+    :return: Columnar GeoJSON or DataFrame
+    '''
+    pa = _import_pyarrow()
+    import pyarrow.feather as feather
+    with pa.memory_map(path) if memory_map else pa.OSFile(path) as source:
+        schema = pa.ipc.open_file(source).schema
+    names = _select_columns(schema, columns, geometry, bbox)
+    table = feather.read_table(path, columns=names, memory_map=memory_map)
+    return _from_table(table, schema, bbox, geometry, as_dataframe)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("GeoParquet and Feather support requires the pyarrow package.")
+    return pyarrow
+
+
+def _to_table(geojson: GeoJSON, interleaved: bool):
+    pa = _import_pyarrow()
+    array = geojson._geometry_array()
+    if geojson.columnar:
+        properties = geojson.features.properties
+    else:
+        properties = [feature.get('properties') or {} for feature in geojson.features]
+
+    codes = array.type_codes
+    present = np.unique(codes[codes != NULL_GEOMETRY])
+    code = int(present[0]) if len(present) == 1 else MULTIPOLYGON
+    null = codes == NULL_GEOMETRY
+    types = [GEOMETRY_TYPES[c] if c != NULL_GEOMETRY else None for c in codes.tolist()]
+
+    bounds = array.bounds()
+    empty = np.isnan(bounds).any(axis=1)
+    bbox = pa.StructArray.from_arrays(
+        [pa.array(bounds[:, i]) for i in range(4)],
+        names=['xmin', 'ymin', 'xmax', 'ymax'],
+        mask=pa.array(empty),
+    )
+
+    arrays = [_geometry_column(array, code, null, interleaved), pa.array(types, pa.string()).dictionary_encode(), bbox]
+    names = [GEOMETRY_COLUMN, TYPE_COLUMN, BBOX_COLUMN]
+    json_columns = []
+    keys = {}
+    for props in properties:
+        for key in props:
+            keys.setdefault(key)
+    for key in keys:
+        values = [props.get(key) for props in properties]
+        column = None
+        if not any(_has_object(value) for value in values):
+            try:
+                column = pa.array(values, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                pass
+        if column is None:
+            # Nested objects and mixed-type values are kept as JSON text
+            column = pa.array([None if _missing(value) else dumps(value) for value in values], pa.string())
+            json_columns.append(key)
+        arrays.append(column)
+        names.append(PROPERTY_PREFIX + key)
+
+    finite = bounds[~empty]
+    geo = {
+        'version': '1.1.0',
+        'primary_column': GEOMETRY_COLUMN,
+        'columns': {GEOMETRY_COLUMN: {
+            'encoding': _ENCODINGS[code],
+            'geometry_types': [GEOMETRY_TYPES[c] for c in present.tolist()],
+            'bbox': [float(finite[:, 0].min()), float(finite[:, 1].min()),
+                     float(finite[:, 2].max()), float(finite[:, 3].max())] if len(finite) else [],
+            'covering': {'bbox': {name: [BBOX_COLUMN, name] for name in ('xmin', 'ymin', 'xmax', 'ymax')}},
+        }},
+    }
+    metadata = {b'geo': json.dumps(geo), b'pandas_geojson': json.dumps({'json_columns': json_columns})}
+    return pa.Table.from_arrays(arrays, names=names).replace_schema_metadata(metadata)
+
+
+def _geometry_column(array: GeometryArray, code: int, null: np.ndarray, interleaved: bool):
+    pa = _import_pyarrow()
+    coords = array.coords
+    starts = array.ring_offsets[array.part_offsets[array.geometry_offsets]]
+    if code == POINT:
+        points = np.full((len(array), 2), np.nan)
+        points[~null] = coords[starts[:-1][~null]]
+        coords = points
+        levels = []
+    elif code in (MULTIPOINT, LINESTRING):
+        levels = [starts]
+    elif code in (MULTILINESTRING, POLYGON):
+        levels = [array.part_offsets[array.geometry_offsets], array.ring_offsets]
+    else:
+        levels = [array.geometry_offsets, array.part_offsets, array.ring_offsets]
+
+    # Points are the outermost level, so null points are masked on the coordinates
+    mask = None if levels else pa.array(null)
+    if interleaved:
+        xy = pa.list_(pa.field('xy', pa.float64(), nullable=False), 2)
+        values = pa.FixedSizeListArray.from_arrays(pa.array(coords.ravel()), type=xy, mask=mask)
+    else:
+        values = pa.StructArray.from_arrays([pa.array(coords[:, 0]), pa.array(coords[:, 1])], names=['x', 'y'], mask=mask)
+
+    large = len(array.coords) >= 2 ** 31
+    list_type = pa.LargeListArray if large else pa.ListArray
+    offset_type = pa.int64() if large else pa.int32()
+    for depth, offsets in enumerate(reversed(levels)):
+        outer = depth == len(levels) - 1
+        values = list_type.from_arrays(pa.array(offsets, offset_type), values, mask=pa.array(null) if outer else None)
+    return values
+
+
+def _select_columns(schema, columns: List[str], geometry: bool, bbox) -> List[str]:
+    names = schema.names
+    if columns is None:
+        selected = [name for name in names if name.startswith(PROPERTY_PREFIX)]
+    else:
+        selected = [PROPERTY_PREFIX + key for key in columns]
+        missing = [name for name in selected if name not in names]
+        if missing:
+            raise ValueError(f"Columns not found: {', '.join(name[len(PROPERTY_PREFIX):] for name in missing)}")
+    if geometry:
+        selected = [GEOMETRY_COLUMN] + ([TYPE_COLUMN] if TYPE_COLUMN in names else []) + selected
+    if bbox is not None:
+        if BBOX_COLUMN not in names:
+            raise ValueError("bbox filtering requires a bbox column.")
+        selected.append(BBOX_COLUMN)
+    return selected
+
+
+def _row_group_intersects(row_group, bbox: Tuple[float, float, float, float]) -> bool:
+    statistics = {}
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        if column.path_in_schema.startswith(BBOX_COLUMN + '.') and column.statistics is not None and column.statistics.has_min_max:
+            statistics[column.path_in_schema[len(BBOX_COLUMN) + 1:]] = column.statistics
+    if len(statistics) < 4:
+        return True
+    minx, miny, maxx, maxy = bbox
+    return not (statistics['xmin'].min > maxx or statistics['ymin'].min > maxy
+                or statistics['xmax'].max < minx or statistics['ymax'].max < miny)
+
+
+def _from_table(table, schema, bbox, geometry: bool, as_dataframe: bool) -> Union[GeoJSON, pd.DataFrame]:
+    if bbox is not None:
+        bounds = table.column(BBOX_COLUMN).combine_chunks()
+        minx, miny, maxx, maxy = bbox
+        fields = {name: np.asarray(bounds.field(name).to_numpy(zero_copy_only=False), dtype=np.float64)
+                  for name in ('xmin', 'ymin', 'xmax', 'ymax')}
+        with np.errstate(invalid='ignore'):
+            keep = ((fields['xmin'] <= maxx) & (fields['ymin'] <= maxy)
+                    & (fields['xmax'] >= minx) & (fields['ymax'] >= miny))
+        keep &= ~np.asarray(bounds.is_null().to_numpy(zero_copy_only=False))
+        table = table.filter(keep).drop_columns([BBOX_COLUMN])
+
+    settings = loads((schema.metadata or {}).get(b'pandas_geojson', b'{}'))
+    json_columns = {PROPERTY_PREFIX + key for key in settings.get('json_columns', [])}
+    property_names = [name for name in table.column_names if name.startswith(PROPERTY_PREFIX)]
+    json_names = json_columns.intersection(property_names)
+
+    if geometry:
+        array = _geometry_array(table, schema)
+    else:
+        n = table.num_rows
+        array = GeometryArray(np.empty((0, 2)), [0], [0], np.zeros(n + 1), np.full(n, NULL_GEOMETRY))
+
+    if as_dataframe:
+        pa = _import_pyarrow()
+        # Integer columns with nulls stay integers
+        data = table.select(property_names).to_pandas(
+            types_mapper=lambda arrow_type: pd.Int64Dtype() if pa.types.is_signed_integer(arrow_type) else None)
+        for name in json_names:
+            data[name] = [None if _missing(value) else loads(value) for value in data[name]]
+        if any(isinstance(value, dict) for name in json_names for value in data[name]):
+            # Nested objects are flattened into dotted columns, as by to_dataframe
+            data = pd.concat([pd.json_normalize([{name: value} for value in data[name]])
+                              if name in json_names else data[[name]] for name in data.columns], axis=1)
+        columns = {'type': ['Feature'] * table.num_rows}
+        if geometry:
+            columns['geometry.type'] = [array.geometry_type(i) for i in range(len(array))]
+            columns['geometry.coordinates'] = [array.coordinates(i) for i in range(len(array))]
+        return pd.concat([pd.DataFrame(columns), data], axis=1)
+
+    # Python values straight from Arrow, so integers with nulls are not turned into floats
+    properties = table.select(property_names).rename_columns(
+        [name[len(PROPERTY_PREFIX):] for name in property_names]).to_pylist()
+    for name in json_names:
+        key = name[len(PROPERTY_PREFIX):]
+        for props in properties:
+            if props[key] is not None:
+                props[key] = loads(props[key])
+    if not property_names:
+        properties = [{} for _ in range(table.num_rows)]
+    return GeoJSON(type='FeatureCollection', features=ColumnarFeatures(array, properties))
+
+
+def _geometry_array(table, schema) -> GeometryArray:
+    pa = _import_pyarrow()
+    column = table.column(GEOMETRY_COLUMN).combine_chunks()
+    null = np.asarray(column.is_null().to_numpy(zero_copy_only=False))
+    valid = ~null
+
+    if TYPE_COLUMN in table.column_names:
+        types = table.column(TYPE_COLUMN).to_pylist()
+        codes = np.array([NULL_GEOMETRY if t is None else TYPE_CODES[t] for t in types], dtype=np.int8)
+    else:
+        geo = loads((schema.metadata or {}).get(b'geo', b'{}'))
+        encoding = geo.get('columns', {}).get(GEOMETRY_COLUMN, {}).get('encoding', '').lower()
+        code = {name: code for code, name in _ENCODINGS.items()}.get(encoding)
+        if code is None:
+            raise ValueError(f"Unsupported geometry encoding: {encoding}. Only GeoArrow encodings can be read.")
+        codes = np.where(null, NULL_GEOMETRY, code).astype(np.int8)
+
+    levels = []
+    values = column
+    while pa.types.is_list(values.type) or pa.types.is_large_list(values.type):
+        offsets = np.asarray(values.offsets.to_numpy(), dtype=np.int64)
+        levels.append(offsets - offsets[0])
+        values = values.flatten()
+    coords = _coordinates(values)
+
+    if not levels:
+        coords = coords[valid]
+        ones = np.arange(valid.sum() + 1)
+        return GeometryArray(coords, ones, ones, _offsets(valid.astype(np.int64)), codes)
+    # Null geometries have no parts, so their (empty) ranges are dropped from the outer level
+    outer = np.append(levels[0][:-1][valid], levels[0][-1])
+    if len(levels) == 1:
+        ones = np.arange(valid.sum() + 1)
+        return GeometryArray(coords, outer, ones, _offsets(valid.astype(np.int64)), codes)
+    if len(levels) == 2:
+        return GeometryArray(coords, levels[1], outer, _offsets(valid.astype(np.int64)), codes)
+    return GeometryArray(coords, levels[2], levels[1], levels[0], codes)
+
+
+def _coordinates(values) -> np.ndarray:
+    pa = _import_pyarrow()
+    if pa.types.is_fixed_size_list(values.type):
+        # flatten() would drop null points, so slice the child array instead
+        flat = values.values.slice(values.offset * 2, len(values) * 2)
+        return flat.to_numpy(zero_copy_only=False).reshape(-1, 2)
+    x, y = (field.to_numpy(zero_copy_only=False) for field in values.flatten()[:2])
+    return np.column_stack([x, y])
+
+
+def _has_object(value: Any) -> bool:
+    if isinstance(value, dict):
+        return True
+    return isinstance(value, list) and any(_has_object(item) for item in value)
+
+
+def _missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
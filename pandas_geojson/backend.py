@@ -0,0 +1,186 @@
+from collections.abc import Mapping
+from typing import Any, Callable, List
+import json
+import math
+import re
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+ENGINES = ('auto', 'json', 'orjson', 'ujson', 'simdjson')
+
+# Preference order when the engine is 'auto'. simdjson can only parse.
+_LOAD_ORDER = ('orjson', 'simdjson', 'ujson', 'json')
+_DUMP_ORDER = ('orjson', 'ujson', 'json')
+
+_engine = 'auto'
+
+# Exponents as written by the standard library ('1e-07', '1e+16') or ujson ('1e+16')
+_LONG_EXPONENT = re.compile(r'\de(?:\+|-0)')
+
+
+def available_engines() -> List[str]:
+    '''
+    Lists the JSON engines that are installed.
+    '''
+    modules = {'json': json, 'orjson': orjson, 'ujson': ujson, 'simdjson': simdjson}
+    return [name for name in ENGINES[1:] if modules[name] is not None]
+
+
+def set_json_engine(engine: str):
+    '''
+    Sets the JSON engine used by default for reading and writing.
+
+    :param engine: One of 'auto', 'json', 'orjson', 'ujson' or 'simdjson'.
+        'auto' picks the fastest installed engine and falls back to the standard library.
+    '''
+    global _engine
+    if engine != 'auto':
+        _check_engine(engine)
+    _engine = engine
+
+
+def get_json_engine() -> str:
+    return _engine
+
+
+def loads(data, engine: str = None) -> Any:
+    engine = _resolve(engine, _LOAD_ORDER)
+    if engine == 'orjson':
+        return orjson.loads(data)
+    if engine == 'simdjson':
+        return simdjson.loads(data)
+    if engine == 'ujson':
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def loader(engine: str = None) -> Callable[[Any], Any]:
+    '''
+    The ``loads`` function of a JSON engine, for decoding many small
+    documents without resolving the engine every time.
+    '''
+    engine = _resolve(engine, _LOAD_ORDER)
+    return {'orjson': orjson, 'simdjson': simdjson, 'ujson': ujson}.get(engine, json).loads
+
+
+def load(fp, engine: str = None) -> Any:
+    engine = _resolve(engine, _LOAD_ORDER)
+    if engine == 'json':
+        return json.load(fp)
+    return loads(fp.read(), engine)
+
+
+def dumps(obj: Any, indent: int = None, engine: str = None) -> str:
+    '''
+    Serializes ``obj`` to a JSON string.
+
+    Every engine writes the same text as orjson: compact separators (or
+    ``': '`` with an indent), unescaped UTF-8, NaN and infinities as null and
+    exponents without a sign or leading zeros, so the output does not depend
+    on the installed packages. NumPy arrays and scalars are serialized
+    natively. orjson only supports an indent of 2, so other indents fall
+    back to the standard library.
+    '''
+    engine = _resolve(engine, _DUMP_ORDER)
+    if engine == 'orjson' and indent in (None, 2):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option).decode('utf8')
+    if engine == 'ujson' and indent in (None, 2):
+        try:
+            text = ujson.dumps(obj, indent=indent or 0, ensure_ascii=False, escape_forward_slashes=False,
+                               allow_nan=False, default=_default)
+        except OverflowError:
+            text = None
+        if text is not None and not _LONG_EXPONENT.search(text):
+            return text
+    return _json_dumps(obj, indent)
+
+
+def dump(obj: Any, fp, indent: int = None, engine: str = None):
+    fp.write(dumps(obj, indent=indent, engine=engine))
+
+
+class _Encoder(json.JSONEncoder):
+    '''
+    Standard library encoder writing floats as orjson does. It always runs
+    the pure Python encoder, so it is only used for the documents the C
+    encoder writes differently.
+    '''
+    def iterencode(self, o, _one_shot=False):
+        indent = ' ' * self.indent if isinstance(self.indent, int) else self.indent
+        return json.encoder._make_iterencode(
+            {} if self.check_circular else None, self.default, json.encoder.encode_basestring, indent,
+            _floatstr, self.key_separator, self.item_separator, self.sort_keys, self.skipkeys, _one_shot)(o, 0)
+
+
+def _json_dumps(obj: Any, indent: int = None) -> str:
+    options = dict(indent=indent, separators=(',', ': ') if indent else (',', ':'), ensure_ascii=False, default=_default)
+    try:
+        text = json.dumps(obj, allow_nan=False, **options)
+    except ValueError:
+        # NaN or infinity, written as null by the Python encoder
+        text = None
+    if text is None or _LONG_EXPONENT.search(text):
+        text = _Encoder(**options).encode(obj)
+    return text
+
+
+def _floatstr(value: float) -> str:
+    if not math.isfinite(value):
+        return 'null'
+    text = float.__repr__(value)
+    if 'e' in text:
+        mantissa, exponent = text.split('e')
+        text = f"{mantissa}e{int(exponent)}"
+    return text
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == np.float32:
+            # Shortest float32 digits, as orjson writes them
+            return obj.astype(str).astype(np.float64).tolist()
+        return obj.tolist()
+    if isinstance(obj, np.float32):
+        return float(str(obj))
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _check_engine(engine: str):
+    if engine not in ENGINES:
+        raise ValueError(f"Invalid JSON engine: {engine}. Must be one of {', '.join(ENGINES)}.")
+    if engine != 'auto' and engine not in available_engines():
+        raise ImportError(f"JSON engine '{engine}' is not installed.")
+
+
+def _resolve(engine: str, order) -> str:
+    engine = engine or _engine
+    if engine == 'auto':
+        installed = available_engines()
+        return next(name for name in order if name in installed)
+    _check_engine(engine)
+    if engine not in order:
+        # simdjson cannot serialize
+        return _resolve('auto', order)
+    return engine
@@ -0,0 +1,165 @@
+from typing import Any, Dict, List, Union
+from pandas_geojson.backend import dumps
+from pandas_geojson.records import Feature
+
+
+FORMATS = ('merge-patch', 'log')
+
+
+class ChangeTracker:
+    '''
+    Edits made to a GeoJSON collection since ``GeoJSON.track_changes``, and
+    the encoded JSON of each of its features.
+
+    Every feature gets a stable id: features present when tracking starts
+    are numbered by position, and added features continue the sequence.
+    Ids are kept when other features are removed, so the diffs refer to
+    features by id rather than by position.
+
+    A feature is re-encoded only when the record at its position is no
+    longer the one its JSON was encoded from. Records are immutable, so
+    this catches every edit, including features replaced directly in
+    ``GeoJSON.features``.
+
+    :param features: Feature records of the collection
+    '''
+    def __init__(self, features: List[Feature]):
+        self.ids = list(range(len(features)))
+        self.next_id = len(features)
+        self.fragments: List[str] = [None] * len(features)
+        self._encoded: List[Feature] = [None] * len(features)
+        self._engine = None
+        self.added: Dict[int, Feature] = {}
+        self.removed: Dict[int, None] = {}
+        self.original: Dict[int, Feature] = {}
+        self.log: List[Dict[str, Any]] = []
+
+    def __repr__(self):
+        return (f"ChangeTracker(n_features={len(self.ids)}, added={len(self.added)}, "
+                f"updated={len(self.original) - len(self.removed)}, removed={len(self.removed)})")
+
+    def add(self, features: List[Feature]):
+        for feature in features:
+            feature_id = self.next_id
+            self.next_id += 1
+            self.ids.append(feature_id)
+            self.fragments.append(None)
+            self._encoded.append(None)
+            self.added[feature_id] = feature
+            self.log.append({'op': 'add', 'id': feature_id, 'feature': feature})
+
+    def remove(self, positions: List[int], features: List[Feature]):
+        removed = set(positions)
+        for position in sorted(removed):
+            feature_id = self.ids[position]
+            if self.added.pop(feature_id, None) is None:
+                self.original.setdefault(feature_id, features[position])
+                self.removed[feature_id] = None
+            self.log.append({'op': 'remove', 'id': feature_id})
+        keep = [i for i in range(len(self.ids)) if i not in removed]
+        self.ids = [self.ids[i] for i in keep]
+        self.fragments = [self.fragments[i] for i in keep]
+        self._encoded = [self._encoded[i] for i in keep]
+
+    def update(self, position: int, old: Feature, new: Feature, patch: Dict[str, Any]):
+        feature_id = self.ids[position]
+        if feature_id in self.added:
+            self.added[feature_id] = new
+        else:
+            self.original.setdefault(feature_id, old)
+        self.log.append({'op': 'update', 'id': feature_id, 'properties': patch})
+
+    def clear(self):
+        '''
+        Forgets the recorded edits, keeping the ids and encoded features.
+        '''
+        self.added = {}
+        self.removed = {}
+        self.original = {}
+        self.log = []
+
+    def diff(self, features: List[Feature], format: str = 'merge-patch') -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        '''
+        See ``GeoJSON.diff``.
+        '''
+        if format not in FORMATS:
+            raise ValueError(f"Invalid diff format: {format}. Must be one of {', '.join(FORMATS)}.")
+        self._check(features)
+        if format == 'log':
+            return [dict(entry, feature=entry['feature'].to_dict()) if 'feature' in entry else dict(entry)
+                    for entry in self.log]
+
+        patch = {}
+        for position, feature_id in enumerate(self.ids):
+            if feature_id in self.added:
+                patch[str(feature_id)] = features[position].to_dict()
+            elif feature_id in self.original:
+                feature_patch = merge_diff(self.original[feature_id].to_dict(), features[position].to_dict())
+                if feature_patch:
+                    patch[str(feature_id)] = feature_patch
+        for feature_id in self.removed:
+            patch[str(feature_id)] = None
+        return patch
+
+    def encode(self, features: List[Feature], engine: str = None) -> List[str]:
+        '''
+        JSON of every feature, encoding only the features edited since the last call.
+
+        :return: List of JSON strings in feature order
+        '''
+        self._check(features)
+        if engine != self._engine:
+            self._encoded = [None] * len(features)
+            self._engine = engine
+        fragments = self.fragments
+        encoded = self._encoded
+        for position, feature in enumerate(features):
+            if encoded[position] is not feature:
+                fragments[position] = dumps(feature, engine=engine)
+                encoded[position] = feature
+        return fragments
+
+    def _check(self, features: List[Feature]):
+        if len(features) != len(self.ids):
+            raise ValueError("Features were added or removed without add_features or remove_features, "
+                             "so their ids are unknown. Call track_changes again.")
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    '''
+    Applies a JSON merge patch (RFC 7396) to ``target``. Objects are merged
+    recursively, None removes a key and any other value replaces it.
+
+    :return: The patched value. ``target`` is not modified.
+    '''
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+def merge_diff(source: Dict[str, Any], target: Dict[str, Any]) -> Dict[str, Any]:
+    '''
+    Smallest JSON merge patch turning ``source`` into ``target``. Merge
+    patches cannot set a value to null, so None values in ``target`` are
+    treated as missing keys.
+
+    :return: Patch, empty when the objects are equal
+    '''
+    patch = {key: None for key in source if target.get(key) is None and source[key] is not None}
+    for key, value in target.items():
+        if value is None:
+            continue
+        old = source.get(key)
+        if isinstance(old, dict) and isinstance(value, dict):
+            nested = merge_diff(old, value)
+            if nested:
+                patch[key] = nested
+        elif type(old) is not type(value) or old != value:
+            patch[key] = value
+    return patch
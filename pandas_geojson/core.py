@@ -1,7 +1,17 @@
 from dataclasses import dataclass, field
+from numbers import Real
 from typing import List, Any, Dict, Union
 import pandas as pd
-import json
+from pandas_geojson.arrays import ColumnarFeatures, GeometryArray, _as_indices
+from pandas_geojson.changes import ChangeTracker, merge_patch
+from pandas_geojson.backend import dumps
+from pandas_geojson.index import PropertyIndex, STRtree
+from pandas_geojson.lazy import LazyFeatures
+from pandas_geojson import ops
+from pandas_geojson.profiling import Stats, current, stage
+from pandas_geojson.records import Feature, as_feature, property_values, property_columns as record_property_columns
+from pandas_geojson.validation import GeoJSONValidationError, validate_features, validate_geometries
+import numpy as np
 
 
 @dataclass
@@ -19,7 +29,7 @@ class Geometry:
             self.validate()
 
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps(self.to_dict(), indent=4)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -40,7 +50,7 @@ class Point(Geometry):
         super().__init__(geometry={'type': 'Point', 'coordinates': geometry}, properties=properties)
     
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps(self.to_dict(), indent=4)
     
 
     def validate(self):
@@ -62,7 +72,7 @@ class MultiPoint(Geometry):
         super().__init__(geometry={'type': 'MultiPoint', 'coordinates': geometry}, properties=properties)
 
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps(self.to_dict(), indent=4)
 
     def validate(self):
         if self.geometry:
@@ -81,7 +91,7 @@ class LineString(Geometry):
         super().__init__(geometry={'type': 'LineString', 'coordinates': geometry}, properties=properties)
 
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps(self.to_dict(), indent=4)
 
     def validate(self):
         if self.geometry:
@@ -100,7 +110,7 @@ class MultiLineString(Geometry):
         super().__init__(geometry={'type': 'MultiLineString', 'coordinates': geometry}, properties=properties)
 
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps(self.to_dict(), indent=4)
 
     def validate(self):
         if self.geometry:
@@ -119,7 +129,7 @@ class Polygon(Geometry):
         super().__init__(geometry={'type': 'Polygon', 'coordinates': geometry}, properties=properties)
 
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps(self.to_dict(), indent=4)
 
     def validate(self):
         if self.geometry:
@@ -138,7 +148,7 @@ class MultiPolygon(Geometry):
         super().__init__(geometry={'type': 'MultiPolygon', 'coordinates': geometry}, properties=properties)
 
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps(self.to_dict(), indent=4)
 
     def validate(self):
         if self.geometry:
@@ -157,9 +167,29 @@ class GeoJSON:
     '''
     type: str = 'FeatureCollection'
     features: List[Union[Point,MultiPoint,LineString,MultiLineString,Polygon,MultiPolygon]] = field(default_factory=list)
+    _spatial_index: STRtree = field(default=None, init=False, repr=False, compare=False)
+    _property_indexes: Dict[str, PropertyIndex] = field(default_factory=dict, init=False, repr=False, compare=False)
+    stats: Stats = field(default=None, init=False, repr=False, compare=False)
+    changes: ChangeTracker = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Collections created inside ``pandas_geojson.profile`` share its stage timings
+        self.stats = current()
+        # Features in a list are always stored as records
+        if isinstance(self.features, list) and any(type(feature) is not Feature for feature in self.features):
+            schemas = {}
+            self.features = [feature if type(feature) is Feature else
+                             Feature.from_dict(feature.to_dict() if isinstance(feature, Geometry) else feature, schemas)
+                             for feature in self.features]
 
     def __repr__(self):
-        return json.dumps(self.to_dict(), indent=4)
+        return dumps(self.to_dict(), indent=4)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == 'features':
+            # Indexes refer to features by position
+            self._invalidate_indexes()
     
     def __iter__(self):
         return iter(self.features)
@@ -174,70 +204,475 @@ class GeoJSON:
             if not isinstance(feature, (Point, MultiPoint, LineString, MultiLineString, Polygon, MultiPolygon)):
                 print(f"Invalid feature type: {type(feature)}")
                 raise ValueError("Each feature must be a geometry subclasses.")
-            instantiated_features.append(feature.to_dict())
+            instantiated_features.append(Feature.from_dict(feature.to_dict()))
         self.features.extend(instantiated_features)
+        if self.changes is not None:
+            self.changes.add(instantiated_features)
+        self._invalidate_indexes()
+
+    def remove_features(self, positions) -> None:
+        '''
+        Removes the features at ``positions``.
+
+        :param positions: Position, list of positions or boolean mask
+        '''
+        self._check_editable()
+        positions = _as_indices(positions, len(self.features))
+        if len(positions) and (positions.min() < 0 or positions.max() >= len(self.features)):
+            raise IndexError("Feature index out of range.")
+        keep = np.ones(len(self.features), dtype=bool)
+        keep[positions] = False
+        if self.columnar:
+            self.features = self.features.take(keep)
+        else:
+            if self.changes is not None:
+                self.changes.remove(positions.tolist(), self.features)
+            self.features = [feature for feature, kept in zip(self.features, keep.tolist()) if kept]
+        self._invalidate_indexes()
+
+    def update_properties(self, positions, properties: Dict[str, Any]) -> None:
+        '''
+        Updates the properties of the features at ``positions`` with a JSON
+        merge patch (RFC 7396): nested objects are merged, None removes a
+        property and any other value replaces it.
+
+        :param positions: Position, list of positions or boolean mask
+        :param properties: Merge patch applied to the properties of each feature
+        '''
+        self._check_editable()
+        if not isinstance(properties, dict):
+            raise ValueError("properties must be a dictionary.")
+        positions = np.unique(_as_indices(positions, len(self.features)))
+        for position in positions.tolist():
+            if self.columnar:
+                self.features.properties[position] = merge_patch(self.features.properties[position], properties)
+                continue
+            old = self.features[position]
+            new = Feature.from_dict({'geometry': old['geometry'], 'properties': merge_patch(old['properties'], properties)})
+            self.features[position] = new
+            if self.changes is not None:
+                self.changes.update(position, old, new, properties)
+        self._invalidate_indexes()
+
+    def track_changes(self) -> 'GeoJSON':
+        '''
+        Starts recording the features added, removed and updated through
+        ``add_features``, ``remove_features`` and ``update_properties``,
+        and caching the encoded JSON of every feature. ``save_geojson`` then
+        only encodes the features edited since the previous save, and
+        ``diff`` returns the edits. Calling it again starts over.
+
+        Features are numbered by position when tracking starts; the diffs
+        refer to them by these ids.
+
+        :return: The same GeoJSON object
+        '''
+        if not isinstance(self.features, list):
+            raise ValueError("Only collections stored as a list of features can track changes.")
+        schemas = {}
+        self.features = [Feature.from_dict(feature, schemas) for feature in self.features]
+        self.changes = ChangeTracker(self.features)
+        return self
+
+    def diff(self, format: str = 'merge-patch', clear: bool = False) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        '''
+        Edits made since ``track_changes``, or since the last ``diff`` with ``clear=True``.
+
+        The 'merge-patch' format is a JSON merge patch (RFC 7396) of the
+        collection seen as an object of feature id (as a string) to feature:
+        added features appear in full, updated features as a merge patch of
+        the feature and removed features as None. The 'log' format lists
+        every edit in order as ``{'op': 'add', 'id': ..., 'feature': ...}``,
+        ``{'op': 'update', 'id': ..., 'properties': patch}`` or
+        ``{'op': 'remove', 'id': ...}``.
+
+        :param format: 'merge-patch' or 'log'
+        :param clear: Forget the returned edits, so the next diff starts from here
+        :return: Merge patch dictionary, or list of log entries
+        '''
+        if self.changes is None:
+            raise ValueError("Changes are not tracked. Call track_changes first.")
+        diff = self.changes.diff(self.features, format)
+        if clear:
+            self.changes.clear()
+        return diff
+
+    def _check_editable(self):
+        if isinstance(self.features, LazyFeatures):
+            raise ValueError("Lazy collections are read-only.")
+
+    def _invalidate_indexes(self):
+        self._spatial_index = None
+        self._property_indexes = {}
 
 
     def get_properties(self) -> List[str]:
         properties = list(self.features[0]['properties'].keys()) if self.features else []
         return properties
 
+    @property
+    def columnar(self) -> bool:
+        '''
+        Whether features are backed by columnar coordinate arrays.
+        '''
+        return isinstance(self.features, ColumnarFeatures)
+
+    def to_columnar(self) -> 'GeoJSON':
+        '''
+        Returns a copy of the collection that stores coordinates in contiguous
+        NumPy arrays instead of nested lists. Features are still handed out as
+        dictionaries, built on demand.
+
+        Coordinates are stored as float64, as in GeoArrow, so integer
+        coordinates come back as floats.
+
+        :return: GeoJSON
+        '''
+        if self.columnar:
+            return GeoJSON(type=self.type, features=self.features.take(range(len(self.features))))
+        return GeoJSON(type=self.type, features=ColumnarFeatures.from_features(self.features))
+
     def to_dict(self) -> Dict[str, Any]:
+        '''
+        The collection as plain, mutable dictionaries, ready for ``json.dumps``
+        or ``pd.json_normalize``.
+
+        :return: GeoJSON dictionary
+        '''
         return {
             'type': self.type,
-            'features': self.features
+            'features': [feature.to_dict() if type(feature) is Feature else feature for feature in self.features]
         }
     
-    def to_dataframe(self) -> pd.DataFrame:
-        data = pd.json_normalize(self.to_dict(), record_path=['features'])
+    @stage('normalize')
+    def to_dataframe(self, geometry: bool = True, geometry_columns: bool = False, infer_dtypes: bool = False) -> pd.DataFrame:
+        '''
+        Converts the features to a DataFrame with ``type``, ``geometry.type`` and
+        ``geometry.coordinates`` columns and one ``properties.*`` column per
+        property key. Nested property objects are flattened into dotted names.
+
+        Columns are built directly from the features, without copying the
+        coordinate lists. Features without geometry get None in the geometry columns.
+
+        :param geometry: Set to False to leave out the ``geometry.type`` and ``geometry.coordinates`` columns
+        :param geometry_columns: Add numeric ``bbox_minx``, ``bbox_miny``, ``bbox_maxx``, ``bbox_maxy``,
+            ``centroid_x``, ``centroid_y`` and ``vertex_count`` columns
+        :param infer_dtypes: Store repeated strings as categoricals, and integers and booleans
+            with missing values as nullable ``Int64`` and ``boolean`` columns
+        :return: DataFrame
+        '''
+        n = len(self.features)
+        columns = {'type': ['Feature'] * n}
+        property_columns = None
+        if self.columnar:
+            geometries = self.features.geometries
+            properties = self.features.properties
+            if geometry:
+                columns['geometry.type'] = [geometries.geometry_type(i) for i in range(n)]
+                columns['geometry.coordinates'] = [geometries.coordinates(i) for i in range(n)]
+        else:
+            features = list(self.features)
+            # Records sharing one schema are transposed directly, without property dictionaries
+            property_columns = record_property_columns(features)
+            if property_columns is None:
+                properties = [feature.get('properties') or {} for feature in features]
+            if geometry and all(type(feature) is Feature for feature in features):
+                columns['geometry.type'] = [feature.geometry_type for feature in features]
+                columns['geometry.coordinates'] = [feature.coordinates for feature in features]
+            elif geometry:
+                shapes = [feature.get('geometry') for feature in features]
+                columns['geometry.type'] = [shape['type'] if shape is not None else None for shape in shapes]
+                columns['geometry.coordinates'] = [shape['coordinates'] if shape is not None else None for shape in shapes]
+
+        data = pd.DataFrame(columns)
+        if geometry_columns:
+            array = self._geometry_array()
+            bounds = array.bounds()
+            centroids = ops.centroids(array)
+            starts = array.ring_offsets[array.part_offsets[array.geometry_offsets]]
+            for i, name in enumerate(('bbox_minx', 'bbox_miny', 'bbox_maxx', 'bbox_maxy')):
+                data[name] = bounds[:, i]
+            data['centroid_x'] = centroids[:, 0]
+            data['centroid_y'] = centroids[:, 1]
+            data['vertex_count'] = np.diff(starts)
+
+        if property_columns is None:
+            property_columns = property_columns_from_dicts(properties, infer_dtypes=infer_dtypes)
+        elif infer_dtypes:
+            property_columns = {key: _infer_column(values) for key, values in property_columns.items()}
+        if property_columns:
+            data = pd.concat([data, pd.DataFrame(property_columns).add_prefix('properties.')], axis=1)
         return data
-    
+
+    def build_index(self, node_capacity: int = 16) -> STRtree:
+        '''
+        Builds an STR packed R-tree over the feature bounding boxes. The index
+        is kept on the object and used by ``query_bbox`` and ``query_point``.
+
+        :return: STRtree
+        '''
+        self._spatial_index = STRtree(self._geometry_array().bounds(), node_capacity=node_capacity)
+        return self._spatial_index
+
+    def query_bbox(self, minx: float, miny: float, maxx: float, maxy: float) -> 'GeoJSON':
+        '''
+        Selects the features whose bounding box intersects the given box.
+        The spatial index is built on first use.
+
+        :return: GeoJSON
+        '''
+        if self._spatial_index is None or self._spatial_index.size != len(self.features):
+            self.build_index()
+        return self._take(self._spatial_index.query(minx, miny, maxx, maxy))
+
+    def query_point(self, x: float, y: float) -> 'GeoJSON':
+        '''
+        Selects the features whose bounding box contains the given point.
+
+        :return: GeoJSON
+        '''
+        return self.query_bbox(x, y, x, y)
+
+    def bounds(self) -> np.ndarray:
+        '''
+        Bounding box of every feature as ``(minx, miny, maxx, maxy)`` rows,
+        NaN for features without geometry.
+
+        :return: Array aligned with ``features``
+        '''
+        return self._geometry_array().bounds()
+
+    def area(self, geodesic: bool = False) -> np.ndarray:
+        '''
+        Area of every feature, with holes subtracted. Points and lines have no area.
+
+        :param geodesic: Return square metres on a spherical Earth instead of squared degrees
+        :return: Array aligned with ``features``
+        '''
+        return ops.areas(self._geometry_array(), geodesic=geodesic)
+
+    def length(self, geodesic: bool = False) -> np.ndarray:
+        '''
+        Length of every line feature, or perimeter of every polygon feature.
+
+        :param geodesic: Return metres along great circles instead of degrees
+        :return: Array aligned with ``features``
+        '''
+        return ops.lengths(self._geometry_array(), geodesic=geodesic)
+
+    def centroid(self) -> np.ndarray:
+        '''
+        Centroid of every feature as ``(x, y)`` rows, NaN for features without geometry.
+
+        :return: Array aligned with ``features``
+        '''
+        return ops.centroids(self._geometry_array())
+
+    def sjoin(self, other: 'GeoJSON', predicate: str = 'within', workers: int = None, chunk_size: int = 100000) -> pd.DataFrame:
+        '''
+        Joins the Point and MultiPoint features of this collection to the
+        Polygon and MultiPolygon features of ``other`` that contain them.
+        See ``pandas_geojson.join.sjoin``.
+
+        :param predicate: 'within', or 'intersects' to also match points on polygon boundaries
+        :param workers: Number of processes to use, None to run in this process
+        :return: DataFrame with ``index_left``, ``index_right`` and the properties of both features
+        '''
+        from pandas_geojson.join import sjoin
+        return sjoin(self, other, predicate=predicate, workers=workers, chunk_size=chunk_size)
+
+    def simplify(self, tolerance: float, preserve_topology: bool = True) -> 'GeoJSON':
+        '''
+        Simplifies line and polygon geometries with the Douglas-Peucker algorithm,
+        run over the coordinate arrays of all features at once.
+
+        :param tolerance: Maximum deviation, in coordinate units
+        :param preserve_topology: Never reduce a polygon ring below four positions.
+            When False, collapsed rings are dropped and features left empty get a null geometry.
+        :return: GeoJSON
+        '''
+        return self._with_geometry_array(ops.simplify(self._geometry_array(), tolerance, preserve_topology))
+
+    def round_coordinates(self, precision: int) -> 'GeoJSON':
+        '''
+        Rounds every coordinate to ``precision`` decimal places.
+
+        :raises TypeError: Naming the first feature whose coordinates are not nested lists of numbers
+        :return: GeoJSON
+        '''
+        if self.columnar:
+            return self._with_geometry_array(ops.round_coordinates(self.features.geometries, precision))
+        features = []
+        for i, feature in enumerate(self.features):
+            geometry = feature['geometry']
+            if geometry is not None:
+                try:
+                    coordinates = round_coordinates(geometry['coordinates'], precision)
+                except TypeError as e:
+                    raise TypeError(f"Feature {i}: {e}") from None
+                geometry = {'type': geometry['type'], 'coordinates': coordinates}
+            features.append(as_feature(feature, geometry))
+        return GeoJSON(type=self.type, features=features)
+
+    def to_topojson(self, quantization: int = 100000, object_name: str = 'collection') -> Dict[str, Any]:
+        '''
+        Converts the GeoJSON object to a TopoJSON topology, storing borders
+        shared by neighbouring features once. See ``pandas_geojson.topojson.to_topojson``.
+
+        :return: TopoJSON dictionary
+        '''
+        from pandas_geojson.topojson import to_topojson
+        return to_topojson(self, quantization=quantization, object_name=object_name)
+
+    def to_vector_tile(self,
+                       z: int,
+                       x: int,
+                       y: int,
+                       layer_name: str = 'features',
+                       extent: int = 4096,
+                       buffer: int = 64,
+                       tolerance: float = 3.0) -> bytes:
+        '''
+        Encodes the features touching Web Mercator tile ``z/x/y`` as a Mapbox
+        Vector Tile, clipped and simplified for the tile. To serve many tiles
+        use ``pandas_geojson.tiles.TileSet``, which projects and indexes the
+        collection once and caches the tiles.
+
+        :return: Tile protobuf bytes
+        '''
+        from pandas_geojson.tiles import TileSet
+        tiles = TileSet(self, layer_name=layer_name, extent=extent, buffer=buffer, tolerance=tolerance, cache_size=0)
+        return tiles.get(z, x, y)
+
+    def to_parquet(self, path: str, row_group_size: int = 10000, compression: str = 'snappy'):
+        '''
+        Saves the GeoJSON object as GeoParquet. See ``pandas_geojson.arrow.to_parquet``.
+        '''
+        from pandas_geojson.arrow import to_parquet
+        to_parquet(self, path, row_group_size=row_group_size, compression=compression)
+
+    def to_feather(self, path: str, compression: str = 'uncompressed'):
+        '''
+        Saves the GeoJSON object as an Arrow IPC (Feather) file. See ``pandas_geojson.arrow.to_feather``.
+        '''
+        from pandas_geojson.arrow import to_feather
+        to_feather(self, path, compression=compression)
+
+    def _with_geometry_array(self, geometries: GeometryArray) -> 'GeoJSON':
+        if self.columnar:
+            return GeoJSON(type=self.type, features=ColumnarFeatures(geometries, list(self.features.properties)))
+        features = [as_feature(feature, geometry) for geometry, feature in zip(geometries, self.features)]
+        return GeoJSON(type=self.type, features=features)
+
+    def _geometry_array(self) -> GeometryArray:
+        if self.columnar:
+            return self.features.geometries
+        return GeometryArray.from_geometries(feature['geometry'] for feature in self.features)
+
+    def _take(self, positions) -> 'GeoJSON':
+        if self.columnar:
+            return GeoJSON(type='FeatureCollection', features=self.features.take(positions))
+        return GeoJSON(type='FeatureCollection', features=[self.features[i] for i in np.asarray(positions).tolist()])
+
+    @stage('filter')
     def filter_geojson(self, property_values: List[str], property_key: str) -> 'GeoJSON':
         '''
         Filters GeoJSON features based on values in properties object.
 
+        An index of ``property_key`` is built on the first call and reused by
+        later calls, so repeated filters on the same key only touch the matches.
+
         :return: GeoJSON
         '''
-        # for feature in self.features:
-        #     print(feature)
+        return self._take(self.property_index(property_key).lookup(property_values))
 
-        filtered_features = []
-        for feature in self.features:
-            if feature['properties'].get(property_key) in property_values:
-                filtered_features.append(feature)  
-        return GeoJSON(type='FeatureCollection', features=filtered_features)
+    def filter_many(self, value_groups: Union[List[List[Any]], Dict[Any, List[Any]]], property_key: str) -> Union[List['GeoJSON'], Dict[Any, 'GeoJSON']]:
+        '''
+        Filters GeoJSON features for several groups of property values at once.
+
+        :param value_groups: List of value lists, or a dictionary of named value lists
+        :return: List or dictionary of GeoJSON, matching ``value_groups``
+        '''
+        index = self.property_index(property_key)
+        if isinstance(value_groups, dict):
+            return {name: self._take(index.lookup(values)) for name, values in value_groups.items()}
+        return [self._take(index.lookup(values)) for values in value_groups]
+
+    def property_index(self, property_key: str) -> PropertyIndex:
+        '''
+        Returns the cached index of ``property_key``, building it if needed.
+        Indexes are rebuilt after edits through the GeoJSON methods, after
+        ``features`` is replaced and when features are added or removed, but
+        not when a feature is replaced in place in ``features``.
+
+        :return: PropertyIndex
+        '''
+        index = self._property_indexes.get(property_key)
+        if index is None or index.size != len(self.features):
+            if self.columnar:
+                index = PropertyIndex(self.features.properties, property_key)
+            else:
+                index = PropertyIndex.from_values(property_values(self.features, property_key), property_key)
+            self._property_indexes[property_key] = index
+        return index
 
-    
     @classmethod
-    def from_dict(self, data):
-        features = []
-        for feature_data in data['features']:
-            properties = feature_data.get('properties', {})
-            geometry_data = feature_data['geometry']
+    def from_dict(self, data, columnar: bool = False, validate: str = 'structure'):
+        '''
+        Builds a GeoJSON object from a FeatureCollection dictionary.
 
-            if geometry_data is None:
-                # Skip this feature if geometry data is missing
-                continue
+        :param columnar: Store coordinates in contiguous float64 NumPy arrays, see ``to_columnar``.
+            Integer coordinates are converted to floats, so ``to_dict`` returns ``1.0`` for ``1``.
+        :param validate: Validation level, one of 'none', 'structure' or 'full'.
+            All features are checked in one batch and every invalid one is reported.
+        :return: GeoJSON
+        '''
+        feature_list = data['features']
+        with stage('validate'):
+            errors = validate_geometries((feature_data['geometry'] for feature_data in feature_list), level=validate)
+        if errors:
+            raise GeoJSONValidationError(errors)
+
+        with stage('build'):
+            # Skip features with missing geometry data
+            feature_list = [feature_data for feature_data in feature_list if feature_data['geometry'] is not None]
+            if columnar:
+                features = ColumnarFeatures.from_features(feature_list)
+            else:
+                schemas = {}
+                features = [Feature.from_dict(feature_data, schemas) for feature_data in feature_list]
+        return self(type='Feature Collection', features=features)
+
+    @classmethod
+    def open_lazy(cls, filename: str, cache_size: int = 1024, validate: str = 'structure', engine: str = None) -> 'GeoJSON':
+        '''
+        Opens a GeoJSON file without parsing it. The file is memory-mapped,
+        one structural scan records where each feature starts and ends, and
+        features are decoded on access with an LRU cache of ``cache_size``
+        features. The collection is read-only.
 
-            geometry_type = geometry_data['type']
-            geometry_coordinates = geometry_data['coordinates']
+        :return: GeoJSON backed by LazyFeatures
+        '''
+        return cls(type='FeatureCollection', features=LazyFeatures(filename, cache_size=cache_size, validate=validate, engine=engine))
 
-            geometry_class = {
-                "Point": Point,
-                "MultiPoint": MultiPoint,
-                "LineString": LineString,
-                "MultiLineString": MultiLineString,
-                "Polygon": Polygon,
-                "MultiPolygon": MultiPolygon
-            }.get(geometry_type)
+    @classmethod
+    def from_seq(cls, filename: str, validate: str = 'structure', engine: str = None):
+        '''
+        Opens a newline-delimited GeoJSON file for random access. Features
+        are parsed only when selected with ``take`` or ``range``.
 
-            if geometry_class is None:
-                raise ValueError(f"Invalid geometry type: {geometry_type}")
-                
-            geometry_instance = geometry_class(geometry=geometry_coordinates, properties=properties)
-            features.append(geometry_instance.to_dict())
+        :return: GeoJSONSeq
+        '''
+        from pandas_geojson.seq import GeoJSONSeq
+        return GeoJSONSeq(filename, validate=validate, engine=engine)
 
-        return self(type='Feature Collection', features=features)
+    def validate(self, level: str = 'full'):
+        '''
+        Validates every feature of the collection in one batch.
+
+        :raises GeoJSONValidationError: Listing every invalid feature
+        '''
+        validate_features(self.features, level=level)
     
     @classmethod
     def from_dataframe(cls,
@@ -246,21 +681,140 @@ class GeoJSON:
                     coordinate_col: str = 'geometry.coordinates',
                     property_col_list: List[str] = []):
         
-        geojson = cls(type='FeatureCollection')
+        with stage('build'):
+            geometry_types, coordinates, schema, rows = _dataframe_columns(df, geometry_type_col, coordinate_col, property_col_list)
+            features = [Feature(geometry_type, coords, schema, row)
+                        for geometry_type, coords, row in zip(geometry_types, coordinates, rows)]
+        return cls(type='FeatureCollection', features=features)
 
-        for _, row in df.iterrows():
-            coordinates = row[coordinate_col]
-            geometry = {'type': row[geometry_type_col], 'coordinates': coordinates}
-            properties = {col: row[col] for col in property_col_list}
-            # Construct the feature directly as a dictionary
-            feature = {
-                'type': 'Feature',
-                'geometry': geometry,
-                'properties': properties
-            }
-            geojson.features.append(feature)
 
-        return geojson
+GEOMETRY_CLASSES = {
+    "Point": Point,
+    "MultiPoint": MultiPoint,
+    "LineString": LineString,
+    "MultiLineString": MultiLineString,
+    "Polygon": Polygon,
+    "MultiPolygon": MultiPolygon
+}
 
 
-    
+def feature_from_dict(feature_data: Dict[str, Any]) -> Union[Dict[str, Any], None]:
+    '''
+    Validates a single feature dictionary with its geometry class.
+
+    :return: Feature dictionary, or None if the feature has no geometry
+    '''
+    properties = feature_data.get('properties', {})
+    geometry_data = feature_data['geometry']
+
+    if geometry_data is None:
+        return None
+
+    geometry_type = geometry_data['type']
+    geometry_coordinates = geometry_data['coordinates']
+
+    geometry_class = GEOMETRY_CLASSES.get(geometry_type)
+
+    if geometry_class is None:
+        raise ValueError(f"Invalid geometry type: {geometry_type}")
+
+    geometry_instance = geometry_class(geometry=geometry_coordinates, properties=properties)
+    return geometry_instance.to_dict()
+
+
+def features_from_dataframe(df: pd.DataFrame,
+                            geometry_type_col: str = 'geometry.type',
+                            coordinate_col: str = 'geometry.coordinates',
+                            property_col_list: List[str] = []) -> List[Dict[str, Any]]:
+    '''
+    Builds feature dictionaries column by column from a DataFrame.
+
+    Missing property values become None and NumPy scalars are converted to
+    Python types, so the features serialize to JSON directly.
+
+    :return: List of feature dictionaries
+    '''
+    geometry_types, coordinates, schema, rows = _dataframe_columns(df, geometry_type_col, coordinate_col, property_col_list)
+    return [
+        {
+            'type': 'Feature',
+            'geometry': {'type': geometry_type, 'coordinates': coords},
+            'properties': dict(zip(schema, row))
+        }
+        for geometry_type, coords, row in zip(geometry_types, coordinates, rows)
+    ]
+
+
+def _dataframe_columns(df: pd.DataFrame, geometry_type_col: str, coordinate_col: str, property_col_list: List[str]):
+    geometry_types = df[geometry_type_col].tolist()
+    coordinates = df[coordinate_col].tolist()
+    schema = tuple(property_col_list)
+    if schema:
+        properties = df[list(schema)].astype(object)
+        rows = properties.where(properties.notna(), None).itertuples(index=False, name=None)
+    else:
+        rows = [()] * len(df)
+    return geometry_types, coordinates, schema, rows
+
+
+def property_columns_from_dicts(properties: List[Dict[str, Any]], infer_dtypes: bool = False) -> Dict[str, Any]:
+    '''
+    Builds one column per property key, in order of first appearance.
+    Nested objects are flattened into dotted keys like ``pd.json_normalize``
+    and missing values become NaN.
+
+    :param infer_dtypes: See ``GeoJSON.to_dataframe``
+    :return: Dictionary of column name to list or pandas array
+    '''
+    records = [_flatten_properties(props) if any(type(value) is dict for value in props.values()) else props
+               for props in properties]
+    keys = {}
+    for record in records:
+        for key in record:
+            keys.setdefault(key)
+    columns = {key: [record.get(key, np.nan) for record in records] for key in keys}
+    if infer_dtypes:
+        columns = {key: _infer_column(values) for key, values in columns.items()}
+    return columns
+
+
+def _flatten_properties(properties: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    flat = {}
+    for key, value in properties.items():
+        if type(value) is dict:
+            flat.update(_flatten_properties(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _infer_column(values: List[Any]) -> Any:
+    present = [value for value in values if not _is_missing(value)]
+    types = {type(value) for value in present}
+    missing = len(present) < len(values)
+    if types == {bool}:
+        return pd.array([None if _is_missing(value) else value for value in values], dtype='boolean') if missing else values
+    if types == {int}:
+        return pd.array([None if _is_missing(value) else value for value in values], dtype='Int64') if missing else values
+    if types == {str} and len(set(present)) <= len(present) // 2:
+        return pd.Categorical([None if _is_missing(value) else value for value in values])
+    return values
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (type(value) is float and value != value)
+
+
+def round_coordinates(coordinates: Any, precision: int) -> Any:
+    '''
+    Rounds nested coordinate lists to ``precision`` decimal places.
+
+    :raises TypeError: If the coordinates are not nested lists of numbers, such as
+        coordinates read as text from a CSV file
+    '''
+    if not isinstance(coordinates, (list, tuple, np.ndarray)):
+        raise TypeError(f"Coordinates must be nested lists of numbers, not {type(coordinates).__name__}. "
+                        "Parse coordinates stored as text with json.loads first.")
+    if len(coordinates) and isinstance(coordinates[0], Real):
+        return [round(coord, precision) for coord in coordinates]
+    return [round_coordinates(coords, precision) for coords in coordinates]
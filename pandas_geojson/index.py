@@ -0,0 +1,167 @@
+from typing import Any, Dict, Iterable, Tuple
+import numpy as np
+from pandas_geojson.arrays import expand_ranges
+
+
+class STRtree:
+    '''
+    Sort-Tile-Recursive packed R-tree over bounding boxes.
+
+    The tree is bulk loaded once and stored level by level as NumPy arrays, so
+    queries descend one level at a time with vectorized box tests instead of
+    visiting nodes one by one.
+
+    :param bounds: ``(n, 4)`` array of ``(minx, miny, maxx, maxy)`` rows. Rows containing NaN are not indexed.
+    :param node_capacity: Maximum number of children per node
+    '''
+    def __init__(self, bounds, node_capacity: int = 16):
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2.")
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        self.node_capacity = node_capacity
+        self.size = len(bounds)
+
+        items = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+        items = items[_str_order(bounds[items], node_capacity)]
+        self.items = items
+        self.item_bounds = bounds[items]
+
+        # Levels are stored bottom-up as (node bounds, first child, child count)
+        self.levels = []
+        level_bounds = self.item_bounds
+        while len(level_bounds):
+            starts = np.arange(0, len(level_bounds), node_capacity)
+            counts = np.minimum(node_capacity, len(level_bounds) - starts)
+            node_bounds = np.hstack([
+                np.minimum.reduceat(level_bounds[:, :2], starts, axis=0),
+                np.maximum.reduceat(level_bounds[:, 2:], starts, axis=0),
+            ])
+            if len(node_bounds) > 1:
+                order = _str_order(node_bounds, node_capacity)
+                node_bounds, starts, counts = node_bounds[order], starts[order], counts[order]
+            self.levels.append((node_bounds, starts, counts))
+            if len(node_bounds) == 1:
+                break
+            level_bounds = node_bounds
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def query(self, minx: float, miny: float, maxx: float, maxy: float) -> np.ndarray:
+        '''
+        Finds the items whose bounding box intersects the query box.
+
+        :return: Sorted array of item positions
+        '''
+        if not self.levels:
+            return np.empty(0, dtype=np.intp)
+        nodes = np.arange(len(self.levels[-1][0]))
+        for node_bounds, starts, counts in reversed(self.levels):
+            hits = nodes[_intersects(node_bounds[nodes], minx, miny, maxx, maxy)]
+            nodes = expand_ranges(starts[hits], counts[hits])
+        hits = nodes[_intersects(self.item_bounds[nodes], minx, miny, maxx, maxy)]
+        return np.sort(self.items[hits])
+
+    def query_many(self, bounds) -> Tuple[np.ndarray, np.ndarray]:
+        '''
+        Runs many box queries at once, descending the tree with every
+        (query, node) pair of a level in one vectorized test.
+
+        :param bounds: ``(n, 4)`` array of query boxes
+        :return: Arrays of query positions and matching item positions, sorted by query then item
+        '''
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        if not self.levels or not len(bounds):
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        n_top = len(self.levels[-1][0])
+        queries = np.repeat(np.arange(len(bounds)), n_top)
+        nodes = np.tile(np.arange(n_top), len(bounds))
+        for node_bounds, starts, counts in reversed(self.levels):
+            hits = _intersects_pairs(node_bounds[nodes], bounds[queries])
+            queries, nodes = queries[hits], nodes[hits]
+            queries = np.repeat(queries, counts[nodes])
+            nodes = expand_ranges(starts[nodes], counts[nodes])
+        hits = _intersects_pairs(self.item_bounds[nodes], bounds[queries])
+        queries, items = queries[hits], self.items[nodes[hits]]
+        order = np.lexsort((items, queries))
+        return queries[order], items[order]
+
+
+def _intersects(bounds: np.ndarray, minx: float, miny: float, maxx: float, maxy: float) -> np.ndarray:
+    return (bounds[:, 0] <= maxx) & (bounds[:, 2] >= minx) & (bounds[:, 1] <= maxy) & (bounds[:, 3] >= miny)
+
+
+def _intersects_pairs(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (a[:, 0] <= b[:, 2]) & (a[:, 2] >= b[:, 0]) & (a[:, 1] <= b[:, 3]) & (a[:, 3] >= b[:, 1])
+
+
+def _str_order(bounds: np.ndarray, node_capacity: int) -> np.ndarray:
+    '''
+    Orders boxes into vertical slices by x center, then by y center within each slice.
+    '''
+    n = len(bounds)
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    n_nodes = -(-n // node_capacity)
+    slice_size = int(np.ceil(np.sqrt(n_nodes))) * node_capacity
+    center_x = bounds[:, 0] + bounds[:, 2]
+    center_y = bounds[:, 1] + bounds[:, 3]
+    by_x = np.argsort(center_x, kind='stable')
+    slices = np.arange(n) // slice_size
+    return by_x[np.lexsort((center_y[by_x], slices))]
+
+
+class PropertyIndex:
+    '''
+    Inverted index from the values of one property to feature positions.
+
+    :param properties: Property dictionaries in feature order
+    :param property_key: Property to index. Features without it are indexed under None.
+    '''
+    def __init__(self, properties: Iterable[Dict[str, Any]], property_key: str):
+        self._build(((props or {}).get(property_key) for props in properties), property_key)
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any], property_key: str) -> 'PropertyIndex':
+        '''
+        Builds the index from the values of ``property_key`` in feature order.
+
+        :return: PropertyIndex
+        '''
+        index = cls.__new__(cls)
+        index._build(values, property_key)
+        return index
+
+    def _build(self, values: Iterable[Any], property_key: str):
+        self.property_key = property_key
+        self.positions = {}
+        self.unhashable = []
+        size = 0
+        for position, value in enumerate(values):
+            try:
+                self.positions.setdefault(value, []).append(position)
+            except TypeError:
+                # Lists and dicts cannot be hashed, keep them aside for equality checks
+                self.unhashable.append((position, value))
+            size += 1
+        self.size = size
+
+    def lookup(self, values: Iterable[Any]) -> np.ndarray:
+        '''
+        Positions of the features whose value is in ``values``.
+
+        :return: Sorted array of feature positions
+        '''
+        keys = set()
+        others = []
+        for value in values:
+            try:
+                keys.add(value)
+            except TypeError:
+                others.append(value)
+        matches = [self.positions[key] for key in keys if key in self.positions]
+        if self.unhashable:
+            matches.append([position for position, value in self.unhashable if value in others])
+        if not matches:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(matches).astype(np.intp))
@@ -1,19 +1,586 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from glob import glob
+import gzip
+from io import TextIOWrapper
+from itertools import islice, repeat
 from pandas import DataFrame
-from pandas_geojson.core import GeoJSON
+from pandas_geojson.arrays import ColumnarFeatures, GeometryArray
+from pandas_geojson.backend import dump, dumps, load, loader
+from pandas_geojson.scan import JSONStructure, feature_spans, find_features, member_spans, object_members, parse_numbers
+from pandas_geojson.seq import GeoJSONSeq, RECORD_SEPARATOR, index_path
+from pandas_geojson.profiling import stage
+from pandas_geojson.records import Feature
+from pandas_geojson.core import GeoJSON, Geometry, feature_from_dict, features_from_dataframe, round_coordinates
+from pandas_geojson.validation import VALIDATION_LEVELS, GeoJSONValidationError, validate_geometries
 import json
+import mmap
+import numpy as np
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 from urllib.request import urlopen
 
 
-def save_geojson(geojson: GeoJSON, filename: str, indent=None):
+@stage('write')
+def save_geojson(geojson: GeoJSON, filename: str, indent=None, engine: str = None, precision: int = None):
+    '''
+    Saves a GeoJSON object to a file.
+
+    Collections tracking changes (see ``GeoJSON.track_changes``) only encode
+    the features edited since the previous save when ``indent`` and
+    ``precision`` are not set.
+
+    :param engine: JSON engine to use, see ``set_json_engine``
+    :param precision: Round coordinates to this many decimal places
+    '''
+    if precision is not None:
+        geojson = geojson.round_coordinates(precision)
+    if geojson.changes is not None and indent is None:
+        # Reuses the JSON of the features that were not edited since the last save
+        fragments = geojson.changes.encode(geojson.features, engine=engine)
+        with open(filename, 'w', encoding='utf8') as f:
+            # Same separators as dumps, so the file matches an untracked save
+            f.write('{"type":' + dumps(geojson.type, engine=engine) + ',"features":[')
+            for start in range(0, len(fragments), 10000):
+                if start:
+                    f.write(',')
+                f.write(','.join(fragments[start:start + 10000]))
+            f.write(']}')
+        return
+    if geojson.columnar and indent is None:
+        # Encode one feature at a time instead of expanding the whole collection
+        with GeoJSONWriter(filename, compression=None, engine=engine, collection_type=geojson.type) as writer:
+            writer.write_geojson(geojson)
+        return
     with open(filename, 'w', encoding='utf8') as f:
-        json.dump(geojson.to_dict(), f, indent=indent)
+        dump(geojson.to_dict(), f, indent=indent, engine=engine)
 
-def read_geojson(file_path: str) -> GeoJSON:
-    with open(file_path) as response:
-        geo_json_data = json.load(response)
-    return GeoJSON.from_dict(geo_json_data)
+def read_geojson(file_path: str,
+                 chunksize: int = None,
+                 columnar: bool = False,
+                 engine: str = None,
+                 validate: str = 'structure',
+                 properties: List[str] = None,
+                 where: Union[Dict[str, Any], Callable[[Dict[str, Any]], bool]] = None,
+                 bbox: Tuple[float, float, float, float] = None,
+                 geometry: bool = True) -> Union[GeoJSON, Iterator[DataFrame]]:
+    '''
+    Reads a GeoJSON file.
+
+    ``properties``, ``where``, ``bbox`` and ``geometry`` are applied while
+    parsing: the file is memory-mapped and the members of every feature are
+    located without decoding them. Only the properties listed in
+    ``properties`` or tested by a ``where`` dictionary are decoded, the other
+    properties of kept features are never built, and the geometry of features
+    rejected by ``where`` or ``bbox`` is never decoded. A ``where`` function
+    needs whole property objects, so they are decoded for every feature.
+
+    :param chunksize: Return an iterator of DataFrames with up to ``chunksize`` rows each,
+        with the same columns as ``GeoJSON.to_dataframe``, instead of a GeoJSON object.
+        Cannot be combined with ``columnar`` or ``engine``.
+    :param columnar: Store coordinates in contiguous float64 NumPy arrays (see ``GeoJSON.to_columnar``),
+        which turns integer coordinates into floats.
+        The file is streamed so the nested coordinate lists never exist all at once,
+        unless ``engine`` is given.
+    :param engine: JSON engine to use, see ``set_json_engine``. Streaming reads use the
+        standard library, so with ``columnar`` and an engine the file is parsed at once.
+    :param validate: Validation level for ``GeoJSON.from_dict``, one of 'none', 'structure' or 'full'.
+        Streamed reads validate each batch of features as it is parsed.
+    :param properties: Property keys to keep, all by default
+    :param where: Dictionary of property key to accepted value (or list of accepted values),
+        or a function taking the properties of a feature and returning whether to keep it
+    :param bbox: ``(minx, miny, maxx, maxy)``. Only features whose bounds intersect it are kept.
+    :param geometry: Set to False to skip decoding coordinates. Features get a null geometry.
+    :return: GeoJSON, or an iterator of DataFrames when ``chunksize`` is given
+    '''
+    if properties is not None or where is not None or bbox is not None or not geometry:
+        if chunksize is not None:
+            raise ValueError("chunksize cannot be combined with properties, where, bbox or geometry.")
+        with stage('parse'):
+            features = _read_pushdown(file_path, properties, where, bbox, geometry, validate, engine)
+        if columnar:
+            with stage('build'):
+                features = ColumnarFeatures.from_features(features)
+        return GeoJSON(type='FeatureCollection', features=features)
+    if chunksize is not None:
+        if columnar or engine is not None:
+            raise ValueError("chunksize cannot be combined with columnar or engine.")
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive integer.")
+        if validate not in VALIDATION_LEVELS:
+            raise ValueError(f"Invalid validation level: {validate}. Must be one of {', '.join(VALIDATION_LEVELS)}.")
+        return _read_geojson_chunks(file_path, chunksize, validate)
+    if columnar and engine is None:
+        with stage('parse'):
+            chunks = [_from_chunk(chunk, offset, validate, columnar=True).features
+                      for offset, chunk in _raw_chunks(file_path, 10000)]
+        return GeoJSON(type='Feature Collection', features=ColumnarFeatures.concat(chunks))
+    with stage('parse'):
+        with open(file_path, 'rb') as response:
+            geo_json_data = load(response, engine=engine)
+    return GeoJSON.from_dict(geo_json_data, columnar=columnar, validate=validate)
+
+def _read_pushdown(file_path: str,
+                   properties: List[str],
+                   where: Union[Dict[str, Any], Callable[[Dict[str, Any]], bool]],
+                   bbox: Tuple[float, float, float, float],
+                   geometry: bool,
+                   validate: str,
+                   engine: str) -> List[Feature]:
+    '''
+    Reads the features of a GeoJSON file, decoding only the properties
+    needed by the projection and filters, and geometries only for the
+    features kept by the filters. Features without geometry are skipped,
+    as in ``GeoJSON.from_dict``.
+    '''
+    conditions = None
+    if isinstance(where, dict):
+        conditions = {key: set(value) if isinstance(value, (list, tuple, set)) else {value}
+                      for key, value in where.items()}
+    elif where is not None and not callable(where):
+        raise ValueError("where must be a dictionary of property values or a function.")
+
+    with open(file_path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        array_start = find_features(buffer)
+        structure = JSONStructure(buffer, array_start)
+        starts, ends = feature_spans(buffer, array_start, structure)
+        spans = object_members(buffer, starts, ends, structure, ['geometry', 'properties', 'bbox'])
+        decode = loader(engine)
+        # Properties located one by one, or None to decode whole property objects
+        needed = None
+        if not callable(where):
+            needed = list(dict.fromkeys(list(properties or []) + list(conditions or [])))
+            if not all(key.isascii() and '\\' not in json.dumps(key) for key in needed):
+                # Such names may be written with escape sequences, which object_members cannot match
+                needed = None
+        members = None
+        if needed:
+            members = {key: (key_starts.tolist(), key_ends.tolist())
+                       for key, (key_starts, key_ends) in _property_members(buffer, spans['properties'], structure, needed).items()}
+        features = []
+        geometries = []
+        # Position in the file of each decoded geometry, for the validation errors
+        sources = []
+        schemas = {}
+        for source, (geometry_start, geometry_end, property_start, property_end, bbox_start, bbox_end) in enumerate(zip(
+                *(array.tolist() for name in ('geometry', 'properties', 'bbox') for array in spans[name]))):
+            if geometry_start < 0 or buffer[geometry_start:geometry_end] == b'null':
+                continue
+
+            if needed is None:
+                props = (decode(buffer[property_start:property_end]) or {}) if property_start >= 0 else {}
+            elif members is None:
+                props = {}
+            else:
+                props = {key: decode(buffer[key_starts[source]:key_ends[source]])
+                         for key, (key_starts, key_ends) in members.items() if key_starts[source] >= 0}
+            if conditions is not None:
+                if not all(_matches(props.get(key), accepted) for key, accepted in conditions.items()):
+                    continue
+            elif where is not None and not where(props):
+                continue
+
+            if bbox is not None:
+                # A bbox member, when the writer stored one, saves parsing the coordinates
+                bounds_span = (bbox_start, bbox_end)
+                if bbox_start < 0:
+                    bounds_span = member_spans(buffer, geometry_start, geometry_end, structure).get('coordinates')
+                if not _intersects_bbox(buffer, bounds_span, bbox):
+                    continue
+
+            if properties is not None:
+                props = {key: props[key] for key in properties if key in props}
+            elif needed is not None:
+                # Only the where keys were decoded, the feature keeps all its properties
+                props = (decode(buffer[property_start:property_end]) or {}) if property_start >= 0 else {}
+            shape = None
+            if geometry:
+                shape = decode(buffer[geometry_start:geometry_end])
+                geometries.append(shape)
+                sources.append(source)
+            features.append(Feature.from_dict({'geometry': shape, 'properties': props}, schemas))
+    finally:
+        buffer.close()
+
+    with stage('validate'):
+        errors = validate_geometries(geometries, level=validate) if geometry else []
+    if errors:
+        raise GeoJSONValidationError([(sources[index], message) for index, message in errors])
+    return features
+
+def _property_members(buffer, spans: Tuple[np.ndarray, np.ndarray], structure, keys: List[str]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    '''
+    Spans of the properties ``keys`` of every feature, -1 where the feature
+    has no such property or its properties are not an object.
+    '''
+    starts, ends = spans
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    try:
+        objects = np.flatnonzero(starts >= 0)
+        objects = objects[data[starts[objects]] == ord('{')]
+    finally:
+        del data
+    found = object_members(buffer, starts[objects], ends[objects], structure, keys, level=2)
+    members = {}
+    for key, (key_starts, key_ends) in found.items():
+        members[key] = (np.full(len(starts), -1, dtype=np.int64), np.full(len(starts), -1, dtype=np.int64))
+        members[key][0][objects] = key_starts
+        members[key][1][objects] = key_ends
+    return members
+
+def _matches(value: Any, accepted: set) -> bool:
+    try:
+        return value in accepted
+    except TypeError:
+        return any(value == other for other in accepted)
+
+def _intersects_bbox(buffer, span: Tuple[int, int], bbox: Tuple[float, float, float, float]) -> bool:
+    if span is None:
+        return False
+    numbers = parse_numbers(buffer, *span)
+    if len(numbers) < 2:
+        return False
+    x, y = numbers[0::2], numbers[1::2]
+    minx, miny, maxx, maxy = bbox
+    return x.min() <= maxx and x.max() >= minx and y.min() <= maxy and y.max() >= miny
+
+def _read_geojson_chunks(file_path: str, chunksize: int, validate: str) -> Iterator[DataFrame]:
+    for offset, chunk in _raw_chunks(file_path, chunksize):
+        yield _from_chunk(chunk, offset, validate).to_dataframe()
 
-def read_geojson_url(url: str) -> GeoJSON:
+def _raw_chunks(file_path: str, chunk_size: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    '''
+    Streams the feature dictionaries of a file in lists of up to ``chunk_size``,
+    unvalidated and including features without geometry, with the position
+    of the first feature of each list.
+    '''
+    with open(file_path, encoding='utf8') as f:
+        features = iter(_FeatureStream(f))
+        offset = 0
+        while True:
+            chunk = list(islice(features, chunk_size))
+            if not chunk:
+                return
+            yield offset, chunk
+            offset += len(chunk)
+
+def _from_chunk(chunk: List[Dict[str, Any]], offset: int, validate: str, columnar: bool = False) -> GeoJSON:
+    try:
+        return GeoJSON.from_dict({'features': chunk}, columnar=columnar, validate=validate)
+    except GeoJSONValidationError as e:
+        # Report positions in the file rather than in the chunk
+        raise GeoJSONValidationError([(index + offset, message) for index, message in e.errors]) from None
+
+def save_geojsonseq(geojson: GeoJSON, filename: str, rs: bool = False, index: bool = False, engine: str = None):
+    '''
+    Saves features as newline-delimited GeoJSON, one feature per line.
+
+    :param rs: Start every record with the RS character, as in RFC 8142 GeoJSON Text Sequences
+    :param index: Also write a sidecar ``.idx`` file with the byte offset of every feature
+    :param engine: JSON engine to use, see ``set_json_engine``
+    '''
+    prefix = RECORD_SEPARATOR if rs else b''
+    offsets = [0]
+    with open(filename, 'wb') as f:
+        for feature in geojson.features:
+            record = prefix + dumps(feature, engine=engine).encode('utf8') + b'\n'
+            f.write(record)
+            offsets.append(offsets[-1] + len(record))
+    if index:
+        np.asarray(offsets, dtype='<i8').tofile(index_path(filename))
+
+def read_geojsonseq(filename: str, validate: str = 'structure', engine: str = None) -> GeoJSON:
+    '''
+    Reads a newline-delimited GeoJSON file (RFC 8142 or NDJSON).
+    For random access, see ``GeoJSON.from_seq``.
+
+    :return: GeoJSON
+    '''
+    with GeoJSONSeq(filename, validate=validate, engine=engine) as seq:
+        return seq.range(0, len(seq))
+
+def read_geojson_many(paths: Union[str, List[str]],
+                      workers: int = None,
+                      backend: str = 'process',
+                      as_dataframe: bool = False,
+                      source_col: str = 'source',
+                      validate: str = 'structure',
+                      engine: str = None) -> Union[GeoJSON, DataFrame]:
+    '''
+    Reads several GeoJSON files in parallel into one collection.
+
+    Each worker parses one file into columnar coordinate arrays, which are
+    cheap to send back between processes, and the results are concatenated
+    in the order of ``paths``.
+
+    :param paths: List of file paths or a glob pattern
+    :param workers: Number of workers, defaults to the executor's default
+    :param backend: 'process' or 'thread'
+    :param as_dataframe: Return a DataFrame like ``GeoJSON.to_dataframe`` with a column naming the source file
+    :param source_col: Name of the source file column
+    :return: Columnar GeoJSON, or DataFrame when ``as_dataframe`` is True
+    '''
+    executors = {'process': ProcessPoolExecutor, 'thread': ThreadPoolExecutor}
+    if backend not in executors:
+        raise ValueError(f"Invalid backend: {backend}. Must be 'process' or 'thread'.")
+    if isinstance(paths, str):
+        pattern = paths
+        paths = sorted(glob(pattern))
+        if not paths:
+            raise FileNotFoundError(f"No files match {pattern}")
+
+    with executors[backend](max_workers=workers) as executor:
+        results = list(executor.map(_read_columnar, paths, repeat(validate), repeat(engine)))
+
+    features = ColumnarFeatures(GeometryArray.concat([geometries for geometries, _ in results]),
+                                [props for _, properties in results for props in properties])
+    geojson = GeoJSON(type='FeatureCollection', features=features)
+    if not as_dataframe:
+        return geojson
+    data = geojson.to_dataframe()
+    data.insert(0, source_col, np.repeat(np.array(paths, dtype=object), [len(properties) for _, properties in results]))
+    return data
+
+def _read_columnar(file_path: str, validate: str, engine: str) -> Tuple[GeometryArray, List[Dict[str, Any]]]:
+    with open(file_path, 'rb') as response:
+        geo_json_data = load(response, engine=engine)
+    features = GeoJSON.from_dict(geo_json_data, columnar=True, validate=validate).features
+    return features.geometries, features.properties
+
+def read_geojson_url(url: str, engine: str = None) -> GeoJSON:
     with urlopen(url) as response:
-        geo_json_data = json.load(response)
-    return GeoJSON.from_dict(geo_json_data)
\ No newline at end of file
+        geo_json_data = load(response, engine=engine)
+    return GeoJSON.from_dict(geo_json_data)
+
+def iter_geojson(file_path: str, chunk_size: int = None, read_size: int = 1 << 16) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    '''
+    Iterates over the features of a GeoJSON file without loading the whole file.
+
+    The ``features`` array is parsed incrementally in a single pass and every
+    feature is validated with its geometry class. Features without geometry are
+    skipped, as in ``GeoJSON.from_dict``.
+
+    :param file_path: Path to the file, or an open text or binary file object
+    :param chunk_size: Yield lists of up to ``chunk_size`` features instead of single features
+    :param read_size: Number of characters read from the file at a time
+    :return: Iterator of features or lists of features
+    '''
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if hasattr(file_path, 'read'):
+        yield from _iter_stream(file_path, chunk_size, read_size)
+        return
+    with open(file_path, encoding='utf8') as f:
+        yield from _iter_stream(f, chunk_size, read_size)
+
+def _iter_stream(stream, chunk_size: int, read_size: int):
+    if isinstance(stream.read(0), bytes):
+        stream = TextIOWrapper(stream, encoding='utf8')
+    features = (feature for feature in map(feature_from_dict, _FeatureStream(stream, read_size)) if feature is not None)
+    if chunk_size is None:
+        yield from features
+        return
+    chunk = []
+    for feature in features:
+        chunk.append(feature)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class GeoJSONWriter:
+    '''
+    Writes a FeatureCollection to a file one feature at a time.
+
+    The collection header is written when the writer is created and the
+    features array is closed by ``close``, so features can be streamed from
+    any source without holding the collection in memory. When the ``with``
+    block raises, the file is closed without finishing the array, so a
+    partial file is not mistaken for a complete collection.
+
+    :param filename: Output path
+    :param compression: 'gzip', 'zstd', None, or 'infer' to choose from the
+        ``.gz`` / ``.zst`` file extension. zstd requires the ``zstandard`` package.
+    :param precision: Round coordinates to this many decimal places
+    :param engine: JSON engine to use, see ``set_json_engine``
+    '''
+    def __init__(self,
+                 filename: str,
+                 compression: str = 'infer',
+                 precision: int = None,
+                 engine: str = None,
+                 collection_type: str = 'FeatureCollection'):
+        self.precision = precision
+        self.engine = engine
+        self.count = 0
+        self._file = _open_compressed(filename, compression)
+        self._file.write('{"type":' + dumps(collection_type, engine=engine) + ',"features":[')
+
+    def __enter__(self) -> 'GeoJSONWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def write(self, feature: Union[Dict[str, Any], Geometry]):
+        '''
+        Writes a feature dictionary or geometry object.
+        '''
+        if self._file is None:
+            raise ValueError("Cannot write to a closed GeoJSONWriter.")
+        if isinstance(feature, Geometry):
+            feature = feature.to_dict()
+        if self.precision is not None and feature.get('geometry'):
+            geometry = feature['geometry']
+            feature = dict(feature, geometry={
+                'type': geometry['type'],
+                'coordinates': round_coordinates(geometry['coordinates'], self.precision)
+            })
+        if self.count:
+            self._file.write(',')
+        self._file.write(dumps(feature, engine=self.engine))
+        self.count += 1
+
+    def write_features(self, features: Iterable[Union[Dict[str, Any], Geometry]]):
+        for feature in features:
+            self.write(feature)
+
+    def write_geojson(self, geojson: GeoJSON):
+        self.write_features(geojson.features)
+
+    def write_dataframe(self,
+                        df: DataFrame,
+                        geometry_type_col: str = 'geometry.type',
+                        coordinate_col: str = 'geometry.coordinates',
+                        property_col_list: List[str] = []):
+        '''
+        Writes a DataFrame chunk, with the same columns as ``GeoJSON.from_dataframe``.
+        '''
+        self.write_features(features_from_dataframe(df, geometry_type_col, coordinate_col, property_col_list))
+
+    def close(self):
+        if self._file is None:
+            return
+        try:
+            self._file.write(']}')
+        finally:
+            self._file.close()
+            self._file = None
+
+
+def _open_compressed(filename: str, compression: str):
+    if compression == 'infer':
+        extension = os.path.splitext(str(filename))[1].lower()
+        compression = {'.gz': 'gzip', '.zst': 'zstd'}.get(extension)
+    if compression is None:
+        return open(filename, 'w', encoding='utf8')
+    if compression == 'gzip':
+        return gzip.open(filename, 'wt', encoding='utf8')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the zstandard package.")
+        return zstandard.open(filename, 'wt', encoding='utf8')
+    raise ValueError(f"Invalid compression: {compression}. Must be 'gzip', 'zstd', 'infer' or None.")
+
+
+class _FeatureStream:
+    '''
+    Incremental reader for the ``features`` array of a FeatureCollection.
+
+    Only the feature currently being decoded is held in memory, along with
+    the unread part of the last block read from the stream.
+    '''
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(self, stream, read_size: int = 1 << 16):
+        self.stream = stream
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def __iter__(self):
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError("GeoJSON object keys must be strings.")
+            self._expect(':')
+            if key == 'features':
+                yield from self._features()
+            else:
+                self._value()
+            if self._expect(',}') == '}':
+                return
+
+    def _features(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        # Grow reads with the buffer so oversized values are not re-decoded too often
+        data = self.stream.read(max(self.read_size, len(self.buffer)))
+        if not data:
+            self.eof = True
+            return False
+        self.buffer += data
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in self._WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of GeoJSON data.")
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"Invalid GeoJSON data: expected one of {chars!r} at offset {self.pos}, found {char!r}.")
+        self.pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A value that ends with the buffer (e.g. a number) may continue in the next block
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
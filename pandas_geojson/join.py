@@ -0,0 +1,200 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+import numpy as np
+import pandas as pd
+from pandas_geojson.arrays import (
+    GeometryArray,
+    MULTIPOINT,
+    MULTIPOLYGON,
+    NULL_GEOMETRY,
+    POINT,
+    POLYGON,
+    expand_ranges,
+    _offsets,
+)
+from pandas_geojson.core import GeoJSON, property_columns_from_dicts
+from pandas_geojson.index import STRtree
+from pandas_geojson.ops import _segments
+
+
+PREDICATES = ('within', 'intersects')
+
+
+def sjoin(left: GeoJSON,
+          right: GeoJSON,
+          predicate: str = 'within',
+          workers: int = None,
+          chunk_size: int = 100000,
+          lsuffix: str = 'left',
+          rsuffix: str = 'right') -> pd.DataFrame:
+    '''
+    Joins Point and MultiPoint features to the Polygon and MultiPolygon
+    features that contain them.
+
+    Candidate polygons come from a bulk query of the polygons' R-tree, then a
+    crossing-number test runs over all candidate (point, edge) pairs at once.
+    Each polygon's edges are bucketed into horizontal bands, so a point is
+    only tested against the edges of the band it falls in. Points are
+    processed ``chunk_size`` at a time to bound memory.
+
+    ``'within'`` matches points inside a polygon, not on its boundary.
+    ``'intersects'`` also matches points on the boundary. A MultiPoint is
+    within a polygon when all its points are inside or on the boundary and at
+    least one is inside, and intersects it when any of its points does.
+
+    :param left: Collection of Point and MultiPoint features
+    :param right: Collection of Polygon and MultiPolygon features
+    :param predicate: 'within' or 'intersects'
+    :param workers: Number of processes to split the chunks across. None runs in this process.
+    :param chunk_size: Number of points tested per chunk
+    :param lsuffix: Suffix of left property columns whose name is also a right property
+    :param rsuffix: Suffix of right property columns whose name is also a left property
+    :return: DataFrame with ``index_left``, ``index_right`` and the properties of both features
+    '''
+    if predicate not in PREDICATES:
+        raise ValueError(f"Invalid predicate: {predicate}. Must be one of {', '.join(PREDICATES)}.")
+    left_array = left._geometry_array()
+    right_array = right._geometry_array()
+    _check_types(left_array, (POINT, MULTIPOINT), 'left', 'Point and MultiPoint')
+    _check_types(right_array, (POLYGON, MULTIPOLYGON), 'right', 'Polygon and MultiPolygon')
+
+    polygons = PolygonIndex(right_array)
+    points = left_array.coords
+    chunks = [points[start:start + chunk_size] for start in range(0, len(points), chunk_size)]
+    if workers is None or workers <= 1:
+        results = [polygons.locate(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_set_polygons, initargs=(polygons,)) as executor:
+            results = list(executor.map(_locate, chunks))
+
+    starts = np.arange(0, len(points), chunk_size)
+    point_index = np.concatenate([start + found[0] for start, found in zip(starts, results)] or [np.empty(0, dtype=np.int64)])
+    index_right = np.concatenate([found[1] for found in results] or [np.empty(0, dtype=np.int64)])
+    inside = np.concatenate([found[2] for found in results] or [np.empty(0, dtype=bool)])
+    boundary = np.concatenate([found[3] for found in results] or [np.empty(0, dtype=bool)])
+    index_left, index_right = _match(left_array, point_index, index_right, inside, boundary, predicate)
+    return _joined_frame(left, right, index_left, index_right, lsuffix, rsuffix)
+
+
+class PolygonIndex:
+    '''
+    Polygon edges bucketed into horizontal bands, plus an R-tree over the
+    polygon bounding boxes, for locating many points at once.
+
+    Each polygon gets about one band per four edges, and an edge is stored in
+    every band its y-range overlaps. A horizontal ray from a point can only
+    cross edges stored in the point's band.
+
+    :param polygons: GeometryArray of Polygon and MultiPolygon geometries
+    '''
+    def __init__(self, polygons: GeometryArray):
+        bounds = polygons.bounds()
+        self.tree = STRtree(bounds)
+        a, b, segment_ring = _segments(polygons)
+        edge_polygon = polygons.ring_geometry_index()[segment_ring]
+        self.edges = np.column_stack([polygons.coords[a], polygons.coords[b]])
+
+        n_edges = np.bincount(edge_polygon, minlength=len(polygons))
+        self.bands = np.maximum(1, -(-n_edges // 4))
+        self.ymin = bounds[:, 1]
+        with np.errstate(invalid='ignore'):
+            self.height = (bounds[:, 3] - bounds[:, 1]) / self.bands
+        self.height[~(self.height > 0)] = np.inf
+        self.band_offsets = _offsets(self.bands)
+
+        y1, y2 = self.edges[:, 1], self.edges[:, 3]
+        low = self._band(edge_polygon, np.minimum(y1, y2))
+        high = self._band(edge_polygon, np.maximum(y1, y2))
+        counts = high - low + 1
+        edge_ids = np.repeat(np.arange(len(self.edges)), counts)
+        keys = self.band_offsets[edge_polygon][edge_ids] + expand_ranges(low, counts)
+        order = np.argsort(keys, kind='stable')
+        self.band_edges = edge_ids[order]
+        self.band_starts = _offsets(np.bincount(keys, minlength=self.band_offsets[-1]))
+
+    def locate(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        '''
+        Finds the polygons containing each point.
+
+        :param points: ``(n, 2)`` array of coordinates
+        :return: Point positions, polygon positions, and whether each point is strictly
+            inside or on the boundary of the polygon. Only candidate pairs are returned.
+        '''
+        point_index, polygon_index = self.tree.query_many(np.hstack([points, points]))
+        x, y = points[point_index, 0], points[point_index, 1]
+        keys = self.band_offsets[polygon_index] + self._band(polygon_index, y)
+        starts = self.band_starts[keys]
+        counts = self.band_starts[keys + 1] - starts
+        pair = np.repeat(np.arange(len(point_index)), counts)
+        x1, y1, x2, y2 = self.edges[self.band_edges[expand_ranges(starts, counts)]].T
+        x, y = x[pair], y[pair]
+
+        straddles = (y1 > y) != (y2 > y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crosses = straddles & (x < x1 + (y - y1) * (x2 - x1) / (y2 - y1))
+        on_edge = (((x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)) == 0) \
+            & (np.minimum(x1, x2) <= x) & (x <= np.maximum(x1, x2)) \
+            & (np.minimum(y1, y2) <= y) & (y <= np.maximum(y1, y2))
+        boundary = np.bincount(pair, on_edge, minlength=len(point_index)) > 0
+        inside = (np.bincount(pair, crosses, minlength=len(point_index)) % 2 == 1) & ~boundary
+        return point_index, polygon_index, inside, boundary
+
+    def _band(self, polygons: np.ndarray, y: np.ndarray) -> np.ndarray:
+        band = np.floor((y - self.ymin[polygons]) / self.height[polygons])
+        return np.clip(band, 0, self.bands[polygons] - 1).astype(np.int64)
+
+
+def _check_types(array: GeometryArray, allowed: Tuple[int, ...], side: str, names: str):
+    codes = array.type_codes
+    if not np.isin(codes[codes != NULL_GEOMETRY], allowed).all():
+        raise ValueError(f"The {side} collection of a spatial join must only contain {names} features.")
+
+
+def _match(points: GeometryArray, point_index, polygon_index, inside, boundary, predicate: str):
+    '''
+    Combines the per-point results into (feature, polygon) matches.
+    '''
+    geometry = points.vertex_geometry_index()[point_index]
+    touches = inside | boundary
+    if (points.type_codes != MULTIPOINT).all():
+        hits = touches if predicate == 'intersects' else inside
+        return geometry[hits], polygon_index[hits]
+
+    n_polygons = max(int(polygon_index.max(initial=-1)) + 1, 1)
+    pairs, position = np.unique(geometry[touches] * n_polygons + polygon_index[touches], return_inverse=True)
+    index_left, index_right = pairs // n_polygons, pairs % n_polygons
+    if predicate == 'intersects':
+        return index_left, index_right
+    covered = np.bincount(position, minlength=len(pairs))
+    interior = np.bincount(position, inside[touches], minlength=len(pairs))
+    n_points = np.diff(points.ring_offsets[points.part_offsets[points.geometry_offsets]])
+    hits = (covered == n_points[index_left]) & (interior > 0)
+    return index_left[hits], index_right[hits]
+
+
+def _joined_frame(left: GeoJSON, right: GeoJSON, index_left, index_right, lsuffix: str, rsuffix: str) -> pd.DataFrame:
+    left_columns = pd.DataFrame(property_columns_from_dicts(_properties(left)), index=range(len(left.features)))
+    right_columns = pd.DataFrame(property_columns_from_dicts(_properties(right)), index=range(len(right.features)))
+    shared = set(left_columns.columns) & set(right_columns.columns)
+    left_columns = left_columns.take(index_left).rename(columns={key: f"{key}_{lsuffix}" for key in shared})
+    right_columns = right_columns.take(index_right).rename(columns={key: f"{key}_{rsuffix}" for key in shared})
+    data = pd.DataFrame({'index_left': index_left, 'index_right': index_right})
+    return pd.concat([data, left_columns.reset_index(drop=True), right_columns.reset_index(drop=True)], axis=1)
+
+
+def _properties(geojson: GeoJSON):
+    if geojson.columnar:
+        return geojson.features.properties
+    return [feature.get('properties') or {} for feature in geojson.features]
+
+
+_polygons = None
+
+
+def _set_polygons(polygons: PolygonIndex):
+    global _polygons
+    _polygons = polygons
+
+
+def _locate(points: np.ndarray):
+    return _polygons.locate(points)
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator
+import mmap
+from pandas_geojson.backend import loads
+from pandas_geojson.scan import feature_spans
+from pandas_geojson.validation import GeoJSONValidationError, validate_geometries
+
+
+class LazyFeatures(Sequence):
+    '''
+    Read-only feature sequence over a memory-mapped GeoJSON file.
+
+    Opening the file only records the byte span of each feature. Features
+    are decoded when accessed and the most recently used ones are kept in an
+    LRU cache. Because the file is mapped read-only, processes opening the
+    same file share its pages through the OS page cache.
+
+    Unlike ``GeoJSON.from_dict``, features without geometry are kept.
+
+    :param filename: Path to the GeoJSON file
+    :param cache_size: Maximum number of decoded features kept in memory
+    :param validate: Validation level applied to each decoded feature, see ``GeoJSON.from_dict``
+    :param engine: JSON engine to use, see ``set_json_engine``
+    '''
+    def __init__(self, filename: str, cache_size: int = 1024, validate: str = 'structure', engine: str = None):
+        self.filename = filename
+        self.cache_size = cache_size
+        self.validate = validate
+        self.engine = engine
+        self._cache = OrderedDict()
+        with open(filename, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.starts, self.ends = feature_spans(self._buffer)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Feature index out of range.")
+        feature = self._cache.get(i)
+        if feature is not None:
+            self._cache.move_to_end(i)
+            return feature
+        feature = self._parse(i)
+        if self.cache_size > 0:
+            self._cache[i] = feature
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return feature
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f"LazyFeatures({self.filename!r}, n_features={len(self)}, cached={len(self._cache)})"
+
+    def extend(self, features):
+        raise TypeError("Lazy collections are read-only. Copy the features into a GeoJSON object first.")
+
+    def append(self, feature):
+        self.extend([feature])
+
+    def close(self):
+        self._cache.clear()
+        self._buffer.close()
+
+    def _parse(self, i: int) -> Dict[str, Any]:
+        data = loads(self._buffer[self.starts[i]:self.ends[i]], engine=self.engine)
+        errors = validate_geometries([data.get('geometry')], level=self.validate)
+        if errors:
+            raise GeoJSONValidationError([(i, message) for _, message in errors])
+        geometry = data.get('geometry')
+        if geometry is not None:
+            geometry = {'type': geometry['type'], 'coordinates': geometry['coordinates']}
+        return {
+            'type': 'Feature',
+            'geometry': geometry,
+            'properties': data.get('properties') or {}
+        }
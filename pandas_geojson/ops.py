@@ -0,0 +1,287 @@
+import numpy as np
+from pandas_geojson.arrays import (
+    GeometryArray,
+    LINESTRING,
+    MULTILINESTRING,
+    MULTIPOLYGON,
+    NULL_GEOMETRY,
+    POLYGON,
+    expand_ranges,
+    _offsets,
+)
+
+
+def simplify(array: GeometryArray, tolerance: float, preserve_topology: bool = True) -> GeometryArray:
+    '''
+    Simplifies lines and polygon rings with the Douglas-Peucker algorithm.
+
+    All rings are processed together: each pass finds the farthest vertex of
+    every open segment at once, so the number of passes grows with the depth
+    of the recursion rather than the number of rings. Points and MultiPoints
+    are returned unchanged.
+
+    :param tolerance: Maximum distance, in coordinate units, between the original and simplified shapes
+    :param preserve_topology: Keep the original ring when simplification would leave fewer
+        than four positions. Otherwise such rings are dropped, along with the holes of a dropped
+        exterior ring, and geometries with nothing left become null.
+    :return: GeometryArray
+    '''
+    if tolerance < 0:
+        raise ValueError("tolerance must not be negative.")
+    return simplify_by_importance(array, vertex_importance(array), tolerance, preserve_topology)
+
+
+def vertex_importance(array: GeometryArray) -> np.ndarray:
+    '''
+    Smallest Douglas-Peucker tolerance at which each vertex is dropped.
+    Points, MultiPoints and line or ring endpoints get infinity. Computing
+    it once lets a geometry be simplified at many tolerances cheaply.
+
+    :return: Array aligned with ``array.coords``
+    '''
+    ring_types = array.type_codes[array.ring_geometry_index()]
+    simplified = np.isin(ring_types, (LINESTRING, MULTILINESTRING, POLYGON, MULTIPOLYGON))
+    importance = _douglas_peucker(array.coords, array.ring_offsets, simplified)
+    importance[~simplified[array.vertex_ring_index()]] = np.inf
+    return importance
+
+
+def simplify_by_importance(array: GeometryArray, importance: np.ndarray, tolerance: float,
+                           preserve_topology: bool = True) -> GeometryArray:
+    '''
+    Simplifies with precomputed ``vertex_importance``, see ``simplify``.
+
+    :return: GeometryArray
+    '''
+    ring_offsets = array.ring_offsets
+    n_rings = len(ring_offsets) - 1
+    ring_part = array.ring_part_index()
+    ring_types = array.type_codes[array.ring_geometry_index()]
+    vertex_ring = array.vertex_ring_index()
+    keep = importance > tolerance
+
+    ring_lengths = np.bincount(vertex_ring[keep], minlength=n_rings)
+    collapsed = np.isin(ring_types, (POLYGON, MULTIPOLYGON)) & (ring_lengths < 4) & (np.diff(ring_offsets) >= 4)
+    ring_keep = np.ones(n_rings, dtype=bool)
+    part_keep = np.ones(len(array.part_offsets) - 1, dtype=bool)
+    if preserve_topology:
+        # Keep the four most important positions of rings that would collapse
+        vertices = np.flatnonzero(collapsed[vertex_ring])
+        order = vertices[np.lexsort((-importance[vertices], vertex_ring[vertices]))]
+        lengths = np.diff(ring_offsets)[collapsed]
+        rank = np.arange(len(order)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        keep[order[rank < 4]] = True
+    else:
+        ring_keep = ~collapsed
+        exterior = array.part_offsets[:-1][np.diff(array.part_offsets) > 0]
+        part_keep[ring_part[exterior]] = ring_keep[exterior]
+        ring_keep &= part_keep[ring_part]
+        keep &= ring_keep[vertex_ring]
+    return _rebuild(array, keep, ring_keep, part_keep)
+
+
+def round_coordinates(array: GeometryArray, precision: int) -> GeometryArray:
+    '''
+    Rounds every coordinate to ``precision`` decimal places.
+
+    :return: GeometryArray
+    '''
+    return GeometryArray(np.round(array.coords, precision), array.ring_offsets, array.part_offsets,
+                         array.geometry_offsets, array.type_codes)
+
+
+EARTH_RADIUS = 6371008.8
+
+
+def areas(array: GeometryArray, geodesic: bool = False) -> np.ndarray:
+    '''
+    Area of every geometry, with holes subtracted. Points and lines have no area.
+
+    :param geodesic: Treat coordinates as longitude/latitude degrees and return square metres
+        on a spherical Earth. Otherwise the planar area in squared coordinate units.
+    :return: Array of length ``n_geometries``
+    '''
+    a, b, segment_ring = _segments(array)
+    coords = array.coords
+    if geodesic:
+        lon, lat = np.radians(coords[:, 0]), np.radians(coords[:, 1])
+        terms = (lon[b] - lon[a]) * (2 + np.sin(lat[a]) + np.sin(lat[b])) * EARTH_RADIUS ** 2 / 2
+    else:
+        local = _local_coords(array)
+        terms = (local[a, 0] * local[b, 1] - local[b, 0] * local[a, 1]) / 2
+    ring_area = np.bincount(segment_ring, terms, minlength=len(array.ring_offsets) - 1)
+    return np.bincount(array.ring_geometry_index(), _ring_signs(array, ring_area) * ring_area, minlength=len(array))
+
+
+def lengths(array: GeometryArray, geodesic: bool = False) -> np.ndarray:
+    '''
+    Length of every line, or perimeter of every polygon including its holes.
+    Points have no length.
+
+    :param geodesic: Treat coordinates as longitude/latitude degrees and return metres along
+        great circles (haversine). Otherwise the planar length in coordinate units.
+    :return: Array of length ``n_geometries``
+    '''
+    a, b, segment_ring = _segments(array)
+    coords = array.coords
+    if geodesic:
+        lon, lat = np.radians(coords[:, 0]), np.radians(coords[:, 1])
+        h = np.sin((lat[b] - lat[a]) / 2) ** 2 + np.cos(lat[a]) * np.cos(lat[b]) * np.sin((lon[b] - lon[a]) / 2) ** 2
+        distances = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(h, 0, 1)))
+    else:
+        distances = np.hypot(*(coords[b] - coords[a]).T)
+    return np.bincount(array.ring_geometry_index()[segment_ring], distances, minlength=len(array))
+
+
+def centroids(array: GeometryArray) -> np.ndarray:
+    '''
+    Centroid of every geometry as ``(x, y)`` rows, computed for all
+    geometries at once.
+
+    Polygons use the area-weighted (shoelace) centroid with holes subtracted,
+    lines the length-weighted centroid of their segments and points the mean
+    of their positions. Polygons with no area fall back to their outline,
+    and zero-length lines to their positions. Null geometries get NaN.
+
+    :return: Array of shape ``(n_geometries, 2)``
+    '''
+    n = len(array)
+    ring_geometry = array.ring_geometry_index()
+    vertex_geometry = array.vertex_geometry_index()
+    local = _local_coords(array)
+    a, b, segment_ring = _segments(array)
+    segment_geometry = ring_geometry[segment_ring]
+
+    n_rings = len(array.ring_offsets) - 1
+    cross = local[a, 0] * local[b, 1] - local[b, 0] * local[a, 1]
+    ring_area = np.bincount(segment_ring, cross, minlength=n_rings) / 2
+    ring_mx = np.bincount(segment_ring, (local[a, 0] + local[b, 0]) * cross, minlength=n_rings) / 6
+    ring_my = np.bincount(segment_ring, (local[a, 1] + local[b, 1]) * cross, minlength=n_rings) / 6
+    sign = _ring_signs(array, ring_area)
+    area = np.bincount(ring_geometry, sign * ring_area, minlength=n)
+    mx = np.bincount(ring_geometry, sign * ring_mx, minlength=n)
+    my = np.bincount(ring_geometry, sign * ring_my, minlength=n)
+
+    distances = np.hypot(*(local[b] - local[a]).T)
+    length = np.bincount(segment_geometry, distances, minlength=n)
+    lx = np.bincount(segment_geometry, distances * (local[a, 0] + local[b, 0]) / 2, minlength=n)
+    ly = np.bincount(segment_geometry, distances * (local[a, 1] + local[b, 1]) / 2, minlength=n)
+
+    counts = np.bincount(vertex_geometry, minlength=n)
+    px = np.bincount(vertex_geometry, local[:, 0], minlength=n)
+    py = np.bincount(vertex_geometry, local[:, 1], minlength=n)
+
+    result = np.full((n, 2), np.nan)
+    points = counts > 0
+    result[points] = np.column_stack([px, py])[points] / counts[points, None]
+    lines = length > 0
+    result[lines] = np.column_stack([lx, ly])[lines] / length[lines, None]
+    polygons = area != 0
+    result[polygons] = np.column_stack([mx, my])[polygons] / area[polygons, None]
+    return result + _origins(array)
+
+
+def _segments(array: GeometryArray):
+    '''
+    Start and end vertex of every line or polygon ring segment, and the ring
+    it belongs to.
+    '''
+    vertex_ring = array.vertex_ring_index()
+    ring_types = array.type_codes[array.ring_geometry_index()]
+    a = np.flatnonzero(vertex_ring[:-1] == vertex_ring[1:])
+    a = a[np.isin(ring_types[vertex_ring[a]], (LINESTRING, MULTILINESTRING, POLYGON, MULTIPOLYGON))]
+    return a, a + 1, vertex_ring[a]
+
+
+def _ring_signs(array: GeometryArray, ring_area: np.ndarray) -> np.ndarray:
+    '''
+    Factor turning signed ring areas into positive areas for exterior rings
+    and negative areas for holes, whatever their orientation. Rings of
+    non-polygon geometries get 0.
+    '''
+    hole = np.ones(len(ring_area), dtype=bool)
+    hole[array.part_offsets[:-1][np.diff(array.part_offsets) > 0]] = False
+    polygonal = np.isin(array.type_codes[array.ring_geometry_index()], (POLYGON, MULTIPOLYGON))
+    return np.sign(ring_area) * np.where(hole, -1, 1) * polygonal
+
+
+def _origins(array: GeometryArray) -> np.ndarray:
+    starts = array.ring_offsets[array.part_offsets[array.geometry_offsets]]
+    origins = np.zeros((len(array), 2))
+    nonempty = np.diff(starts) > 0
+    origins[nonempty] = array.coords[starts[:-1][nonempty]]
+    return origins
+
+
+def _local_coords(array: GeometryArray) -> np.ndarray:
+    '''
+    Coordinates relative to the first vertex of their geometry, which keeps
+    shoelace sums accurate far from the origin.
+    '''
+    return array.coords - _origins(array)[array.vertex_geometry_index()]
+
+
+def _douglas_peucker(coords: np.ndarray, ring_offsets: np.ndarray, rings: np.ndarray) -> np.ndarray:
+    '''
+    Runs the Douglas-Peucker recursion to the end for the selected rings and
+    returns the importance of every vertex: the smallest tolerance at which
+    it is dropped. Ring endpoints are never dropped.
+    '''
+    importance = np.zeros(len(coords))
+    starts = ring_offsets[:-1][rings]
+    ends = ring_offsets[1:][rings] - 1
+    nonempty = ends >= starts
+    starts, ends = starts[nonempty], ends[nonempty]
+    importance[starts] = np.inf
+    importance[ends] = np.inf
+    parents = np.full(len(starts), np.inf)
+
+    while len(starts):
+        inner = ends - starts - 1
+        open_segments = inner > 0
+        starts, ends, inner, parents = starts[open_segments], ends[open_segments], inner[open_segments], parents[open_segments]
+        if not len(starts):
+            break
+        vertices = expand_ranges(starts + 1, inner)
+        segment = np.repeat(np.arange(len(starts)), inner)
+        distances = _segment_distance(coords[vertices], coords[starts][segment], coords[ends][segment])
+
+        first = np.cumsum(inner) - inner
+        farthest = np.maximum.reduceat(distances, first)
+        # First vertex reaching the maximum of each segment
+        candidates = np.flatnonzero(distances == farthest[segment])
+        _, at = np.unique(segment[candidates], return_index=True)
+        pivots = vertices[candidates[at]]
+
+        # A vertex can only survive if the segment it splits survives
+        parents = np.minimum(farthest, parents)
+        importance[pivots] = parents
+        starts, ends = np.concatenate([starts, pivots]), np.concatenate([pivots, ends])
+        parents = np.concatenate([parents, parents])
+    return importance
+
+
+def _segment_distance(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    ab = b - a
+    length = (ab ** 2).sum(axis=1)
+    t = np.divide(((points - a) * ab).sum(axis=1), length, out=np.zeros(len(points)), where=length > 0)
+    closest = a + np.clip(t, 0, 1)[:, None] * ab
+    return np.hypot(*(points - closest).T)
+
+
+def _rebuild(array: GeometryArray, keep: np.ndarray, ring_keep: np.ndarray, part_keep: np.ndarray) -> GeometryArray:
+    vertex_ring = array.vertex_ring_index()
+    ring_part = array.ring_part_index()
+    part_geometry = array.part_geometry_index()
+
+    ring_lengths = np.bincount(vertex_ring[keep], minlength=len(ring_keep))[ring_keep]
+    part_lengths = np.bincount(ring_part[ring_keep], minlength=len(part_keep))[part_keep]
+    geometry_lengths = np.bincount(part_geometry[part_keep], minlength=len(array))
+
+    type_codes = array.type_codes.copy()
+    type_codes[(geometry_lengths == 0) & (np.diff(array.geometry_offsets) > 0)] = NULL_GEOMETRY
+    return GeometryArray(array.coords[keep],
+                         _offsets(ring_lengths),
+                         _offsets(part_lengths),
+                         _offsets(geometry_lengths),
+                         type_codes)
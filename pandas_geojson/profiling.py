@@ -0,0 +1,123 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List
+import time
+import tracemalloc
+import pandas as pd
+
+
+class Stats:
+    '''
+    Wall time and peak memory of the stages run while profiling.
+
+    Stages run several times, such as ``validate`` when reading many files,
+    are summed. A stage run inside another one is also counted in the outer stage.
+
+    :param memory: Record the peak memory allocated by each stage with ``tracemalloc``
+    :param callback: Called with the stage name, seconds and peak bytes (None without ``memory``)
+        at the end of every stage
+    '''
+    def __init__(self, memory: bool = False, callback: Callable[[str, float, int], None] = None):
+        self.memory = memory
+        self.callback = callback
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.peak_memory: Dict[str, int] = {}
+        self._peaks: List[int] = []
+
+    def __repr__(self):
+        stages = ', '.join(f"{name}={seconds:.4f}s" for name, seconds in self.seconds.items())
+        return f"Stats({stages})"
+
+    def record(self, name: str, seconds: float, peak: int = None):
+        '''
+        Adds one run of a stage.
+        '''
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if peak is not None:
+            self.peak_memory[name] = max(self.peak_memory.get(name, 0), peak)
+        if self.callback is not None:
+            self.callback(name, seconds, peak)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        '''
+        One row per stage with ``seconds``, ``calls`` and, with ``memory``, ``peak_memory`` in bytes.
+
+        :return: DataFrame indexed by stage
+        '''
+        data = pd.DataFrame({'seconds': self.seconds, 'calls': self.calls})
+        if self.memory:
+            data['peak_memory'] = pd.Series(self.peak_memory, dtype='Int64')
+        data.index.name = 'stage'
+        return data
+
+
+_active: ContextVar[Stats] = ContextVar('pandas_geojson_stats', default=None)
+
+
+@contextmanager
+def profile(callback: Callable[[str, float, int], None] = None, memory: bool = False) -> Iterator[Stats]:
+    '''
+    Records the timings of the read, validate, build, normalize and write
+    stages run inside the ``with`` block. GeoJSON objects created inside the
+    block keep the same Stats in their ``stats`` attribute.
+
+    Profiling is off by default and the stage hooks do nothing without it.
+    Tracing memory slows Python allocations down noticeably, so timings
+    taken with ``memory=True`` are pessimistic.
+
+    :param callback: Called with the stage name, seconds and peak bytes at the end of every stage
+    :param memory: Also record the peak memory allocated by each stage
+    :return: Stats, filled as stages finish
+    '''
+    stats = Stats(memory=memory, callback=callback)
+    token = _active.set(stats)
+    tracing = memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+        if tracing:
+            tracemalloc.stop()
+
+
+def current() -> Stats:
+    '''
+    Stats of the enclosing ``profile`` block, or None when not profiling.
+    '''
+    return _active.get()
+
+
+@contextmanager
+def stage(name: str):
+    '''
+    Times the body of the ``with`` block, or of the decorated function, as
+    stage ``name`` when profiling.
+    '''
+    stats = _active.get()
+    if stats is None:
+        yield
+        return
+    peaks = stats._peaks
+    if stats.memory:
+        # The peak is reset for this stage, so the enclosing stage keeps the peak seen so far
+        start_memory, peak = tracemalloc.get_traced_memory()
+        if peaks:
+            peaks[-1] = max(peaks[-1], peak)
+        tracemalloc.reset_peak()
+        peaks.append(start_memory)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        peak = None
+        if stats.memory:
+            stage_peak = max(peaks.pop(), tracemalloc.get_traced_memory()[1])
+            if peaks:
+                peaks[-1] = max(peaks[-1], stage_peak)
+            peak = stage_peak - start_memory
+        stats.record(name, seconds, peak)
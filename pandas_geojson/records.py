@@ -0,0 +1,174 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+from pandas_geojson.arrays import GEOMETRY_TYPES
+
+
+_INTERNED = {name: name for name in GEOMETRY_TYPES}
+_MEMBERS = ('type', 'geometry', 'properties')
+
+
+class ReadOnlyDict(dict):
+    '''
+    Dictionary returned for the geometry and properties of a ``Feature``.
+    Editing it raises a TypeError rather than silently changing a copy.
+    Pickling and copying give a plain dictionary.
+    '''
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Feature records are read-only. Use GeoJSON.update_properties to edit properties, "
+                        "or Feature.to_dict for a mutable copy.")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class Feature(Mapping):
+    '''
+    Compact, read-only GeoJSON feature.
+
+    ``GeoJSON`` stores its features as Feature records instead of nested
+    dictionaries. A record keeps the geometry type, the coordinates, a tuple
+    of property keys shared by every feature with the same keys, and a tuple
+    of property values. The ``type``, ``geometry`` and ``properties``
+    members behave as in a feature dictionary, but the geometry and
+    properties dictionaries are built on access and are read-only. Edit
+    properties with ``GeoJSON.update_properties``, and use ``to_dict`` for
+    mutable dictionaries.
+
+    :param geometry_type: Geometry type name, or None for a null geometry
+    :param coordinates: Nested coordinate lists
+    :param schema: Property keys
+    :param property_values: Property values, in the order of ``schema``
+    '''
+    __slots__ = ('geometry_type', 'coordinates', 'schema', 'property_values')
+
+    def __init__(self, geometry_type: str, coordinates: Any, schema: Tuple[str, ...] = (), property_values: Tuple[Any, ...] = ()):
+        if len(schema) != len(property_values):
+            raise ValueError("Schema and property values must have the same length.")
+        self.geometry_type = _INTERNED.get(geometry_type, geometry_type)
+        self.coordinates = coordinates
+        self.schema = schema
+        self.property_values = property_values
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'type':
+            return 'Feature'
+        if key == 'geometry':
+            return self.geometry
+        if key == 'properties':
+            return self.properties
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_MEMBERS)
+
+    def __len__(self) -> int:
+        return len(_MEMBERS)
+
+    def __repr__(self):
+        return f"Feature(geometry_type={self.geometry_type!r}, properties={self.properties!r})"
+
+    def __reduce__(self):
+        return (Feature, (self.geometry_type, self.coordinates, self.schema, self.property_values))
+
+    @property
+    def geometry(self) -> Union[Dict[str, Any], None]:
+        if self.geometry_type is None:
+            return None
+        return ReadOnlyDict(type=self.geometry_type, coordinates=self.coordinates)
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        return ReadOnlyDict(zip(self.schema, self.property_values))
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        The feature as a plain, mutable dictionary.
+        '''
+        geometry = None
+        if self.geometry_type is not None:
+            geometry = {'type': self.geometry_type, 'coordinates': self.coordinates}
+        return {'type': 'Feature', 'geometry': geometry, 'properties': dict(zip(self.schema, self.property_values))}
+
+    def with_geometry(self, geometry: Union[Dict[str, Any], None]) -> 'Feature':
+        '''
+        Copy of the feature with another geometry and the same properties.
+        '''
+        if geometry is None:
+            return Feature(None, None, self.schema, self.property_values)
+        return Feature(geometry['type'], geometry['coordinates'], self.schema, self.property_values)
+
+    @classmethod
+    def from_dict(cls, feature: Mapping, schemas: Dict[Tuple[str, ...], Tuple[str, ...]] = None) -> 'Feature':
+        '''
+        Builds a record from a feature dictionary. Members other than
+        ``geometry`` and ``properties`` are dropped.
+
+        :param schemas: Dictionary of the schemas seen so far. Features with the same
+            property keys then share one schema tuple.
+        :return: Feature
+        '''
+        if type(feature) is cls and schemas is None:
+            return feature
+        properties = feature.get('properties') or {}
+        schema = tuple(properties)
+        if schemas is not None:
+            schema = schemas.setdefault(schema, schema)
+        geometry = feature.get('geometry')
+        if geometry is None:
+            return cls(None, None, schema, tuple(properties.values()))
+        return cls(geometry.get('type'), geometry.get('coordinates'), schema, tuple(properties.values()))
+
+
+def as_feature(feature: Mapping, geometry: Union[Dict[str, Any], None]) -> Feature:
+    '''
+    Record with the properties of ``feature``, which may be a record or a
+    dictionary, and ``geometry``.
+    '''
+    if type(feature) is Feature:
+        return feature.with_geometry(geometry)
+    return Feature.from_dict({'geometry': geometry, 'properties': feature.get('properties')})
+
+
+def property_values(features: Iterable[Mapping], key: str) -> Iterator[Any]:
+    '''
+    Value of property ``key`` of each feature, None where it is missing.
+    The position of ``key`` is looked up once per schema.
+    '''
+    positions = {}
+    for feature in features:
+        if type(feature) is not Feature:
+            yield (feature.get('properties') or {}).get(key)
+            continue
+        schema = feature.schema
+        # Keyed by id, as hashing a schema tuple costs as much as searching it
+        cached = positions.get(id(schema))
+        if cached is None or cached[0] is not schema:
+            cached = positions[id(schema)] = (schema, schema.index(key) if key in schema else -1)
+        yield feature.property_values[cached[1]] if cached[1] >= 0 else None
+
+
+def property_columns(features: List[Feature]) -> Union[Dict[str, List[Any]], None]:
+    '''
+    Transposes the property tuples of records that all share one schema
+    into columns, without building property dictionaries.
+
+    :return: Dictionary of property key to values, or None when the features
+        are not all records with the same schema or a property holds a nested object
+    '''
+    if not features or any(type(feature) is not Feature for feature in features):
+        return None
+    schema = features[0].schema
+    if any(feature.schema is not schema and feature.schema != schema for feature in features):
+        return None
+    if not schema:
+        return {}
+    columns = {key: list(values) for key, values in zip(schema, zip(*(feature.property_values for feature in features)))}
+    if any(type(value) is dict for values in columns.values() for value in values):
+        return None
+    return columns
+
@@ -0,0 +1,219 @@
+from hashlib import sha256
+from io import TextIOWrapper
+from threading import Lock
+from typing import Dict, List, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+import asyncio
+import http.client
+import json
+import os
+import shutil
+import tempfile
+
+from pandas_geojson.core import GeoJSON
+from pandas_geojson.io import iter_geojson
+
+
+_REDIRECTS = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+
+
+class ConnectionPool:
+    '''
+    Keeps HTTP/1.1 connections open per host so that consecutive requests
+    to the same service reuse them. Safe to share between threads.
+
+    :param timeout: Socket timeout in seconds
+    '''
+    def __init__(self, timeout: float = None):
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = Lock()
+
+    def request(self, url: str, headers: Dict[str, str] = None) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        '''
+        Sends a GET request on a pooled connection.
+
+        :return: The connection and its response. Pass both to ``release`` once the body has been read.
+        '''
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme}")
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        key = (parts.scheme, parts.netloc)
+        while True:
+            connection, reused = self._acquire(key)
+            try:
+                connection.request('GET', target, headers=headers or {})
+                return connection, connection.getresponse()
+            except BaseException as e:
+                connection.close()
+                # The server may have closed an idle connection, retry on a fresh one
+                if not (reused and isinstance(e, (http.client.RemoteDisconnected, ConnectionError))):
+                    raise
+
+    def release(self, connection: http.client.HTTPConnection, response: http.client.HTTPResponse):
+        response.read()
+        if response.will_close:
+            connection.close()
+            return
+        with self._lock:
+            self._idle.setdefault(connection.pool_key, []).append(connection)
+
+    def close(self):
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle = {}
+        for connection in connections:
+            connection.close()
+
+    def _acquire(self, key: Tuple[str, str]) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, netloc = key
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        connection = connection_class(netloc, timeout=self.timeout)
+        connection.pool_key = key
+        return connection, False
+
+
+_default_pool = ConnectionPool()
+
+
+def fetch_geojson_url(url: str, cache_dir: str = None, pool: ConnectionPool = None) -> GeoJSON:
+    '''
+    Downloads and parses a GeoJSON document on a pooled keep-alive connection.
+
+    The response body is parsed as it arrives. With ``cache_dir``, bodies are
+    stored on disk with their ETag and Last-Modified headers, and later
+    requests are made conditional so unchanged documents are read from the cache.
+
+    :param cache_dir: Directory for cached responses
+    :param pool: Connection pool, defaults to a pool shared by the module
+    :return: GeoJSON
+    '''
+    pool = pool or _default_pool
+    headers = {}
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        body_path, meta_path = _cache_paths(cache_dir, url)
+        headers = _conditional_headers(body_path, meta_path)
+
+    for _ in range(_MAX_REDIRECTS + 1):
+        connection, response = pool.request(url, headers)
+        try:
+            if response.status in _REDIRECTS:
+                url = urljoin(url, response.getheader('Location'))
+                pool.release(connection, response)
+                continue
+            if response.status == 304 and cache_dir:
+                pool.release(connection, response)
+                return _read_stream_features(body_path)
+            if response.status != 200:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            if not cache_dir:
+                geojson = _parse_response(response)
+                pool.release(connection, response)
+                return geojson
+            _store(response, body_path, meta_path, url)
+            pool.release(connection, response)
+        except BaseException:
+            # The body may be partly read, so the connection cannot be reused
+            connection.close()
+            raise
+        return _read_stream_features(body_path)
+    raise HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+
+async def aread_geojson_url(url: str, cache_dir: str = None, pool: ConnectionPool = None) -> GeoJSON:
+    '''
+    Asynchronous version of ``read_geojson_url``. The blocking download runs
+    in a worker thread, see ``fetch_geojson_url``.
+
+    :return: GeoJSON
+    '''
+    return await asyncio.to_thread(fetch_geojson_url, url, cache_dir, pool)
+
+
+async def aread_geojson_urls(urls: List[str], concurrency: int = 8, cache_dir: str = None, pool: ConnectionPool = None) -> List[GeoJSON]:
+    '''
+    Fetches several GeoJSON documents concurrently.
+
+    :param concurrency: Maximum number of requests in flight
+    :return: List of GeoJSON in the order of ``urls``
+    '''
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer.")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(url):
+        async with semaphore:
+            return await aread_geojson_url(url, cache_dir=cache_dir, pool=pool)
+
+    return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+
+def read_geojson_urls(urls: List[str], concurrency: int = 8, cache_dir: str = None, pool: ConnectionPool = None) -> List[GeoJSON]:
+    '''
+    Fetches several GeoJSON documents concurrently from synchronous code.
+    Inside a running event loop, await ``aread_geojson_urls`` instead.
+
+    :param concurrency: Maximum number of requests in flight
+    :return: List of GeoJSON in the order of ``urls``
+    '''
+    return asyncio.run(aread_geojson_urls(urls, concurrency=concurrency, cache_dir=cache_dir, pool=pool))
+
+
+def _parse_response(response) -> GeoJSON:
+    stream = TextIOWrapper(response, encoding='utf8')
+    try:
+        features = list(iter_geojson(stream))
+    finally:
+        # Keep the response open so the connection can go back to the pool
+        stream.detach()
+    return GeoJSON(type='Feature Collection', features=features)
+
+
+def _read_stream_features(path: str) -> GeoJSON:
+    return GeoJSON(type='Feature Collection', features=list(iter_geojson(path)))
+
+
+def _cache_paths(cache_dir: str, url: str) -> Tuple[str, str]:
+    key = sha256(url.encode('utf8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}.geojson"), os.path.join(cache_dir, f"{key}.json")
+
+
+def _conditional_headers(body_path: str, meta_path: str) -> Dict[str, str]:
+    if not (os.path.exists(body_path) and os.path.exists(meta_path)):
+        return {}
+    with open(meta_path, encoding='utf8') as f:
+        meta = json.load(f)
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    return headers
+
+
+def _store(response, body_path: str, meta_path: str, url: str):
+    directory = os.path.dirname(body_path)
+    f = tempfile.NamedTemporaryFile('wb', dir=directory, delete=False)
+    try:
+        with f:
+            shutil.copyfileobj(response, f)
+        os.replace(f.name, body_path)
+    except BaseException:
+        # Don't leave a partial download in the cache directory
+        os.unlink(f.name)
+        raise
+    meta = {
+        'url': url,
+        'etag': response.getheader('ETag'),
+        'last_modified': response.getheader('Last-Modified'),
+    }
+    with open(meta_path, 'w', encoding='utf8') as f:
+        json.dump(meta, f)
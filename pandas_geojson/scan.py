@@ -0,0 +1,268 @@
+from typing import Dict, List, Tuple
+import json
+import re
+import numpy as np
+
+
+# JSON strings are matched whole so that brackets inside them are skipped
+_STRING = rb'"(?:[^"\\]|\\.)*"'
+_TOKENS = re.compile(_STRING + rb'|[{}\[\]]', re.DOTALL)
+_FEATURES_ARRAY = re.compile(rb'\s*:\s*\[')
+_ARRAY_END = re.compile(rb'\s*\]')
+_SEPARATOR = re.compile(rb'\s*([,\]])')
+_COLON = re.compile(rb'\s*:\s*')
+_TRAILING = b' \t\r\n,'
+_WHITESPACE = np.frombuffer(b' \t\r\n', dtype=np.uint8)
+_COLON_BYTE = ord(':')
+_BRACKETS = bytes.maketrans(b'[]', b'  ')
+_QUOTE, _OPEN, _CLOSE, _BACKSLASH = ord('"'), ord('{'), ord('}'), ord('\\')
+
+
+def find_features(buffer) -> int:
+    '''
+    Finds the ``features`` array of a top-level FeatureCollection.
+
+    :param buffer: bytes, or any object supporting the buffer protocol such as an mmap
+    :return: Offset just after the opening bracket of the array
+    '''
+    depth = 0
+    for match in _TOKENS.finditer(buffer):
+        char = buffer[match.start()]
+        if char == _QUOTE:
+            if depth == 1 and match.group() == b'"features"':
+                array = _FEATURES_ARRAY.match(buffer, match.end())
+                if array:
+                    return array.end()
+        elif char in b'{[':
+            depth += 1
+        else:
+            depth -= 1
+    raise ValueError("Invalid GeoJSON data: no features array found.")
+
+
+def feature_spans(buffer, start: int = None, structure: 'JSONStructure' = None) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    Records the byte span of every feature object in the ``features`` array
+    without decoding them. Feature boundaries come from the running brace
+    depth of ``JSONStructure``, so coordinates are never visited in Python.
+
+    :param start: Offset just after the opening bracket, found with ``find_features`` by default
+    :param structure: Precomputed structure of the buffer from ``start`` on
+    :return: Arrays of start and end offsets
+    '''
+    if start is None:
+        start = find_features(buffer)
+    empty = np.empty(0, dtype=np.int64)
+    if _ARRAY_END.match(buffer, start):
+        return empty, empty
+    if structure is None:
+        structure = JSONStructure(buffer, start)
+
+    braces, opens = structure.braces, structure.opens
+    depth = np.cumsum(np.where(opens, 1, -1))
+    starts = braces[opens & (depth == 1)]
+    ends = braces[~opens & (depth == 0)] + 1
+    # Objects after the end of the features array are cut off at the first ']' separator
+    for i, end in enumerate(ends.tolist()):
+        separator = _SEPARATOR.match(buffer, end)
+        if separator is None:
+            raise ValueError(f"Invalid GeoJSON data: expected ',' or ']' after the feature at offset {starts[i]}.")
+        if separator.group(1) == b']':
+            return starts[:i + 1], ends[:i + 1]
+    raise ValueError("Invalid GeoJSON data: unterminated features array.")
+
+
+class JSONStructure:
+    '''
+    Positions of the strings and of the braces outside strings in a JSON
+    buffer, found with vectorized byte comparisons. Only escaped quotes are
+    looked at one by one.
+
+    :param buffer: bytes, or any object supporting the buffer protocol such as an mmap
+    :param start: Offset to start from, which must not be inside a string
+    '''
+    __slots__ = ('string_starts', 'string_ends', 'braces', 'opens', '_string_depths')
+
+    def __init__(self, buffer, start: int = 0):
+        data = np.frombuffer(buffer, dtype=np.uint8)[start:]
+        try:
+            quotes = np.flatnonzero(data == _QUOTE)
+            # Only quotes right after a backslash can be escaped
+            candidates = np.flatnonzero(data[np.maximum(quotes - 1, 0)] == _BACKSLASH)
+            escaped = [i for i in candidates.tolist() if quotes[i] > 0 and _escaped(data, quotes[i])]
+            quotes = np.delete(quotes, escaped)
+            braces = np.flatnonzero((data == _OPEN) | (data == _CLOSE))
+            # Braces preceded by an odd number of quotes are inside a string
+            braces = braces[np.searchsorted(quotes, braces) % 2 == 0]
+            self.opens = data[braces] == _OPEN
+        finally:
+            del data
+        self.string_starts = quotes[0::2] + start
+        self.string_ends = quotes[1::2] + start + 1
+        self.braces = braces + start
+        self._string_depths = None
+
+    def string_depths(self) -> np.ndarray:
+        '''
+        Number of objects each string is nested in, computed once.
+        '''
+        if self._string_depths is None:
+            depth = np.cumsum(np.where(self.opens, 1, -1))
+            before = np.searchsorted(self.braces, self.string_starts) - 1
+            self._string_depths = np.where(before >= 0, depth[before.clip(0)], 0)
+        return self._string_depths
+
+
+def member_spans(buffer, start: int, end: int, structure: JSONStructure = None) -> Dict[str, Tuple[int, int]]:
+    '''
+    Records the byte span of every member value of the JSON object spanning
+    ``start:end`` without decoding them. Only the strings and braces of the
+    object are visited, so arrays of numbers are skipped entirely.
+
+    :param structure: Precomputed structure of a buffer containing the object
+    :return: Dictionary of member name to ``(start, end)`` of its value
+    '''
+    if structure is None:
+        structure = JSONStructure(buffer[start:end])
+        offset = start
+        start, end = 0, end - start
+    else:
+        offset = 0
+    first, last = np.searchsorted(structure.string_starts, (start, end))
+    strings = list(zip(structure.string_starts[first:last].tolist(), structure.string_ends[first:last].tolist()))
+    first, last = np.searchsorted(structure.braces, (start, end))
+    braces = list(zip(structure.braces[first:last].tolist(), structure.opens[first:last].tolist()))
+
+    spans = {}
+    key = None
+    value_start = None
+    depth = 0
+    i = 0
+    for position, is_open in braces:
+        # Strings before this brace are at the current depth
+        while i < len(strings) and strings[i][0] < position:
+            string_start, string_end = strings[i]
+            i += 1
+            if depth != 1:
+                continue
+            colon = _COLON.match(buffer, string_end + offset)
+            if colon is None:
+                continue
+            # A string followed by a colon at the top level is the next member name
+            if key is not None:
+                spans[key] = (value_start, _trim(buffer, value_start, string_start + offset))
+            raw = bytes(buffer[string_start + offset:string_end + offset])
+            key = raw[1:-1].decode('utf8') if b'\\' not in raw else json.loads(raw)
+            value_start = colon.end()
+        if is_open:
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            if key is not None:
+                spans[key] = (value_start, _trim(buffer, value_start, position + offset))
+            break
+    return spans
+
+
+def object_members(buffer, starts: np.ndarray, ends: np.ndarray, structure: JSONStructure,
+                   names: List[str], level: int = 1) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    '''
+    Records the byte span of the members ``names`` of many objects at once,
+    such as the features found by ``feature_spans``. Member names are told
+    apart from nested strings and matched with array operations over the
+    whole structure, so no member is visited in Python.
+
+    :param starts: Start offsets of the objects, which must be elements of the array ``structure`` starts in
+    :param ends: End offsets of the objects
+    :param structure: Structure of the buffer from the start of the array on
+    :param names: Member names to find. Names must not contain escape sequences.
+    :param level: Number of objects the objects are nested in, counting themselves:
+        1 for the features, 2 for their ``properties`` objects
+    :return: Dictionary of name to arrays of value start and end offsets, -1 for objects without the member
+    '''
+    if not len(starts):
+        return {name: (np.full(0, -1, dtype=np.int64), np.full(0, -1, dtype=np.int64)) for name in names}
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    try:
+        string_starts, string_ends = structure.string_starts, structure.string_ends
+        first, last = np.searchsorted(string_starts, (starts[0], ends[-1]))
+        candidates = first + np.flatnonzero(structure.string_depths()[first:last] == level)
+        owner = np.searchsorted(starts, string_starts[candidates], side='right') - 1
+        inside = (owner >= 0) & (string_starts[candidates] < ends[owner.clip(0)])
+        candidates, owner = candidates[inside], owner[inside]
+
+        # Member names are the strings of the objects' own level followed by a colon
+        colons = _skip_spaces(data, string_ends[candidates])
+        is_name = data[np.minimum(colons, len(data) - 1)] == _COLON_BYTE
+        candidates, colons, owner = candidates[is_name], colons[is_name], owner[is_name]
+
+        spans = {}
+        lengths = string_ends[candidates] - string_starts[candidates]
+        for name in names:
+            encoded = np.frombuffer(json.dumps(name, ensure_ascii=False).encode('utf8'), dtype=np.uint8)
+            match = np.flatnonzero(lengths == len(encoded))
+            for offset, byte in enumerate(encoded.tolist()):
+                match = match[data[string_starts[candidates[match]] + offset] == byte]
+            value_starts = _skip_spaces(data, colons[match] + 1)
+            # A value ends where the next member name of the same object starts, or at the closing brace
+            value_ends = ends[owner[match]] - 1
+            following = match + 1
+            same = following < len(candidates)
+            same[same] = owner[following[same]] == owner[match[same]]
+            value_ends[same] = string_starts[candidates[following[same]]]
+            value_ends = _trim_trailing(data, value_starts, value_ends)
+            found_starts = np.full(len(starts), -1, dtype=np.int64)
+            found_ends = np.full(len(starts), -1, dtype=np.int64)
+            found_starts[owner[match]] = value_starts
+            found_ends[owner[match]] = value_ends
+            spans[name] = (found_starts, found_ends)
+    finally:
+        # An exported view keeps an mmap from being closed, even from a traceback
+        del data
+    return spans
+
+
+def parse_numbers(buffer, start: int, end: int) -> np.ndarray:
+    '''
+    Parses every number in a span of nested JSON arrays of numbers, such as
+    a ``coordinates`` member, into one flat array.
+    '''
+    text = bytes(buffer[start:end]).translate(_BRACKETS)
+    if not text.strip():
+        return np.empty(0)
+    return np.fromstring(text, sep=',')
+
+
+def _escaped(data: np.ndarray, position: int) -> bool:
+    count = 0
+    while position > count and data[position - count - 1] == _BACKSLASH:
+        count += 1
+    return count % 2 == 1
+
+
+def _skip_spaces(data: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    positions = positions.copy()
+    moving = np.flatnonzero(np.isin(data[np.minimum(positions, len(data) - 1)], _WHITESPACE))
+    while len(moving):
+        positions[moving] += 1
+        moving = moving[np.isin(data[np.minimum(positions[moving], len(data) - 1)], _WHITESPACE)]
+    return positions
+
+
+def _trim_trailing(data: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    ends = ends.copy()
+    trailing = np.frombuffer(_TRAILING, dtype=np.uint8)
+    moving = np.flatnonzero(ends > starts)
+    moving = moving[np.isin(data[ends[moving] - 1], trailing)]
+    while len(moving):
+        ends[moving] -= 1
+        moving = moving[ends[moving] > starts[moving]]
+        moving = moving[np.isin(data[ends[moving] - 1], trailing)]
+    return ends
+
+
+def _trim(buffer, start: int, end: int) -> int:
+    while end > start and buffer[end - 1] in _TRAILING:
+        end -= 1
+    return end
@@ -0,0 +1,142 @@
+from typing import Any, Dict, Iterator, List, Tuple
+import mmap
+import os
+import numpy as np
+from pandas_geojson.backend import loads
+from pandas_geojson.core import GeoJSON
+from pandas_geojson.records import Feature
+from pandas_geojson.validation import GeoJSONValidationError, validate_geometries
+
+
+RECORD_SEPARATOR = b'\x1e'
+_STRIP = RECORD_SEPARATOR + b' \t\r\n'
+
+
+def index_path(filename: str) -> str:
+    '''
+    Path of the sidecar offset index for a GeoJSONSeq file.
+    '''
+    return f"{filename}.idx"
+
+
+class GeoJSONSeq:
+    '''
+    Random access to a newline-delimited GeoJSON file (RFC 8142 or NDJSON).
+
+    The file is memory-mapped and features are parsed only when they are
+    read. Feature offsets come from the sidecar ``.idx`` file written by
+    ``save_geojsonseq(..., index=True)`` when it matches the file, and
+    otherwise from a vectorized scan for line breaks.
+
+    :param filename: Path to the file
+    :param validate: Validation level for the features read, see ``GeoJSON.from_dict``
+    :param engine: JSON engine to use, see ``set_json_engine``
+    '''
+    def __init__(self, filename: str, validate: str = 'structure', engine: str = None):
+        self.filename = filename
+        self.validate = validate
+        self.engine = engine
+        self._file = open(filename, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.offsets = self._read_index(size)
+        if self.offsets is None:
+            self.offsets = self._scan()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Feature index out of range.")
+        return self.take([i]).features[0]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __enter__(self) -> 'GeoJSONSeq':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def take(self, indices: List[int]) -> GeoJSON:
+        '''
+        Parses the features at the given positions only. The result has one
+        feature per position, including features with a null geometry.
+
+        :raises GeoJSONValidationError: Listing the file positions of invalid features
+        :return: GeoJSON
+        '''
+        indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        indices = np.where(indices < 0, indices + len(self), indices)
+        if len(indices) and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError("Feature index out of range.")
+        positions = indices.tolist()
+        features = [self._parse(i) for i in positions]
+        errors = validate_geometries((feature.get('geometry') for feature in features), level=self.validate)
+        if errors:
+            raise GeoJSONValidationError([(positions[index], message) for index, message in errors])
+        schemas = {}
+        return GeoJSON(type='FeatureCollection', features=[Feature.from_dict(feature, schemas) for feature in features])
+
+    def range(self, start: int, stop: int = None) -> GeoJSON:
+        '''
+        Parses the features from ``start`` up to, but not including, ``stop``.
+
+        :return: GeoJSON
+        '''
+        return self.take(range(*slice(start, stop).indices(len(self))))
+
+    def split(self, n_parts: int) -> List[Tuple[int, int]]:
+        '''
+        Splits the features into ``n_parts`` contiguous ``(start, stop)`` ranges
+        of similar byte size, e.g. to hand out to parallel workers.
+        '''
+        if n_parts < 1:
+            raise ValueError("n_parts must be a positive integer.")
+        targets = np.linspace(self.offsets[0], self.offsets[-1], n_parts + 1)
+        bounds = np.unique(np.searchsorted(self.offsets[:-1], targets[1:-1]))
+        edges = [0] + bounds.tolist() + [len(self)]
+        return [(start, stop) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+    def write_index(self):
+        '''
+        Writes the sidecar offset index for later opens.
+        '''
+        self.offsets.astype('<i8').tofile(index_path(self.filename))
+
+    def _parse(self, i: int) -> Dict[str, Any]:
+        return loads(bytes(self._buffer[self.offsets[i]:self.offsets[i + 1]]).strip(_STRIP), engine=self.engine)
+
+    def _read_index(self, size: int):
+        path = index_path(self.filename)
+        if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(self.filename):
+            return None
+        offsets = np.fromfile(path, dtype='<i8')
+        if len(offsets) == 0 or offsets[-1] != size:
+            return None
+        return offsets.astype(np.int64)
+
+    def _scan(self) -> np.ndarray:
+        data = np.frombuffer(self._buffer, dtype=np.uint8)
+        ends = np.flatnonzero(data == ord('\n')) + 1
+        if len(data) and (not len(ends) or ends[-1] != len(data)):
+            ends = np.append(ends, len(data))
+        starts = np.concatenate([[0], ends[:-1]]).astype(np.int64) if len(ends) else np.empty(0, dtype=np.int64)
+        # Drop blank lines, only short lines need to be looked at
+        short = np.flatnonzero(ends - starts <= 8)
+        blank = [i for i in short.tolist() if not bytes(self._buffer[starts[i]:ends[i]]).strip(_STRIP)]
+        keep = np.ones(len(starts), dtype=bool)
+        keep[blank] = False
+        # Features span from their own line start to the next feature's line start
+        offsets = np.append(starts[keep], len(data)).astype(np.int64)
+        return offsets
@@ -0,0 +1,525 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+import math
+import os
+import struct
+import numpy as np
+from pandas_geojson import ops
+from pandas_geojson.arrays import (
+    ColumnarFeatures,
+    GeometryArray,
+    LINESTRING,
+    MULTILINESTRING,
+    MULTIPOINT,
+    MULTIPOLYGON,
+    POINT,
+    POLYGON,
+    expand_ranges,
+    _offsets,
+    _take_ranges,
+)
+from pandas_geojson.backend import dumps
+from pandas_geojson.index import STRtree
+
+
+MAX_LATITUDE = 85.0511287798066
+
+# Geometry types and commands of the Mapbox Vector Tile specification 2.1
+_POINT_TYPE, _LINESTRING_TYPE, _POLYGON_TYPE = 1, 2, 3
+_MOVE_TO, _LINE_TO, _CLOSE_PATH = 1, 2, 7
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    '''
+    Longitude and latitude bounds of a Web Mercator tile.
+
+    :return: ``(minx, miny, maxx, maxy)``
+    '''
+    _check_tile(z, x, y)
+    n = 2 ** z
+    return (x / n * 360 - 180, _latitude((y + 1) / n), (x + 1) / n * 360 - 180, _latitude(y / n))
+
+
+class TileSet:
+    '''
+    Mapbox Vector Tiles of a GeoJSON collection, encoded on request and cached.
+
+    The collection is projected to Web Mercator, indexed with an R-tree, and
+    the Douglas-Peucker importance of every vertex is computed once. A tile
+    then only queries the index, keeps the vertices important enough for its
+    zoom level, clips the candidates to the tile and encodes them, all with
+    array operations over every candidate at once.
+
+    Encoded tiles are kept in an LRU cache keyed by ``(z, x, y)`` and, when
+    ``cache_dir`` is given, written to ``cache_dir/z/x/y.mvt`` so they survive
+    restarts and can be served as static files.
+
+    :param geojson: GeoJSON object with longitude and latitude coordinates
+    :param layer_name: Name of the single layer of every tile
+    :param extent: Number of integer coordinate units across a tile
+    :param buffer: Extent units kept around the tile so features do not get cut at tile edges
+    :param tolerance: Simplification tolerance, in extent units
+    :param cache_size: Maximum number of encoded tiles kept in memory
+    :param cache_dir: Directory of the on-disk tile cache, None to only cache in memory
+    '''
+    def __init__(self,
+                 geojson,
+                 layer_name: str = 'features',
+                 extent: int = 4096,
+                 buffer: int = 64,
+                 tolerance: float = 3.0,
+                 cache_size: int = 4096,
+                 cache_dir: str = None):
+        self.layer_name = layer_name
+        self.extent = extent
+        self.buffer = buffer
+        self.tolerance = tolerance
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self._cache = OrderedDict()
+
+        geometries = geojson._geometry_array()
+        self.geometries = GeometryArray(_project(geometries.coords), geometries.ring_offsets,
+                                        geometries.part_offsets, geometries.geometry_offsets,
+                                        geometries.type_codes)
+        self.importance = ops.vertex_importance(self.geometries)
+        self.tree = STRtree(self.geometries.bounds())
+        # Property dictionaries are only built for the features of encoded tiles
+        self.features = geojson.features if geojson.columnar else list(geojson.features)
+
+    def __repr__(self):
+        return f"TileSet(n_features={len(self.geometries)}, layer_name={self.layer_name!r}, cached={len(self._cache)})"
+
+    def get(self, z: int, x: int, y: int) -> bytes:
+        '''
+        Encoded tile ``z/x/y``, from the memory cache, the disk cache, or encoded now.
+
+        :return: Tile protobuf bytes, empty when no feature touches the tile
+        '''
+        _check_tile(z, x, y)
+        key = (z, x, y)
+        tile = self._cache.get(key)
+        if tile is not None:
+            self._cache.move_to_end(key)
+            return tile
+        path = self._path(z, x, y)
+        if path is not None and os.path.exists(path):
+            with open(path, 'rb') as f:
+                tile = f.read()
+        else:
+            tile = self._encode(z, x, y)
+            if path is not None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Written aside then renamed so concurrent readers never see a partial tile
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(tile)
+                os.replace(path + '.tmp', path)
+        if self.cache_size > 0:
+            self._cache[key] = tile
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tile
+
+    def generate(self, min_zoom: int = 0, max_zoom: int = 14) -> int:
+        '''
+        Encodes every tile touched by a feature bounding box from ``min_zoom``
+        to ``max_zoom``. Use ``cache_dir`` when the pyramid has more tiles than
+        ``cache_size``.
+
+        :return: Number of non-empty tiles
+        '''
+        count = 0
+        for z in range(min_zoom, max_zoom + 1):
+            for x, y in self.tiles(z):
+                count += len(self.get(z, x, y)) > 0
+        return count
+
+    def tiles(self, z: int) -> List[Tuple[int, int]]:
+        '''
+        Tiles of zoom level ``z`` touched by a feature bounding box, buffer included.
+
+        :return: Sorted list of ``(x, y)``
+        '''
+        n = 2 ** z
+        bounds = self.geometries.bounds()
+        bounds = bounds[~np.isnan(bounds).any(axis=1)]
+        margin = self.buffer / self.extent
+        low = np.clip(np.floor(bounds[:, :2] * n - margin), 0, n - 1).astype(np.int64)
+        high = np.clip(np.floor(bounds[:, 2:] * n + margin), 0, n - 1).astype(np.int64)
+        columns = high[:, 0] - low[:, 0] + 1
+        rows = high[:, 1] - low[:, 1] + 1
+        feature = np.repeat(np.arange(len(bounds)), columns * rows)
+        cell = expand_ranges(np.zeros(len(bounds), dtype=np.int64), columns * rows)
+        x = low[feature, 0] + cell // rows[feature]
+        y = low[feature, 1] + cell % rows[feature]
+        keys = np.unique(x * n + y)
+        return list(zip((keys // n).tolist(), (keys % n).tolist()))
+
+    def clear_cache(self):
+        '''
+        Empties the memory cache. Tiles in ``cache_dir`` are kept.
+        '''
+        self._cache.clear()
+
+    def _path(self, z: int, x: int, y: int) -> str:
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, str(z), str(x), f'{y}.mvt')
+
+    def _encode(self, z: int, x: int, y: int) -> bytes:
+        n = 2 ** z
+        scale = n * self.extent
+        margin = self.buffer / scale
+        candidates = self.tree.query(x / n - margin, y / n - margin, (x + 1) / n + margin, (y + 1) / n + margin)
+        if not len(candidates):
+            return b''
+
+        array = self.geometries
+        starts = array.ring_offsets[array.part_offsets[array.geometry_offsets]]
+        vertices = expand_ranges(starts[candidates], starts[candidates + 1] - starts[candidates])
+        array = ops.simplify_by_importance(array.take(candidates), self.importance[vertices] * scale,
+                                           self.tolerance, preserve_topology=False)
+        array = GeometryArray((array.coords * n - (x, y)) * self.extent, array.ring_offsets,
+                              array.part_offsets, array.geometry_offsets, array.type_codes)
+
+        low, high = -self.buffer, self.extent + self.buffer
+        ring_types = array.type_codes[array.ring_geometry_index()]
+        rings = [_clip_points(array, np.isin(ring_types, (POINT, MULTIPOINT)), low, high),
+                 _clip_lines(array, np.isin(ring_types, (LINESTRING, MULTILINESTRING)), low, high),
+                 _clip_polygons(array, np.isin(ring_types, (POLYGON, MULTIPOLYGON)), low, high)]
+        coords = np.concatenate([part[0] for part in rings])
+        ring_offsets = _offsets(np.concatenate([np.diff(part[1]) for part in rings]))
+        ring_geometry = np.concatenate([part[2] for part in rings])
+        ring_kind = np.repeat([_POINT_TYPE, _LINESTRING_TYPE, _POLYGON_TYPE], [len(part[2]) for part in rings])
+        if not len(ring_geometry):
+            return b''
+
+        # Rings are grouped by feature, keeping their order within the feature
+        order = np.argsort(ring_geometry, kind='stable')
+        ring_offsets, vertex_order = _take_ranges(ring_offsets, order)
+        coords, ring_geometry, ring_kind = coords[vertex_order], ring_geometry[order], ring_kind[order]
+
+        stream, stream_offsets = _commands(coords, ring_offsets, ring_geometry, ring_kind)
+        data, byte_offsets = _varints(stream)
+        geometries, first_ring = np.unique(ring_geometry, return_index=True)
+        last_ring = np.append(first_ring[1:], len(ring_geometry))
+        byte_starts = byte_offsets[stream_offsets[first_ring]]
+        byte_ends = byte_offsets[stream_offsets[last_ring]]
+
+        layer = _Layer(self.layer_name, self.extent)
+        for geometry, kind, start, end in zip(geometries.tolist(), ring_kind[first_ring].tolist(),
+                                              byte_starts.tolist(), byte_ends.tolist()):
+            layer.add_feature(self._properties(candidates[geometry]), kind, data[start:end])
+        return _message(3, layer.encode())
+
+    def _properties(self, i: int) -> Dict[str, Any]:
+        if isinstance(self.features, ColumnarFeatures):
+            return self.features.properties[i]
+        return self.features[i].get('properties')
+
+
+class _Layer:
+    '''
+    Builds one tile layer, sharing repeated property keys and values between features.
+    '''
+    def __init__(self, name: str, extent: int):
+        self.name = name
+        self.extent = extent
+        self.features = []
+        self.keys = {}
+        self.values = {}
+
+    def add_feature(self, properties: Dict[str, Any], kind: int, geometry: bytes):
+        tags = []
+        for key, value in (properties or {}).items():
+            if value is None:
+                continue
+            value = _value(value)
+            tags.append(self.keys.setdefault(key, len(self.keys)))
+            tags.append(self.values.setdefault(value, len(self.values)))
+        body = b''
+        if tags:
+            body += _message(2, _varints(np.array(tags))[0])
+        body += _key(3, 0) + _varint(kind) + _message(4, geometry)
+        self.features.append(_message(2, body))
+
+    def encode(self) -> bytes:
+        parts = [_message(1, self.name.encode('utf8'))]
+        parts.extend(self.features)
+        parts.extend(_message(3, key.encode('utf8')) for key in self.keys)
+        parts.extend(_message(4, value) for value in self.values)
+        parts.append(_key(5, 0) + _varint(self.extent))
+        parts.append(_key(15, 0) + _varint(2))
+        return b''.join(parts)
+
+
+def _value(value: Any) -> bytes:
+    '''
+    Encodes a property value as a Value message. Lists and dictionaries are
+    stored as JSON strings.
+    '''
+    if isinstance(value, (bool, np.bool_)):
+        return _key(7, 0) + _varint(int(value))
+    if isinstance(value, (int, np.integer)):
+        value = int(value)
+        if 0 <= value < 2 ** 64:
+            return _key(5, 0) + _varint(value)
+        if -2 ** 63 <= value < 0:
+            return _key(6, 0) + _varint((value << 1) ^ (value >> 63))
+    elif isinstance(value, (float, np.floating)):
+        return _key(3, 1) + struct.pack('<d', value)
+    if not isinstance(value, str):
+        value = dumps(value)
+    return _message(1, value.encode('utf8'))
+
+
+def _clip_points(array: GeometryArray, rings: np.ndarray, low: float, high: float):
+    vertex_ring = array.vertex_ring_index()
+    coords = array.coords
+    keep = rings[vertex_ring] & ((coords >= low) & (coords <= high)).all(axis=1)
+    lengths = np.bincount(vertex_ring[keep], minlength=len(rings))
+    kept = lengths > 0
+    return (np.round(coords[keep]).astype(np.int64), _offsets(lengths[kept]),
+            array.ring_geometry_index()[kept])
+
+
+def _clip_lines(array: GeometryArray, rings: np.ndarray, low: float, high: float):
+    '''
+    Clips every line segment to the box with the Liang-Barsky algorithm and
+    joins the clipped segments back into lines, which are split where they
+    leave the box.
+    '''
+    vertex_ring = array.vertex_ring_index()
+    segments = np.flatnonzero((vertex_ring[:-1] == vertex_ring[1:]) & rings[vertex_ring[:-1]])
+    a, b = array.coords[segments], array.coords[segments + 1]
+    delta = b - a
+    t0, t1 = np.zeros(len(segments)), np.ones(len(segments))
+    keep = np.ones(len(segments), dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p, q in ((-delta, a - low), (delta, high - a)):
+            keep &= ~((p == 0) & (q < 0)).any(axis=1)
+            ratio = q / p
+            t0 = np.maximum(t0, np.where(p < 0, ratio, -np.inf).max(axis=1))
+            t1 = np.minimum(t1, np.where(p > 0, ratio, np.inf).min(axis=1))
+    keep &= t0 <= t1
+    segments, a, delta, t0, t1 = segments[keep], a[keep], delta[keep], t0[keep], t1[keep]
+
+    # A segment continues the previous line unless it enters the box or follows a gap
+    continues = np.zeros(len(segments), dtype=bool)
+    continues[1:] = (segments[1:] == segments[:-1] + 1) & (t1[:-1] == 1) & (t0[1:] == 0)
+    starts = ~continues
+    counts = starts + 1
+    coords = np.empty((counts.sum(), 2))
+    positions = _offsets(counts)[:-1]
+    coords[positions[starts]] = a[starts] + t0[starts, None] * delta[starts]
+    coords[positions + starts] = a + t1[:, None] * delta
+    line = np.repeat(np.cumsum(starts) - 1, counts)
+    ring_geometry = array.ring_geometry_index()[vertex_ring[segments[starts]]]
+    coords, line = _dedupe(np.round(coords).astype(np.int64), line, cyclic=False)
+    lengths = np.bincount(line, minlength=len(ring_geometry))
+    valid = lengths >= 2
+    return coords[valid[line]], _offsets(lengths[valid]), ring_geometry[valid]
+
+
+def _clip_polygons(array: GeometryArray, rings: np.ndarray, low: float, high: float):
+    '''
+    Clips every polygon ring to the box with the Sutherland-Hodgman algorithm,
+    one box edge at a time over all rings. Rings are returned open, without
+    the closing position, with exterior rings clockwise in tile coordinates
+    and holes counterclockwise.
+    '''
+    vertex_ring = array.vertex_ring_index()
+    coords = array.coords
+    keep = rings[vertex_ring]
+    if not keep.any():
+        return np.empty((0, 2), dtype=np.int64), np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64)
+    ring_starts, ring_ends = array.ring_offsets[:-1], array.ring_offsets[1:] - 1
+    closed = rings & (ring_ends > ring_starts)
+    closed[closed] = (coords[ring_starts[closed]] == coords[ring_ends[closed]]).all(axis=1)
+    keep[ring_ends[closed]] = False
+    coords, ring = coords[keep], vertex_ring[keep]
+
+    for axis in (0, 1):
+        for bound, side in ((low, 1), (high, -1)):
+            coords, ring = _clip_half_plane(coords, ring, axis, bound, side)
+    coords, ring = _dedupe(np.round(coords).astype(np.int64), ring, cyclic=True)
+
+    n_rings = len(rings)
+    lengths = np.bincount(ring, minlength=n_rings)
+    area = _signed_areas(coords, ring, n_rings)
+    valid = (lengths >= 3) & (area != 0)
+    # Holes are dropped with their exterior ring
+    exterior = np.zeros(n_rings, dtype=bool)
+    exterior[array.part_offsets[:-1][np.diff(array.part_offsets) > 0]] = True
+    ring_part = array.ring_part_index()
+    parts = np.zeros(len(array.part_offsets) - 1, dtype=bool)
+    parts[ring_part[valid & exterior]] = True
+    valid &= parts[ring_part]
+    coords, ring = coords[valid[ring]], ring[valid[ring]]
+
+    ring_offsets = _offsets(lengths[valid])
+    position = np.cumsum(valid)[ring] - 1
+    positions = np.arange(len(coords))
+    flipped = ((area > 0) != exterior)[ring]
+    first, last = ring_offsets[position[flipped]], ring_offsets[position[flipped] + 1] - 1
+    positions[flipped] = first + last - positions[flipped]
+    return coords[positions], ring_offsets, array.ring_geometry_index()[valid]
+
+
+def _clip_half_plane(coords: np.ndarray, ring: np.ndarray, axis: int, bound: float, side: int):
+    '''
+    One Sutherland-Hodgman pass over open rings. Each vertex outputs the
+    crossing with the edge from its predecessor, if any, then itself if it
+    is inside.
+    '''
+    if not len(coords):
+        return coords, ring
+    first, last = _ring_ends(ring)
+    previous = np.arange(len(ring)) - 1
+    previous[first] = np.flatnonzero(last)
+
+    inside = side * (coords[:, axis] - bound) >= 0
+    crossing = inside != inside[previous]
+    counts = crossing.astype(np.int64) + inside
+    output = _offsets(counts)[:-1]
+    result = np.empty((counts.sum(), 2))
+    before, after = coords[previous[crossing]], coords[crossing]
+    t = (bound - before[:, axis]) / (after[:, axis] - before[:, axis])
+    point = before + t[:, None] * (after - before)
+    point[:, axis] = bound
+    result[output[crossing]] = point
+    result[output[inside] + crossing[inside]] = coords[inside]
+    return result, np.repeat(ring, counts)
+
+
+def _dedupe(coords: np.ndarray, ring: np.ndarray, cyclic: bool):
+    '''
+    Drops repeated consecutive positions, which appear once coordinates are
+    rounded. ``ring`` holds the sorted ring of every vertex. With ``cyclic``,
+    a last position equal to the first one is dropped too.
+    '''
+    if not len(coords):
+        return coords, ring
+    first, last = _ring_ends(ring)
+    repeated = ~first
+    repeated[1:] &= (coords[1:] == coords[:-1]).all(axis=1)
+    if cyclic:
+        ring_first = np.flatnonzero(first)[np.cumsum(first) - 1]
+        repeated |= last & ~first & (coords == coords[ring_first]).all(axis=1)
+    return coords[~repeated], ring[~repeated]
+
+
+def _signed_areas(coords: np.ndarray, ring: np.ndarray, n_rings: int) -> np.ndarray:
+    '''
+    Twice the signed area of every open ring with the surveyor's formula.
+    '''
+    if not len(coords):
+        return np.zeros(n_rings)
+    first, last = _ring_ends(ring)
+    following = np.arange(1, len(ring) + 1)
+    following[last] = np.flatnonzero(first)
+    cross = coords[:, 0] * coords[following, 1] - coords[following, 0] * coords[:, 1]
+    return np.bincount(ring, cross, minlength=n_rings)
+
+
+def _ring_ends(ring: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    Masks of the first and last vertex of every ring, given the sorted ring of every vertex.
+    '''
+    first = np.ones(len(ring), dtype=bool)
+    first[1:] = ring[1:] != ring[:-1]
+    last = np.ones(len(ring), dtype=bool)
+    last[:-1] = first[1:]
+    return first, last
+
+
+def _commands(coords: np.ndarray, ring_offsets: np.ndarray, ring_geometry: np.ndarray, ring_kind: np.ndarray):
+    '''
+    Encodes rings as one stream of geometry commands and zigzag encoded
+    parameters. The cursor carries over between the rings of a feature.
+
+    :return: Command stream and the offset of every ring in it
+    '''
+    lengths = np.diff(ring_offsets)
+    points = ring_kind == _POINT_TYPE
+    sizes = 2 * lengths + np.where(points, 1, np.where(ring_kind == _LINESTRING_TYPE, 2, 3))
+    stream_offsets = _offsets(sizes)
+    stream = np.zeros(stream_offsets[-1], dtype=np.int64)
+
+    vertex_geometry = np.repeat(ring_geometry, lengths)
+    deltas = coords.copy()
+    continued = np.zeros(len(coords), dtype=bool)
+    continued[1:] = vertex_geometry[1:] == vertex_geometry[:-1]
+    deltas[continued] -= coords[np.flatnonzero(continued) - 1]
+    zigzag = (deltas << 1) ^ (deltas >> 63)
+
+    k = np.arange(len(coords)) - np.repeat(ring_offsets[:-1], lengths)
+    start = np.repeat(stream_offsets[:-1], lengths)
+    positions = np.where(np.repeat(points, lengths) | (k == 0), start + 1 + 2 * k, start + 2 + 2 * k)
+    stream[positions] = zigzag[:, 0]
+    stream[positions + 1] = zigzag[:, 1]
+
+    starts = stream_offsets[:-1]
+    stream[starts] = _MOVE_TO | (np.where(points, lengths, 1) << 3)
+    paths = ~points
+    stream[starts[paths] + 3] = _LINE_TO | ((lengths[paths] - 1) << 3)
+    polygons = ring_kind == _POLYGON_TYPE
+    stream[starts[polygons] + 2 + 2 * lengths[polygons]] = _CLOSE_PATH | (1 << 3)
+    return stream, stream_offsets
+
+
+def _varints(values: np.ndarray) -> Tuple[bytes, np.ndarray]:
+    '''
+    Encodes non-negative integers as consecutive protobuf varints.
+
+    :return: Encoded bytes and the byte offset of every value
+    '''
+    values = np.asarray(values).astype(np.uint64)
+    sizes = np.ones(len(values), dtype=np.int64)
+    for shift in range(7, 64, 7):
+        sizes += values >= np.uint64(1 << shift)
+    offsets = _offsets(sizes)
+    data = np.zeros(offsets[-1], dtype=np.uint8)
+    for byte in range(int(sizes.max(initial=0))):
+        has = sizes > byte
+        chunk = (values[has] >> np.uint64(7 * byte)) & np.uint64(0x7f)
+        more = (sizes[has] > byte + 1).astype(np.uint64) << np.uint64(7)
+        data[offsets[:-1][has] + byte] = chunk | more
+    return data.tobytes(), offsets
+
+
+def _varint(value: int) -> bytes:
+    data = bytearray()
+    while value > 0x7f:
+        data.append((value & 0x7f) | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _message(field: int, payload: bytes) -> bytes:
+    return _key(field, 2) + _varint(len(payload)) + payload
+
+
+def _project(coords: np.ndarray) -> np.ndarray:
+    '''
+    Projects longitude and latitude to Web Mercator, scaled so the world
+    spans 0 to 1 with y pointing down.
+    '''
+    x = coords[:, 0] / 360 + 0.5
+    sin = np.sin(np.radians(np.clip(coords[:, 1], -MAX_LATITUDE, MAX_LATITUDE)))
+    y = 0.5 - 0.25 * np.log((1 + sin) / (1 - sin)) / np.pi
+    return np.column_stack([x, y])
+
+
+def _latitude(world_y: float) -> float:
+    return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * world_y))))
+
+
+def _check_tile(z: int, x: int, y: int):
+    if z < 0 or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise ValueError(f"Invalid tile: {z}/{x}/{y}.")
@@ -0,0 +1,244 @@
+from typing import Any, Dict, List, Union
+import numpy as np
+from pandas_geojson.arrays import (
+    GEOMETRY_TYPES,
+    LINESTRING,
+    MULTILINESTRING,
+    MULTIPOINT,
+    MULTIPOLYGON,
+    NULL_GEOMETRY,
+    POINT,
+    POLYGON,
+)
+from pandas_geojson.backend import load
+from pandas_geojson.core import GeoJSON
+
+
+def to_topojson(geojson: GeoJSON, quantization: int = 100000, object_name: str = 'collection') -> Dict[str, Any]:
+    '''
+    Converts a GeoJSON object to a TopoJSON topology.
+
+    Lines and polygon rings are cut where they meet other lines, and every
+    resulting arc is stored once, so borders shared by adjacent polygons are
+    not repeated. Shared arcs are found by hashing the sequences of
+    (quantized) positions, in either direction.
+
+    :param quantization: Number of distinct values per axis. Arcs are delta-encoded
+        integers on that grid. Use None to keep the original coordinates.
+    :param object_name: Name of the GeometryCollection in ``objects``
+    :return: TopoJSON dictionary
+    '''
+    array = geojson._geometry_array()
+    coords = array.coords
+    topology = {'type': 'Topology'}
+    if len(coords):
+        x0, y0 = np.nanmin(coords, axis=0)
+        x1, y1 = np.nanmax(coords, axis=0)
+        topology['bbox'] = [float(x0), float(y0), float(x1), float(y1)]
+
+    if quantization:
+        if quantization < 2:
+            raise ValueError("quantization must be at least 2.")
+        scale = np.array([x1 - x0, y1 - y0]) / (quantization - 1) if len(coords) else np.ones(2)
+        scale[scale == 0] = 1
+        translate = np.array([x0, y0]) if len(coords) else np.zeros(2)
+        positions = np.round((coords - translate) / scale).astype(np.int64)
+        topology['transform'] = {'scale': scale.tolist(), 'translate': translate.tolist()}
+    else:
+        positions = coords
+
+    # Give every distinct position an id so lines can be compared as id sequences
+    points, point_ids = np.unique(positions, axis=0, return_inverse=True)
+    point_ids = point_ids.reshape(-1)
+    lines = _lines(array, point_ids)
+    junctions = _junctions(lines, len(points))
+
+    arcs = []
+    arc_index = {}
+    ring_arcs = [_cut(line, closed, junctions, arcs, arc_index) if line is not None else None for line, closed in lines]
+
+    def encode(arc):
+        arc_points = points[list(arc)]
+        if quantization:
+            arc_points = np.vstack([arc_points[:1], np.diff(arc_points, axis=0)])
+        return arc_points.tolist()
+
+    topology['arcs'] = [encode(arc) for arc in arcs]
+    features = list(geojson.features)
+    topology['objects'] = {object_name: {
+        'type': 'GeometryCollection',
+        'geometries': [
+            _topology_geometry(array, i, positions, ring_arcs, feature.get('properties') or {})
+            for i, feature in enumerate(features)
+        ]
+    }}
+    return topology
+
+
+def read_topojson(source: Union[str, Dict[str, Any]], object_name: str = None, validate: str = 'structure', engine: str = None) -> GeoJSON:
+    '''
+    Reads a TopoJSON topology back into a GeoJSON object.
+
+    :param source: Path to a TopoJSON file or a TopoJSON dictionary
+    :param object_name: Object to read, defaults to the first one
+    :param validate: Validation level, see ``GeoJSON.from_dict``
+    :return: GeoJSON
+    '''
+    if isinstance(source, dict):
+        topology = source
+    else:
+        with open(source, 'rb') as f:
+            topology = load(f, engine=engine)
+    if topology.get('type') != 'Topology':
+        raise ValueError("TopoJSON data must be a Topology object.")
+    objects = topology.get('objects', {})
+    if not objects:
+        return GeoJSON.from_dict({'features': []}, validate=validate)
+    if object_name is None:
+        object_name = next(iter(objects))
+    topology_object = objects[object_name]
+
+    transform = topology.get('transform')
+    if transform:
+        scale = np.asarray(transform['scale'], dtype=np.float64)
+        translate = np.asarray(transform['translate'], dtype=np.float64)
+        arcs = [(np.cumsum(np.asarray(arc, dtype=np.float64).reshape(-1, 2), axis=0) * scale + translate).tolist()
+                for arc in topology.get('arcs', [])]
+    else:
+        scale = translate = None
+        arcs = topology.get('arcs', [])
+
+    def position(coordinates):
+        if scale is None:
+            return list(coordinates)
+        return (np.asarray(coordinates, dtype=np.float64) * scale + translate).tolist()
+
+    def line(indices):
+        coordinates = []
+        for index in indices:
+            arc = arcs[index] if index >= 0 else arcs[~index][::-1]
+            coordinates.extend(arc[1:] if coordinates else arc)
+        return coordinates
+
+    def geometry(topology_geometry):
+        geometry_type = topology_geometry.get('type')
+        if geometry_type is None:
+            return None
+        if geometry_type == 'Point':
+            coordinates = position(topology_geometry['coordinates'])
+        elif geometry_type == 'MultiPoint':
+            coordinates = [position(point) for point in topology_geometry['coordinates']]
+        elif geometry_type == 'LineString':
+            coordinates = line(topology_geometry['arcs'])
+        elif geometry_type in ('MultiLineString', 'Polygon'):
+            coordinates = [line(indices) for indices in topology_geometry['arcs']]
+        elif geometry_type == 'MultiPolygon':
+            coordinates = [[line(indices) for indices in polygon] for polygon in topology_geometry['arcs']]
+        else:
+            raise ValueError(f"Invalid geometry type: {geometry_type}")
+        return {'type': geometry_type, 'coordinates': coordinates}
+
+    if topology_object.get('type') == 'GeometryCollection':
+        geometries = topology_object.get('geometries', [])
+    else:
+        geometries = [topology_object]
+    features = [
+        {'type': 'Feature', 'geometry': geometry(g), 'properties': g.get('properties') or {}}
+        for g in geometries
+    ]
+    return GeoJSON.from_dict({'features': features}, validate=validate)
+
+
+def _lines(array, point_ids: np.ndarray) -> List[Any]:
+    '''
+    Point id sequence of every ring, with repeated consecutive positions
+    removed and the closing position of polygon rings dropped.
+    '''
+    ring_types = array.type_codes[array.ring_geometry_index()]
+    lines = []
+    for ring, ring_type in enumerate(ring_types.tolist()):
+        if ring_type in (POINT, MULTIPOINT):
+            lines.append((None, False))
+            continue
+        ids = point_ids[array.ring_offsets[ring]:array.ring_offsets[ring + 1]]
+        if len(ids):
+            ids = ids[np.r_[True, ids[1:] != ids[:-1]]]
+        closed = ring_type in (POLYGON, MULTIPOLYGON)
+        if closed and len(ids) > 1 and ids[0] == ids[-1]:
+            ids = ids[:-1]
+        lines.append((ids, closed))
+    return lines
+
+
+def _junctions(lines: List[Any], n_points: int) -> np.ndarray:
+    '''
+    Marks the positions where lines meet and then diverge, i.e. positions
+    seen with more than one distinct pair of neighbours, plus line endpoints.
+    '''
+    junctions = np.zeros(n_points, dtype=bool)
+    triples = []
+    for ids, closed in lines:
+        if ids is None or len(ids) == 0:
+            continue
+        if closed:
+            previous, following = np.roll(ids, 1), np.roll(ids, -1)
+            center = ids
+        else:
+            junctions[ids[[0, -1]]] = True
+            previous, center, following = ids[:-2], ids[1:-1], ids[2:]
+        triples.append(np.stack([center, np.minimum(previous, following), np.maximum(previous, following)], axis=1))
+    if triples:
+        neighbours = np.unique(np.concatenate(triples), axis=0)
+        junctions |= np.bincount(neighbours[:, 0], minlength=n_points) > 1
+    return junctions
+
+
+def _cut(line: np.ndarray, closed: bool, junctions: np.ndarray, arcs: List[tuple], arc_index: Dict[tuple, int]) -> List[int]:
+    ids = line.tolist()
+    if not ids:
+        return []
+    if closed:
+        cuts = np.flatnonzero(junctions[line])
+        # Rings without junctions start at their smallest id so that equal rings hash the same
+        start = int(cuts[0]) if len(cuts) else int(np.argmin(line))
+        ids = ids[start:] + ids[:start] + [ids[start]]
+        cuts = [k for k in range(len(ids)) if junctions[ids[k]]] if len(cuts) else []
+        cuts = sorted(set([0, len(ids) - 1] + cuts))
+    else:
+        if len(ids) == 1:
+            ids = ids * 2
+        cuts = sorted(set([0, len(ids) - 1] + [k for k in range(len(ids)) if junctions[ids[k]]]))
+    return [_add_arc(tuple(ids[a:b + 1]), arcs, arc_index) for a, b in zip(cuts[:-1], cuts[1:])]
+
+
+def _add_arc(arc: tuple, arcs: List[tuple], arc_index: Dict[tuple, int]) -> int:
+    index = arc_index.get(arc)
+    if index is not None:
+        return index
+    index = arc_index.get(arc[::-1])
+    if index is not None:
+        return ~index
+    arc_index[arc] = len(arcs)
+    arcs.append(arc)
+    return len(arcs) - 1
+
+
+def _topology_geometry(array, i: int, positions: np.ndarray, ring_arcs: List[List[int]], properties: Dict[str, Any]) -> Dict[str, Any]:
+    code = array.type_codes[i]
+    if code == NULL_GEOMETRY:
+        return {'type': None, 'properties': properties}
+    geometry_type = GEOMETRY_TYPES[code]
+    parts = range(array.geometry_offsets[i], array.geometry_offsets[i + 1])
+    polygons = [[ring for ring in range(array.part_offsets[part], array.part_offsets[part + 1])] for part in parts]
+
+    if code in (POINT, MULTIPOINT):
+        ring = polygons[0][0]
+        points = positions[array.ring_offsets[ring]:array.ring_offsets[ring + 1]].tolist()
+        return {'type': geometry_type, 'coordinates': points[0] if code == POINT else points, 'properties': properties}
+    if code == LINESTRING:
+        arcs = ring_arcs[polygons[0][0]]
+    elif code in (MULTILINESTRING, POLYGON):
+        arcs = [ring_arcs[ring] for ring in polygons[0]]
+    else:
+        arcs = [[ring_arcs[ring] for ring in polygon] for polygon in polygons]
+    return {'type': geometry_type, 'arcs': arcs, 'properties': properties}
@@ -0,0 +1,156 @@
+from typing import Any, Dict, Iterable, List, Tuple, Union
+import numpy as np
+from pandas_geojson.arrays import (
+    GeometryArray,
+    GEOMETRY_TYPES,
+    LINESTRING,
+    MULTILINESTRING,
+    MULTIPOLYGON,
+    POLYGON,
+)
+
+
+VALIDATION_LEVELS = ('none', 'structure', 'full')
+
+
+class GeoJSONValidationError(ValueError):
+    '''
+    Raised when one or more features fail validation.
+
+    :param errors: List of ``(feature index, message)`` pairs
+    '''
+    def __init__(self, errors: List[Tuple[int, str]]):
+        self.errors = sorted(errors, key=lambda error: error[0])
+        details = '; '.join(f"feature {index}: {message}" for index, message in self.errors[:10])
+        if len(self.errors) > 10:
+            details += f"; and {len(self.errors) - 10} more"
+        super().__init__(f"{len(self.indices)} invalid feature(s): {details}")
+
+    @property
+    def indices(self) -> List[int]:
+        return sorted({index for index, _ in self.errors})
+
+
+def validate_features(features: Iterable[Dict[str, Any]], level: str = 'full'):
+    '''
+    Validates a whole collection of features at once.
+
+    ``'structure'`` applies the same checks as the geometry classes.
+    ``'full'`` also requires finite coordinates within longitude/latitude
+    ranges, at least two positions per line and closed polygon rings of at
+    least four positions. ``'none'`` skips validation.
+
+    :raises GeoJSONValidationError: Listing every invalid feature
+    '''
+    errors = validate_geometries((feature.get('geometry') for feature in features), level=level)
+    if errors:
+        raise GeoJSONValidationError(errors)
+
+
+def validate_geometries(geometries: Iterable[Union[Dict[str, Any], None]], level: str = 'full') -> List[Tuple[int, str]]:
+    '''
+    Checks geometry dictionaries and collects the problems found. Null
+    geometries are ignored.
+
+    :return: List of ``(geometry index, message)`` pairs
+    '''
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(f"Invalid validation level: {level}. Must be one of {', '.join(VALIDATION_LEVELS)}.")
+    if level == 'none':
+        return []
+
+    errors = []
+    valid = []
+    positions = []
+    for index, geometry in enumerate(geometries):
+        if geometry is None:
+            continue
+        message = _check_structure(geometry)
+        if message:
+            errors.append((index, message))
+        else:
+            valid.append(geometry)
+            positions.append(index)
+
+    if level == 'full' and valid:
+        errors.extend(_check_values(valid, positions))
+    return errors
+
+
+def _check_structure(geometry: Dict[str, Any]) -> Union[str, None]:
+    if not isinstance(geometry, dict):
+        return "Geometry must be an object."
+    geometry_type = geometry.get('type')
+    if geometry_type not in GEOMETRY_TYPES:
+        return f"Invalid geometry type: {geometry_type}"
+    coordinates = geometry.get('coordinates', [])
+
+    if geometry_type == 'Point':
+        if not isinstance(coordinates, list) or len(coordinates) != 2:
+            return "Coordinates must be provided as a list of two numerical values (longitude and latitude)."
+        if not all(isinstance(coord, (int, float)) for coord in coordinates):
+            return "Coordinates must be numerical values."
+        return None
+
+    if geometry_type in ('MultiPoint', 'LineString'):
+        lines = [coordinates]
+    elif geometry_type in ('MultiLineString', 'Polygon'):
+        lines = coordinates
+    else:
+        lines = [ring for polygon in coordinates for ring in polygon]
+    for line in lines:
+        if not isinstance(line, list) or not all(isinstance(coord, list) and len(coord) == 2 for coord in line):
+            return f"Each coordinate pair in {geometry_type} geometry must contain two elements (longitude and latitude)."
+    return None
+
+
+def _check_values(geometries: List[Dict[str, Any]], positions: List[int]) -> List[Tuple[int, str]]:
+    errors = []
+    try:
+        array = GeometryArray.from_geometries(geometries)
+    except (TypeError, ValueError):
+        # Find the geometries with non-numerical coordinates and check the rest
+        numeric = []
+        for geometry, position in zip(geometries, positions):
+            try:
+                GeometryArray.from_geometries([geometry])
+            except (TypeError, ValueError):
+                errors.append((position, "Coordinates must be numerical values."))
+            else:
+                numeric.append((geometry, position))
+        if not numeric:
+            return errors
+        geometries, positions = map(list, zip(*numeric))
+        array = GeometryArray.from_geometries(geometries)
+
+    positions = np.asarray(positions)
+    coords = array.coords
+    vertex_geometry = array.vertex_geometry_index()
+
+    bad = ~np.isfinite(coords).all(axis=1)
+    for i in np.unique(vertex_geometry[bad]):
+        errors.append((int(positions[i]), "Coordinates must be finite."))
+    out_of_range = ~bad & ((np.abs(coords[:, 0]) > 180) | (np.abs(coords[:, 1]) > 90))
+    for i in np.unique(vertex_geometry[out_of_range]):
+        errors.append((int(positions[i]), "Coordinates must be within longitude [-180, 180] and latitude [-90, 90]."))
+
+    ring_geometry = array.ring_geometry_index()
+    ring_types = array.type_codes[ring_geometry]
+    ring_lengths = np.diff(array.ring_offsets)
+
+    short_lines = np.isin(ring_types, (LINESTRING, MULTILINESTRING)) & (ring_lengths < 2)
+    for i in np.unique(ring_geometry[short_lines]):
+        errors.append((int(positions[i]), "Lines must contain at least two positions."))
+
+    polygon_rings = np.isin(ring_types, (POLYGON, MULTIPOLYGON))
+    short_rings = polygon_rings & (ring_lengths < 4)
+    for i in np.unique(ring_geometry[short_rings]):
+        errors.append((int(positions[i]), "Polygon rings must contain at least four positions."))
+
+    rings = np.flatnonzero(polygon_rings & ~short_rings)
+    first = coords[array.ring_offsets[rings]]
+    last = coords[array.ring_offsets[rings + 1] - 1]
+    open_rings = rings[(first != last).any(axis=1)]
+    for i in np.unique(ring_geometry[open_rings]):
+        errors.append((int(positions[i]), "Polygon rings must be closed (first and last positions equal)."))
+    return errors
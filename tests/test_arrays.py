@@ -0,0 +1,37 @@
+import os
+import numpy as np
+import pandas_geojson as pdg
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+MIXED = {'type': 'FeatureCollection', 'features': [
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1, 2]}, 'properties': {'i': 0}},
+    {'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': [[0.5, 0.5], [1.5, 2.5]]}, 'properties': {'i': 1}},
+    {'type': 'Feature', 'geometry': {'type': 'MultiPolygon', 'coordinates': [
+        [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]],
+        [[[2.0, 2.0], [3.0, 2.0], [3.0, 3.0], [2.0, 2.0]], [[2.2, 2.2], [2.8, 2.2], [2.8, 2.8], [2.2, 2.2]]]]},
+     'properties': {'i': 2, 'nested': {'a': [1, 2]}}},
+]}
+
+
+def test_columnar_matches_list_storage():
+    features = pdg.read_geojson(DATASET)
+    columnar = pdg.read_geojson(DATASET, columnar=True)
+    assert columnar.columnar and not features.columnar
+    assert columnar.to_dict() == features.to_dict()
+    assert features.to_columnar().to_dict() == features.to_dict()
+    assert isinstance(columnar.features.geometries.coords, np.ndarray)
+
+
+def test_columnar_mixed_geometries():
+    geojson = pdg.GeoJSON.from_dict(MIXED, columnar=True)
+    assert geojson.to_dict() == pdg.GeoJSON.from_dict(MIXED).to_dict()
+    assert geojson.features[2]['properties'] == {'i': 2, 'nested': {'a': [1, 2]}}
+    geojson.remove_features([1])
+    assert [f['properties']['i'] for f in geojson.features] == [0, 2]
+
+
+def test_columnar_coordinates_are_floats():
+    geojson = pdg.GeoJSON.from_dict(MIXED, columnar=True)
+    coordinates = geojson.to_dict()['features'][0]['geometry']['coordinates']
+    assert coordinates == [1.0, 2.0] and all(type(value) is float for value in coordinates)
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+import pandas_geojson as pdg
+
+pytest.importorskip('pyarrow')
+
+
+FEATURES = [
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1.0, 2.0]},
+     'properties': {'count': 1, 'nested': {'x': 1, 'y': [1, 2]}, 'tags': [1, 2], 'mixed': 'a'}},
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [3.0, 4.0]},
+     'properties': {'count': None, 'nested': {'x': 2}, 'tags': [3], 'mixed': 4}},
+]
+
+
+@pytest.fixture(params=['parquet', 'feather'])
+def saved(request, tmp_path):
+    geojson = pdg.GeoJSON.from_dict({'type': 'FeatureCollection', 'features': FEATURES})
+    path = str(tmp_path / f'data.{request.param}')
+    if request.param == 'parquet':
+        geojson.to_parquet(path)
+        return path, pdg.read_geoparquet
+    geojson.to_feather(path)
+    return path, pdg.read_feather
+
+
+def test_round_trip_keeps_properties(saved):
+    path, read = saved
+    features = read(path).to_dict()['features']
+    assert [feature['properties'] for feature in features] == [feature['properties'] for feature in FEATURES]
+    assert type(features[0]['properties']['count']) is int
+
+
+def test_dataframe_keeps_nullable_integers(saved):
+    path, read = saved
+    data = read(path, as_dataframe=True)
+    assert data['properties.count'].dtype == pd.Int64Dtype()
+    assert data['properties.count'].isna().tolist() == [False, True]
+    assert data['properties.nested.x'].tolist() == [1, 2]
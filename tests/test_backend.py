@@ -0,0 +1,88 @@
+import json
+import math
+import os
+import numpy as np
+import pytest
+import pandas_geojson as pdg
+from pandas_geojson.backend import ENGINES, dumps, loads
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+DOCUMENT = {
+    'type': 'FeatureCollection',
+    'features': [
+        {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [-0.1, 51.5]},
+         'properties': {'name': 'Zürich / "quoted"', 'count': 3, 'share': 0.25, 'flag': True,
+                        'missing': None, 'nested': {'tags': ['a', 'b']}}},
+    ],
+}
+
+
+SPECIAL = {
+    'floats': [1e-07, 1e16, -0.0, 5e-324, 1.2345678901234567e+21, float('nan'), float('inf')],
+    'text': 'é / \u2028 \x00 \n "😀"',
+    'numpy': np.array([[0.1, np.nan, 1e-07]]),
+    'float32': np.array([0.1, 3.4e38], dtype=np.float32),
+    'scalars': [np.int64(7), np.float32(0.2), np.bool_(True)],
+    'empty': [{}, []],
+}
+
+
+@pytest.fixture(params=ENGINES[1:])
+def engine(request):
+    if request.param not in pdg.available_engines():
+        pytest.skip(f"{request.param} is not installed")
+    return request.param
+
+
+@pytest.fixture(params=[name for name in ENGINES[1:] if name != 'simdjson'])
+def writer(request):
+    if request.param not in pdg.available_engines():
+        pytest.skip(f"{request.param} is not installed")
+    return request.param
+
+
+def test_loads_matches_standard_library(engine):
+    with open(DATASET, encoding='utf8') as f:
+        text = f.read()
+    assert loads(text, engine=engine) == json.loads(text)
+
+
+def test_dumps_round_trips(engine):
+    assert json.loads(dumps(DOCUMENT, engine=engine)) == DOCUMENT
+    assert json.loads(dumps(DOCUMENT, indent=2, engine=engine)) == DOCUMENT
+
+
+@pytest.mark.parametrize('indent', [None, 2, 4])
+def test_dumps_matches_standard_library(writer, indent):
+    assert dumps(SPECIAL, indent=indent, engine=writer) == dumps(SPECIAL, indent=indent, engine='json')
+    assert dumps(DOCUMENT, indent=indent, engine=writer) == dumps(DOCUMENT, indent=indent, engine='json')
+
+
+def test_dumps_format():
+    text = dumps(SPECIAL, engine='json')
+    assert text.startswith('{"floats":[1e-7,1e16,-0.0,5e-324,1.2345678901234568e21,null,null],"text":"é /')
+    assert '"float32":[0.1,3.4e38]' in text
+    assert json.loads(text)['numpy'] == [[0.1, None, 1e-07]]
+    assert math.copysign(1, json.loads(text)['floats'][2]) == -1
+
+
+def test_dumps_numpy_values(engine):
+    value = {'array': np.array([[1.5, 2.0]]), 'int': np.int64(7), 'float': np.float32(0.5)}
+    assert json.loads(dumps(value, engine=engine)) == {'array': [[1.5, 2.0]], 'int': 7, 'float': 0.5}
+
+
+def test_read_matches_across_engines(engine):
+    expected = pdg.read_geojson(DATASET, engine='json').to_dict()
+    assert pdg.read_geojson(DATASET, engine=engine).to_dict() == expected
+
+
+def test_save_is_byte_identical_across_engines(writer, tmp_path):
+    geojson = pdg.read_geojson(DATASET)
+    saved = {}
+    for name in ('json', writer):
+        path = tmp_path / f'{name}.geojson'
+        pdg.save_geojson(geojson, str(path), engine=name)
+        saved[name] = path.read_bytes()
+    assert saved[writer] == saved['json']
+    assert pdg.read_geojson(str(tmp_path / 'json.geojson')).to_dict() == geojson.to_dict()
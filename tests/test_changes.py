@@ -0,0 +1,90 @@
+import os
+import pytest
+import pandas_geojson as pdg
+from pandas_geojson.core import Point
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+
+
+def save(geojson, path):
+    pdg.save_geojson(geojson, str(path))
+    return path.read_bytes()
+
+
+def test_tracked_save_matches_untracked(tmp_path):
+    untracked = save(pdg.read_geojson(DATASET), tmp_path / 'untracked.geojson')
+    tracked = pdg.read_geojson(DATASET).track_changes()
+    assert save(tracked, tmp_path / 'tracked.geojson') == untracked
+    # The second save reuses the encoded features
+    assert save(tracked, tmp_path / 'tracked.geojson') == untracked
+
+
+def test_incremental_save_matches_full_save(tmp_path, monkeypatch):
+    import pandas_geojson.changes as changes
+    tracked = pdg.read_geojson(DATASET).track_changes()
+    save(tracked, tmp_path / 'tracked.geojson')
+    tracked.update_properties([0, 2], {'Obesity': None, 'Reviewed': True})
+    tracked.remove_features([5])
+    tracked.add_features([Point([1.0, 2.0], {'NAME': 'New'})])
+    encoded = []
+    dumps = changes.dumps
+    monkeypatch.setattr(changes, 'dumps', lambda feature, engine=None: encoded.append(feature) or dumps(feature, engine=engine))
+    incremental = save(tracked, tmp_path / 'tracked.geojson')
+    assert [feature['properties']['NAME'] for feature in encoded] == [tracked.features[i]['properties']['NAME'] for i in (0, 2, -1)]
+    untracked = pdg.GeoJSON(type=tracked.type, features=list(tracked.features))
+    assert incremental == save(untracked, tmp_path / 'untracked.geojson')
+
+
+def test_update_properties_merges_patch():
+    geojson = pdg.read_geojson(DATASET)
+    geojson.update_properties([0], {'Obesity': None, 'Extra': {'a': 1}})
+    geojson.update_properties([0], {'Extra': {'b': 2}})
+    properties = geojson.features[0]['properties']
+    assert 'Obesity' not in properties
+    assert properties['Extra'] == {'a': 1, 'b': 2}
+    with pytest.raises(ValueError):
+        geojson.update_properties([0], ['not a patch'])
+
+
+def test_remove_features_by_mask():
+    geojson = pdg.read_geojson(DATASET)
+    names = [feature['properties']['NAME'] for feature in geojson.features]
+    geojson.remove_features([name.startswith('N') for name in names])
+    assert [feature['properties']['NAME'] for feature in geojson.features] == [name for name in names if not name.startswith('N')]
+    with pytest.raises(IndexError):
+        geojson.remove_features([100])
+
+
+def test_diff_merge_patch_and_log():
+    geojson = pdg.read_geojson(DATASET).track_changes()
+    with pytest.raises(ValueError):
+        pdg.read_geojson(DATASET).diff()
+    geojson.update_properties([0], {'Obesity': 1.0})
+    geojson.remove_features([1])
+    geojson.add_features([Point([1.0, 2.0], {'NAME': 'New'})])
+    patch = geojson.diff()
+    assert patch['0'] == {'properties': {'Obesity': 1.0}}
+    assert patch['1'] is None
+    assert patch['51']['properties'] == {'NAME': 'New'}
+    assert [entry['op'] for entry in geojson.diff(format='log', clear=True)] == ['update', 'remove', 'add']
+    assert geojson.diff() == {}
+    # Ids stay stable after removals
+    geojson.update_properties([0], {'Obesity': 2.0})
+    geojson.update_properties([1], {'Obesity': 3.0})
+    assert set(geojson.diff()) == {'0', '2'}
+
+
+def test_merge_patch_applies_to_original():
+    geojson = pdg.read_geojson(DATASET).track_changes()
+    original = geojson.to_dict()
+    geojson.update_properties([3], {'NAME': 'Renamed', 'Obesity': None})
+    patched = pdg.merge_patch(original['features'][3], geojson.diff()['3'])
+    assert patched == geojson.to_dict()['features'][3]
+
+
+def test_untracked_edits_are_detected():
+    geojson = pdg.read_geojson(DATASET).track_changes()
+    geojson.features.pop()
+    with pytest.raises(ValueError, match='track_changes'):
+        geojson.diff()
@@ -0,0 +1,92 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import pandas_geojson as pdg
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+NESTED = {'type': 'FeatureCollection', 'features': [
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1.0, 2.0]},
+     'properties': {'name': 'a', 'count': 1, 'nested': {'x': 1, 'deep': {'y': 'z'}}, 'tags': [1, 2]}},
+    {'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': [[0.0, 0.0], [1.0, 1.0]]},
+     'properties': {'name': None, 'share': 0.5, 'nested': {'x': 2}}},
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [3.0, 4.0]}, 'properties': {}},
+]}
+
+
+def test_from_dataframe_missing_values_and_numpy_types():
+    df = pd.DataFrame({
+        'geometry.type': ['Point', 'Point', 'Point'],
+        'geometry.coordinates': [[1.0, 2.0], [3.0, 4.0], np.array([5.0, 6.0])],
+        'count': np.array([1, 2, 3], dtype=np.int64),
+        'share': [0.5, np.nan, 1.5],
+        'name': ['a', None, 'c'],
+        'flag': np.array([True, False, True]),
+    })
+    geojson = pdg.GeoJSON.from_dataframe(df, property_col_list=['count', 'share', 'name', 'flag'])
+    properties = [feature['properties'] for feature in geojson.features]
+    assert properties[1] == {'count': 2, 'share': None, 'name': None, 'flag': False}
+    assert all(type(props['count']) is int and type(props['flag']) is bool for props in properties)
+    # Plain Python values, so the standard library can encode them
+    data = json.loads(json.dumps(geojson.to_dict(), default=list))
+    assert data['features'][2]['geometry'] == {'type': 'Point', 'coordinates': [5.0, 6.0]}
+
+
+def test_from_dataframe_round_trips_to_dataframe():
+    geojson = pdg.read_geojson(DATASET)
+    df = geojson.to_dataframe()
+    columns = [column for column in df.columns if column.startswith('properties.')]
+    rebuilt = pdg.GeoJSON.from_dataframe(df, property_col_list=columns)
+    assert [feature['geometry'] for feature in rebuilt.features] == [feature['geometry'] for feature in geojson.features]
+    assert [list(feature['properties'].values()) for feature in rebuilt.features] == \
+        [list(feature['properties'].values()) for feature in geojson.features]
+
+
+def names(geojson):
+    return [feature['properties']['NAME'] for feature in geojson.features]
+
+
+def test_filter_many_matches_filter_geojson():
+    geojson = pdg.read_geojson(DATASET)
+    groups = {'south': ['Texas', 'Florida'], 'west': ['Utah', 'Nevada', 'Nowhere'], 'none': []}
+    result = geojson.filter_many(groups, 'NAME')
+    assert {name: names(part) for name, part in result.items()} == \
+        {name: names(geojson.filter_geojson(values, 'NAME')) for name, values in groups.items()}
+    assert names(result['west']) == [name for name in names(geojson) if name in ('Utah', 'Nevada')]
+    assert [names(part) for part in geojson.filter_many([['Texas'], ['Utah']], 'NAME')] == [['Texas'], ['Utah']]
+    assert names(geojson.to_columnar().filter_geojson(['Texas'], 'NAME')) == ['Texas']
+
+
+def test_property_index_follows_edits():
+    geojson = pdg.read_geojson(DATASET)
+    assert names(geojson.filter_geojson(['Texas'], 'NAME')) == ['Texas']
+    position = names(geojson).index('Texas')
+    geojson.update_properties([position], {'NAME': 'Lone Star'})
+    assert names(geojson.filter_geojson(['Texas'], 'NAME')) == []
+    assert names(geojson.filter_geojson(['Lone Star'], 'NAME')) == ['Lone Star']
+    geojson.remove_features([position])
+    assert names(geojson.filter_geojson(['Lone Star'], 'NAME')) == []
+    geojson.add_features([pdg.Point([1.0, 2.0], {'NAME': 'Lone Star'})])
+    assert len(geojson.filter_geojson(['Lone Star'], 'NAME').features) == 1
+
+
+def test_property_index_follows_replaced_features():
+    geojson = pdg.read_geojson(DATASET)
+    assert len(geojson.filter_geojson(['Texas'], 'NAME').features) == 1
+    geojson.features = list(reversed(pdg.read_geojson(DATASET, where={'NAME': 'Utah'}).features * len(geojson.features)))
+    assert len(geojson.filter_geojson(['Texas'], 'NAME').features) == 0
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+@pytest.mark.parametrize('source', ['dataset', 'nested'])
+def test_to_dataframe_matches_json_normalize(source, columnar):
+    if source == 'dataset':
+        geojson = pdg.read_geojson(DATASET, columnar=columnar)
+    else:
+        geojson = pdg.GeoJSON.from_dict(NESTED, columnar=columnar)
+    expected = pd.json_normalize(geojson.to_dict()['features'])
+    pd.testing.assert_frame_equal(geojson.to_dataframe(), expected)
+    pd.testing.assert_frame_equal(geojson.to_dataframe(geometry=False),
+                                  expected.drop(columns=['geometry.type', 'geometry.coordinates']))
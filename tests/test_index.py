@@ -0,0 +1,60 @@
+import os
+import numpy as np
+import pytest
+import pandas_geojson as pdg
+from pandas_geojson.index import STRtree
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+
+
+def brute_force(bounds, box):
+    minx, miny, maxx, maxy = box
+    return np.flatnonzero((bounds[:, 0] <= maxx) & (bounds[:, 2] >= minx) & (bounds[:, 1] <= maxy) & (bounds[:, 3] >= miny))
+
+
+@pytest.fixture
+def boxes():
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 100, (2000, 2))
+    bounds = np.hstack([corners, corners + rng.uniform(0, 5, (2000, 2))])
+    bounds[::97] = np.nan
+    queries = np.hstack([rng.uniform(-5, 100, (200, 2)), np.zeros((200, 2))])
+    queries[:, 2:] = queries[:, :2] + rng.uniform(0, 20, (200, 2))
+    return bounds, queries
+
+
+@pytest.mark.parametrize('node_capacity', [2, 4, 16])
+def test_query_matches_brute_force(boxes, node_capacity):
+    bounds, queries = boxes
+    tree = STRtree(bounds, node_capacity=node_capacity)
+    assert len(tree) == len(bounds) - len(bounds[::97])
+    for box in queries:
+        assert tree.query(*box).tolist() == brute_force(bounds, box).tolist()
+
+
+def test_query_many_matches_single_queries(boxes):
+    bounds, queries = boxes
+    tree = STRtree(bounds)
+    query_positions, items = tree.query_many(queries)
+    expected = [(i, item) for i, box in enumerate(queries) for item in brute_force(bounds, box).tolist()]
+    assert list(zip(query_positions.tolist(), items.tolist())) == expected
+
+
+def test_empty_tree():
+    tree = STRtree(np.empty((0, 4)))
+    assert tree.query(0, 0, 1, 1).tolist() == []
+    assert [array.tolist() for array in tree.query_many([[0, 0, 1, 1]])] == [[], []]
+    with pytest.raises(ValueError):
+        STRtree(np.empty((0, 4)), node_capacity=1)
+
+
+def test_geojson_queries_match_bounds():
+    geojson = pdg.read_geojson(DATASET)
+    bounds = geojson.bounds()
+    box = (-100, 30, -90, 40)
+    expected = [geojson.features[i]['properties']['NAME'] for i in brute_force(bounds, box)]
+    assert [f['properties']['NAME'] for f in geojson.query_bbox(*box).features] == expected
+    point = [f['properties']['NAME'] for f in geojson.query_point(-97.5, 31.0).features]
+    assert 'Texas' in point
+    assert [f['properties']['NAME'] for f in geojson.to_columnar().query_bbox(*box).features] == expected
@@ -0,0 +1,198 @@
+import gzip
+import json
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import pandas_geojson as pdg
+from pandas_geojson.core import round_coordinates
+
+
+DATASETS = os.path.join(os.path.dirname(__file__), '..', 'datasets')
+CSV = os.path.join(DATASETS, 'ObesityByState.csv')
+
+
+def test_writer_rounds_parsed_csv_coordinates(tmp_path):
+    path = str(tmp_path / 'export.geojson.gz')
+    with pdg.GeoJSONWriter(path, precision=6) as writer:
+        for chunk in pd.read_csv(CSV, chunksize=2):
+            chunk['coordinates'] = chunk['coordinates'].apply(json.loads)
+            writer.write_dataframe(chunk, geometry_type_col='type', coordinate_col='coordinates', property_col_list=['NAME'])
+    with gzip.open(path, 'rt') as f:
+        features = json.load(f)['features']
+    assert len(features) == len(pd.read_csv(CSV))
+    x = features[0]['geometry']['coordinates'][0][0][0][0]
+    assert x == round(x, 6)
+
+
+def test_writer_rejects_text_coordinates(tmp_path):
+    with pytest.raises(TypeError, match='json.loads'):
+        with pdg.GeoJSONWriter(str(tmp_path / 'export.geojson'), precision=6) as writer:
+            writer.write_dataframe(pd.read_csv(CSV), geometry_type_col='type', coordinate_col='coordinates')
+
+
+def test_save_geojson_precision(tmp_path):
+    csv = pd.read_csv(CSV)
+    geojson = pdg.GeoJSON.from_dataframe(csv, geometry_type_col='type', coordinate_col='coordinates', property_col_list=['NAME'])
+    path = str(tmp_path / 'states.geojson')
+    with pytest.raises(TypeError, match='Feature 0: .*json.loads'):
+        pdg.save_geojson(geojson, path, precision=3)
+
+    csv['coordinates'] = csv['coordinates'].apply(json.loads)
+    geojson = pdg.GeoJSON.from_dataframe(csv, geometry_type_col='type', coordinate_col='coordinates', property_col_list=['NAME'])
+    pdg.save_geojson(geojson, path, precision=3)
+    saved = pdg.read_geojson(path)
+    assert saved.features == geojson.round_coordinates(3).features
+    assert saved.features[0]['geometry']['coordinates'][0][0][0] == [round(v, 3) for v in csv['coordinates'][0][0][0][0]]
+
+
+SQUARE = [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
+OPEN_RING = [[[0, 0], [1, 0], [1, 1], [0, 1]]]
+
+
+@pytest.fixture
+def open_ring_file(tmp_path):
+    features = [{'type': 'Feature', 'geometry': None, 'properties': {}}]
+    features += [{'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': ring}, 'properties': {}}
+                 for ring in [SQUARE, SQUARE, SQUARE, OPEN_RING]]
+    path = tmp_path / 'open.geojson'
+    path.write_text(json.dumps({'type': 'FeatureCollection', 'features': features}))
+    return str(path)
+
+
+@pytest.mark.parametrize('options', [{}, {'columnar': True}, {'columnar': True, 'engine': 'json'}])
+def test_read_geojson_full_validation(open_ring_file, options):
+    with pytest.raises(pdg.GeoJSONValidationError) as error:
+        pdg.read_geojson(open_ring_file, validate='full', **options)
+    assert error.value.indices == [4]
+    assert len(pdg.read_geojson(open_ring_file, validate='structure', **options).features) == 4
+
+
+def test_read_geojson_chunks_validation(open_ring_file):
+    with pytest.raises(pdg.GeoJSONValidationError) as error:
+        list(pdg.read_geojson(open_ring_file, chunksize=2, validate='full'))
+    assert error.value.indices == [4]
+    assert sum(len(chunk) for chunk in pdg.read_geojson(open_ring_file, chunksize=2)) == 4
+
+
+@pytest.mark.parametrize('options', [{'columnar': True}, {'engine': 'json'}, {'validate': 'strict'}])
+def test_read_geojson_chunks_rejects_options(open_ring_file, options):
+    with pytest.raises(ValueError):
+        pdg.read_geojson(open_ring_file, chunksize=2, **options)
+
+
+def test_writer_leaves_unfinished_file_on_error(tmp_path):
+    path = str(tmp_path / 'export.geojson')
+    with pytest.raises(RuntimeError):
+        with pdg.GeoJSONWriter(path) as writer:
+            writer.write({'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1.0, 2.0]}, 'properties': {}})
+            raise RuntimeError('source failed')
+    assert writer.closed
+    with open(path, encoding='utf8') as f:
+        with pytest.raises(json.JSONDecodeError):
+            json.load(f)
+
+
+def test_columnar_save_matches_list_save(tmp_path):
+    geojson = pdg.read_geojson(os.path.join(DATASETS, 'National_Obesity_By_State.geojson'))
+    pdg.save_geojson(geojson, str(tmp_path / 'list.geojson'))
+    pdg.save_geojson(geojson.to_columnar(), str(tmp_path / 'columnar.geojson'))
+    assert (tmp_path / 'list.geojson').read_bytes() == (tmp_path / 'columnar.geojson').read_bytes()
+
+
+def test_round_coordinates_accepts_numpy_numbers():
+    assert round_coordinates([np.int64(1), np.float32(2.123456789)], 3) == [1, 2.123]
+    assert round_coordinates(np.array([[1, 2], [3, 4]]), 3) == [[1, 2], [3, 4]]
+    assert round_coordinates([[np.float64(1.23456), 2.0]], 2) == [[1.23, 2.0]]
+
+
+def features_of(path):
+    with open(path, encoding='utf8') as f:
+        return [feature for feature in json.load(f)['features'] if feature['geometry'] is not None]
+
+
+def test_iter_geojson_matches_full_read():
+    path = os.path.join(DATASETS, 'National_Obesity_By_State.geojson')
+    # A small read size makes features straddle the blocks read from the file
+    assert list(pdg.iter_geojson(path, read_size=100)) == features_of(path)
+
+
+def test_iter_geojson_chunks_and_file_objects(tmp_path):
+    path = os.path.join(DATASETS, 'National_Obesity_By_State.geojson')
+    chunks = list(pdg.iter_geojson(path, chunk_size=20))
+    assert [len(chunk) for chunk in chunks] == [20, 20, 11]
+    with open(path, 'rb') as f:
+        assert [feature['properties'] for feature in pdg.iter_geojson(f)] == [feature['properties'] for feature in features_of(path)]
+    with pytest.raises(ValueError):
+        list(pdg.iter_geojson(path, chunk_size=0))
+
+
+def test_iter_geojson_skips_null_geometries_and_other_members(tmp_path):
+    path = tmp_path / 'collection.geojson'
+    path.write_text(json.dumps({
+        'features': [
+            {'type': 'Feature', 'geometry': None, 'properties': {'i': 0}},
+            {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1.0, 2.0]}, 'properties': {'i': 1, 'text': ' ] } "'}},
+        ],
+        'type': 'FeatureCollection',
+        'name': {'nested': ['x']},
+    }), encoding='utf8')
+    assert [feature['properties']['i'] for feature in pdg.iter_geojson(str(path))] == [1]
+
+
+def test_iter_geojson_validates_geometries(tmp_path):
+    path = tmp_path / 'invalid.geojson'
+    path.write_text(json.dumps({'type': 'FeatureCollection', 'features': [
+        {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1.0]}, 'properties': {}}]}), encoding='utf8')
+    with pytest.raises(ValueError):
+        list(pdg.iter_geojson(str(path)))
+
+
+def test_chunksize_matches_to_dataframe():
+    path = os.path.join(DATASETS, 'National_Obesity_By_State.geojson')
+    chunks = pdg.read_geojson(path, chunksize=20)
+    assert not isinstance(chunks, (list, pd.DataFrame))
+    chunks = list(chunks)
+    assert [len(chunk) for chunk in chunks] == [20, 20, 11]
+    expected = pdg.read_geojson(path).to_dataframe()
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+
+def test_chunksize_rejects_invalid_sizes():
+    path = os.path.join(DATASETS, 'National_Obesity_By_State.geojson')
+    with pytest.raises(ValueError):
+        pdg.read_geojson(path, chunksize=0)
+
+
+@pytest.fixture
+def split_dataset(tmp_path):
+    path = os.path.join(DATASETS, 'National_Obesity_By_State.geojson')
+    with open(path, encoding='utf8') as f:
+        data = json.load(f)
+    paths = []
+    for part, features in enumerate([data['features'][:20], data['features'][20:40], data['features'][40:]]):
+        paths.append(str(tmp_path / f'part{part}.geojson'))
+        with open(paths[-1], 'w', encoding='utf8') as f:
+            json.dump({'type': 'FeatureCollection', 'features': features}, f)
+    return path, paths
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_read_geojson_many_matches_single_read(split_dataset, backend):
+    path, paths = split_dataset
+    geojson = pdg.read_geojson_many(list(reversed(paths)), workers=2, backend=backend)
+    expected = pdg.read_geojson(path).to_dict()['features']
+    assert geojson.columnar
+    assert geojson.to_dict()['features'] == expected[40:] + expected[20:40] + expected[:20]
+
+
+def test_read_geojson_many_glob_and_dataframe(split_dataset, tmp_path):
+    path, paths = split_dataset
+    data = pdg.read_geojson_many(str(tmp_path / 'part*.geojson'), backend='thread', as_dataframe=True)
+    expected = pdg.read_geojson(path).to_dataframe()
+    assert data['source'].tolist() == [paths[0]] * 20 + [paths[1]] * 20 + [paths[2]] * 11
+    pd.testing.assert_frame_equal(data.drop(columns='source'), expected)
+    with pytest.raises(FileNotFoundError):
+        pdg.read_geojson_many(str(tmp_path / 'missing*.geojson'))
+    with pytest.raises(ValueError):
+        pdg.read_geojson_many(paths, backend='cluster')
@@ -0,0 +1,96 @@
+import os
+import numpy as np
+import pytest
+import pandas_geojson as pdg
+
+pytest.importorskip('shapely')
+from shapely.geometry import shape  # noqa: E402
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+SQUARES = {'type': 'FeatureCollection', 'features': [
+    {'type': 'Feature', 'properties': {'name': 'west', 'value': 1},
+     'geometry': {'type': 'Polygon', 'coordinates': [
+         [[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0], [0.0, 0.0]],
+         [[0.5, 0.5], [0.5, 1.0], [1.0, 1.0], [1.0, 0.5], [0.5, 0.5]]]}},
+    {'type': 'Feature', 'properties': {'name': 'east', 'value': 2},
+     'geometry': {'type': 'MultiPolygon', 'coordinates': [
+         [[[2.0, 0.0], [4.0, 0.0], [4.0, 2.0], [2.0, 2.0], [2.0, 0.0]]],
+         [[[5.0, 5.0], [6.0, 5.0], [5.0, 6.0], [5.0, 5.0]]]]}},
+]}
+POINTS = [
+    [1.5, 1.5],    # inside west
+    [0.75, 0.75],  # in the hole of west
+    [0.5, 0.75],   # on the hole boundary
+    [2.0, 1.0],    # on the shared border
+    [0.0, 0.0],    # on a vertex
+    [5.2, 5.2],    # inside the second part of east
+    [5.6, 5.6],    # outside the triangle
+    [9.0, 9.0],    # outside everything
+]
+
+
+def brute_force(left, right, predicate):
+    polygons = [shape(feature['geometry']) for feature in right.features]
+    pairs = []
+    for i, feature in enumerate(left.features):
+        point = shape(feature['geometry'])
+        for j, polygon in enumerate(polygons):
+            if point.within(polygon) if predicate == 'within' else point.intersects(polygon):
+                pairs.append((i, j))
+    return sorted(pairs)
+
+
+def pairs(joined):
+    return sorted(zip(joined['index_left'].tolist(), joined['index_right'].tolist()))
+
+
+def points(coordinates, multi=()):
+    features = [{'type': 'Feature', 'properties': {'name': f'p{i}', 'i': i},
+                 'geometry': {'type': 'Point', 'coordinates': position}} for i, position in enumerate(coordinates)]
+    features += [{'type': 'Feature', 'properties': {'name': f'm{i}', 'i': len(features) + i},
+                  'geometry': {'type': 'MultiPoint', 'coordinates': positions}} for i, positions in enumerate(multi)]
+    return pdg.GeoJSON.from_dict({'type': 'FeatureCollection', 'features': features})
+
+
+@pytest.mark.parametrize('predicate', ['within', 'intersects'])
+def test_matches_brute_force_on_edge_cases(predicate):
+    left = points(POINTS, multi=[[[1.5, 1.5], [2.0, 1.0]], [[2.0, 1.0], [2.0, 0.5]], [[9.0, 9.0], [5.2, 5.2]]])
+    right = pdg.GeoJSON.from_dict(SQUARES)
+    assert pairs(left.sjoin(right, predicate=predicate)) == brute_force(left, right, predicate)
+
+
+@pytest.mark.parametrize('predicate', ['within', 'intersects'])
+def test_matches_brute_force_on_states(predicate):
+    states = pdg.read_geojson(DATASET)
+    minx, miny = states.bounds()[:, :2].min(axis=0)
+    maxx, maxy = states.bounds()[:, 2:].max(axis=0)
+    rng = np.random.default_rng(0)
+    random = np.column_stack([rng.uniform(minx, maxx, 2000), rng.uniform(miny, maxy, 2000)]).tolist()
+    # Vertices are on the boundary of one or more states
+    vertices = [feature['geometry']['coordinates'][0][0][0] for feature in list(states.features)[:20]
+                if feature['geometry']['type'] == 'MultiPolygon']
+    left = points(random + vertices)
+    expected = brute_force(left, states, predicate)
+    assert len(expected) > 100
+    assert pairs(left.sjoin(states, predicate=predicate)) == expected
+    assert pairs(left.sjoin(states, predicate=predicate, chunk_size=333)) == expected
+
+
+def test_workers_and_columns():
+    left = points(POINTS)
+    right = pdg.GeoJSON.from_dict(SQUARES)
+    joined = left.sjoin(right)
+    assert pairs(left.sjoin(right, workers=2, chunk_size=3)) == pairs(joined)
+    assert list(joined.columns) == ['index_left', 'index_right', 'name_left', 'i', 'name_right', 'value']
+    row = joined[joined['index_left'] == 0].iloc[0]
+    assert (row['name_left'], row['name_right'], row['value']) == ('p0', 'west', 1)
+
+
+def test_invalid_input():
+    left = points(POINTS)
+    right = pdg.GeoJSON.from_dict(SQUARES)
+    with pytest.raises(ValueError):
+        left.sjoin(right, predicate='touches')
+    with pytest.raises(ValueError):
+        right.sjoin(left)
@@ -0,0 +1,87 @@
+import json
+import os
+import pytest
+import pandas_geojson as pdg
+from pandas_geojson.validation import GeoJSONValidationError
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+
+
+@pytest.fixture
+def expected():
+    with open(DATASET, encoding='utf8') as f:
+        features = json.load(f)['features']
+    return [{'type': 'Feature', 'geometry': feature['geometry'], 'properties': feature['properties'] or {}}
+            for feature in features]
+
+
+@pytest.fixture
+def lazy():
+    geojson = pdg.GeoJSON.open_lazy(DATASET, cache_size=4)
+    yield geojson
+    geojson.features.close()
+
+
+def test_matches_full_read(lazy, expected):
+    assert len(lazy.features) == len(expected)
+    assert list(lazy.features) == expected
+    assert lazy.to_dict()['features'] == expected
+    # Features without geometry are kept, unlike read_geojson
+    full = pdg.read_geojson(DATASET).to_dict()['features']
+    assert [feature for feature in expected if feature['geometry'] is not None] == full
+
+
+def test_indexing(lazy, expected):
+    assert lazy.features[0] == expected[0]
+    assert lazy.features[-1] == expected[-1]
+    assert lazy.features[-len(expected)] == expected[0]
+    assert lazy.features[10:20:3] == expected[10:20:3]
+    for i in (len(expected), -len(expected) - 1):
+        with pytest.raises(IndexError):
+            lazy.features[i]
+
+
+def test_cache_is_bounded_lru(lazy, monkeypatch):
+    features = lazy.features
+    parsed = []
+    parse = features._parse
+    monkeypatch.setattr(features, '_parse', lambda i: parsed.append(i) or parse(i))
+    for i in (0, 1, 2, 3, 0, 4, 1, 0):
+        features[i]
+    # 1 was evicted by 4 while 0 stayed because it had been used again
+    assert parsed == [0, 1, 2, 3, 4, 1]
+    assert list(features._cache) == [3, 4, 1, 0]
+    assert features[0] is features[0]
+
+
+def test_cache_disabled(monkeypatch):
+    geojson = pdg.GeoJSON.open_lazy(DATASET, cache_size=0)
+    parsed = []
+    parse = geojson.features._parse
+    monkeypatch.setattr(geojson.features, '_parse', lambda i: parsed.append(i) or parse(i))
+    geojson.features[5]
+    geojson.features[5]
+    assert parsed == [5, 5]
+    assert len(geojson.features._cache) == 0
+    geojson.features.close()
+
+
+def test_read_only(lazy):
+    with pytest.raises(TypeError):
+        lazy.add_features([pdg.Point([1.0, 2.0])])
+    with pytest.raises(TypeError):
+        lazy.features.append({'type': 'Feature', 'geometry': None, 'properties': {}})
+
+
+def test_invalid_feature_raises_on_access(tmp_path):
+    path = tmp_path / 'invalid.geojson'
+    path.write_text(json.dumps({'type': 'FeatureCollection', 'features': [
+        {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1.0, 2.0]}, 'properties': {}},
+        {'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': 'x'}, 'properties': {}},
+    ]}))
+    geojson = pdg.GeoJSON.open_lazy(str(path))
+    assert geojson.features[0]['geometry']['coordinates'] == [1.0, 2.0]
+    with pytest.raises(GeoJSONValidationError):
+        geojson.features[1]
+    geojson.features.close()
@@ -0,0 +1,112 @@
+import math
+import os
+import numpy as np
+import pytest
+import pandas_geojson as pdg
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+MIXED = {'type': 'FeatureCollection', 'features': [
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1.0, 2.0]}, 'properties': {}},
+    {'type': 'Feature', 'geometry': {'type': 'MultiPoint', 'coordinates': [[0.0, 0.0], [2.0, 4.0], [4.0, 2.0]]}, 'properties': {}},
+    {'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': [[0.0, 0.0], [3.0, 4.0], [3.0, 10.0]]}, 'properties': {}},
+    {'type': 'Feature', 'geometry': {'type': 'MultiLineString', 'coordinates': [
+        [[0.0, 0.0], [1.0, 0.0]], [[5.0, 5.0], [5.0, 7.0]]]}, 'properties': {}},
+    {'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': [
+        [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]],
+        [[1.0, 1.0], [1.0, 2.0], [2.0, 2.0], [2.0, 1.0], [1.0, 1.0]]]}, 'properties': {}},
+    {'type': 'Feature', 'geometry': {'type': 'MultiPolygon', 'coordinates': [
+        [[[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 0.0], [0.0, 0.0]]],
+        [[[10.0, 10.0], [13.0, 10.0], [13.0, 12.0], [10.0, 10.0]]]]}, 'properties': {}},
+]}
+
+
+def positions(coordinates):
+    if not isinstance(coordinates[0], list):
+        return [coordinates]
+    return [position for part in coordinates for position in positions(part)]
+
+
+def polygons(geometry):
+    if geometry['type'] == 'Polygon':
+        return [geometry['coordinates']]
+    if geometry['type'] == 'MultiPolygon':
+        return geometry['coordinates']
+    return []
+
+
+def lines(geometry):
+    if geometry['type'] == 'LineString':
+        return [geometry['coordinates']]
+    if geometry['type'] == 'MultiLineString':
+        return geometry['coordinates']
+    return [ring for polygon in polygons(geometry) for ring in polygon]
+
+
+def ring_area(ring):
+    return abs(sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(ring[:-1], ring[1:]))) / 2
+
+
+def brute_area(geometry):
+    return sum(ring_area(polygon[0]) - sum(ring_area(hole) for hole in polygon[1:]) for polygon in polygons(geometry))
+
+
+def brute_length(geometry):
+    return sum(math.dist(a, b) for line in lines(geometry) for a, b in zip(line[:-1], line[1:]))
+
+
+@pytest.fixture(params=['mixed', 'dataset'])
+def geojson(request):
+    if request.param == 'mixed':
+        return pdg.GeoJSON.from_dict(MIXED)
+    return pdg.read_geojson(DATASET)
+
+
+def test_bounds(geojson):
+    expected = []
+    for feature in geojson.features:
+        xs, ys = zip(*positions(feature['geometry']['coordinates']))
+        expected.append([min(xs), min(ys), max(xs), max(ys)])
+    np.testing.assert_array_equal(geojson.bounds(), expected)
+
+
+def test_area_and_length(geojson):
+    geometries = [feature['geometry'] for feature in geojson.features]
+    np.testing.assert_allclose(geojson.area(), [brute_area(g) for g in geometries], rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(geojson.length(), [brute_length(g) for g in geometries], rtol=1e-9)
+
+
+def test_mixed_values():
+    geojson = pdg.GeoJSON.from_dict(MIXED)
+    np.testing.assert_allclose(geojson.area(), [0, 0, 0, 0, 15, 4])
+    np.testing.assert_allclose(geojson.length(), [0, 0, 11, 3, 20, 4 + 5 + math.sqrt(13)])
+
+
+def test_centroid_matches_shapely(geojson):
+    pytest.importorskip('shapely')
+    from shapely.geometry import shape
+    expected = [shape(feature['geometry']).centroid.coords[0] for feature in geojson.features]
+    np.testing.assert_allclose(geojson.centroid(), expected, rtol=1e-9, atol=1e-9)
+
+
+def test_geodesic_measures():
+    square = pdg.GeoJSON.from_dict({'type': 'FeatureCollection', 'features': [
+        {'type': 'Feature', 'properties': {}, 'geometry': {'type': 'Polygon', 'coordinates': [
+            [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]]}},
+        {'type': 'Feature', 'properties': {}, 'geometry': {'type': 'LineString', 'coordinates': [[0.0, 0.0], [0.0, 1.0]]}},
+    ]})
+    radius = 6371008.8
+    # Band between two latitudes, one degree of longitude wide
+    expected_area = radius ** 2 * math.radians(1) * math.sin(math.radians(1))
+    np.testing.assert_allclose(square.area(geodesic=True), [expected_area, 0], rtol=1e-9)
+    np.testing.assert_allclose(square.length(geodesic=True)[1], radius * math.radians(1), rtol=1e-12)
+
+
+def test_null_geometries_are_nan():
+    geojson = pdg.GeoJSON.open_lazy(DATASET)
+    missing = np.array([feature['geometry'] is None for feature in geojson.features])
+    assert missing.sum() == 1
+    assert np.isnan(geojson.bounds()[missing]).all() and not np.isnan(geojson.bounds()[~missing]).any()
+    assert np.isnan(geojson.centroid()[missing]).all()
+    assert geojson.area()[missing].tolist() == [0.0]
+    geojson.features.close()
@@ -0,0 +1,85 @@
+import json
+import os
+import pytest
+import pandas_geojson as pdg
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+
+
+def write(tmp_path, data, name='collection.geojson'):
+    path = tmp_path / name
+    path.write_text(data if isinstance(data, str) else json.dumps(data))
+    return str(path)
+
+
+def test_empty_features_with_trailing_members(tmp_path):
+    path = write(tmp_path, '{"type":"FeatureCollection","features":[],"name":"x"}')
+    assert pdg.read_geojson(path, properties=['a']).features == []
+
+
+def test_invalid_file_closes_the_mapping(tmp_path):
+    path = write(tmp_path, '{"type":"FeatureCollection","features":[{"type":"Feature","geometry":null,"properties":{"a":')
+    # Used to surface as BufferError, as numpy views of the mapping outlived the scan
+    with pytest.raises(ValueError, match='unterminated'):
+        pdg.read_geojson(path, properties=['a'])
+
+
+def test_projection_matches_full_read():
+    full = pdg.read_geojson(DATASET)
+    projected = pdg.read_geojson(DATASET, properties=['NAME'], where={'NAME': ['Texas', 'Utah']})
+    expected = [f for f in full.features if f['properties']['NAME'] in ('Texas', 'Utah')]
+    assert [f['properties'] for f in projected.features] == [{'NAME': f['properties']['NAME']} for f in expected]
+    assert [f['geometry'] for f in projected.features] == [f['geometry'] for f in expected]
+
+
+def test_validation_errors_report_file_positions(tmp_path):
+    square = [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
+    open_ring = [[[0, 0], [1, 0], [1, 1], [0, 1]]]
+    features = [{'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': ring}, 'properties': {'keep': keep}}
+                for ring, keep in [(square, False), (square, True), (open_ring, False), (open_ring, True)]]
+    path = write(tmp_path, {'type': 'FeatureCollection', 'features': features})
+    with pytest.raises(pdg.GeoJSONValidationError) as error:
+        pdg.read_geojson(path, where={'keep': True}, validate='full')
+    assert error.value.indices == [3]
+
+
+def test_dropped_properties_are_not_decoded(monkeypatch):
+    import pandas_geojson.io as io
+    decoded = []
+    loader = io.loader
+
+    def recording(engine=None):
+        decode = loader(engine)
+        return lambda data: decoded.append(bytes(data)) or decode(data)
+    monkeypatch.setattr(io, 'loader', recording)
+    projected = pdg.read_geojson(DATASET, properties=['NAME'], where={'Obesity': 24.5}, geometry=False)
+    assert [f['properties'] for f in projected.features] == [{'NAME': 'Utah'}]
+    assert not any(b'SHAPE_Area' in data or b'coordinates' in data for data in decoded)
+
+
+def test_bbox_matches_brute_force():
+    bbox = (-100, 30, -90, 40)
+    inside = []
+    for feature in pdg.read_geojson(DATASET).features:
+        points = feature['geometry']['coordinates']
+        while isinstance(points[0][0], list):
+            points = [point for part in points for point in part]
+        xs, ys = [point[0] for point in points], [point[1] for point in points]
+        if min(xs) <= bbox[2] and max(xs) >= bbox[0] and min(ys) <= bbox[3] and max(ys) >= bbox[1]:
+            inside.append(feature['properties']['NAME'])
+    assert [f['properties']['NAME'] for f in pdg.read_geojson(DATASET, bbox=bbox).features] == inside
+    assert 0 < len(inside) < 51
+
+
+def test_bbox_member_is_used_when_present(tmp_path):
+    features = [{'type': 'Feature', 'bbox': box, 'geometry': {'type': 'Point', 'coordinates': [0.5, 0.5]}, 'properties': {'i': i}}
+                for i, box in enumerate([[0, 0, 1, 1], [10, 10, 11, 11]])]
+    path = write(tmp_path, {'type': 'FeatureCollection', 'features': features})
+    assert [f['properties']['i'] for f in pdg.read_geojson(path, bbox=(9, 9, 12, 12)).features] == [1]
+
+
+def test_without_geometry():
+    names = pdg.read_geojson(DATASET, properties=['NAME'], geometry=False)
+    assert len(names.features) == 51
+    assert all(f['geometry'] is None and list(f['properties']) == ['NAME'] for f in names.features)
@@ -0,0 +1,46 @@
+import copy
+import json
+import os
+import pickle
+import pandas as pd
+import pytest
+import pandas_geojson as pdg
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+
+
+def test_to_dict_returns_plain_dictionaries():
+    geojson = pdg.read_geojson(DATASET)
+    data = geojson.to_dict()
+    assert all(type(feature) is dict and type(feature['properties']) is dict for feature in data['features'])
+    assert json.loads(json.dumps(data)) == data
+    assert len(pd.json_normalize(data, record_path=['features'])) == len(geojson.features)
+
+
+def test_record_members_are_read_only():
+    geojson = pdg.read_geojson(DATASET)
+    feature = geojson.features[0]
+    with pytest.raises(TypeError, match='update_properties'):
+        feature['properties']['NAME'] = 'Changed'
+    with pytest.raises(TypeError):
+        feature['geometry'].update(type='Point')
+    geojson.update_properties([0], {'NAME': 'Changed'})
+    assert geojson.features[0]['properties']['NAME'] == 'Changed'
+
+
+def test_read_only_members_copy_to_dictionaries():
+    properties = pdg.read_geojson(DATASET).features[0]['properties']
+    for copied in (pickle.loads(pickle.dumps(properties)), copy.deepcopy(properties), properties.copy()):
+        assert type(copied) is dict and copied == properties
+        copied['NAME'] = 'Changed'
+
+
+def test_features_are_stored_as_records():
+    with open(DATASET, encoding='utf8') as f:
+        data = json.load(f)
+    geojson = pdg.GeoJSON(type='FeatureCollection', features=data['features'])
+    assert all(type(feature) is pdg.Feature for feature in geojson.features)
+    assert geojson.to_dict()['features'] == [
+        {'type': 'Feature', 'geometry': feature['geometry'], 'properties': feature['properties']}
+        for feature in data['features']]
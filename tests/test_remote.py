@@ -0,0 +1,141 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+import pytest
+import pandas_geojson as pdg
+from pandas_geojson.remote import ConnectionPool, fetch_geojson_url
+
+
+BODY = json.dumps({'type': 'FeatureCollection', 'features': [
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [1.0, 2.0]}, 'properties': {'name': 'a'}},
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [3.0, 4.0]}, 'properties': {'name': 'b'}},
+]}).encode('utf8')
+ETAG = '"v1"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.client_address, self.headers.get('If-None-Match')))
+        if self.path == '/redirect':
+            self._send(302, headers={'Location': '/data.geojson'})
+        elif self.path == '/data.geojson' and self.headers.get('If-None-Match') == ETAG:
+            self._send(304, headers={'ETag': ETAG})
+        elif self.path == '/data.geojson':
+            self._send(200, BODY, {'ETag': ETAG, 'Content-Type': 'application/geo+json'})
+        else:
+            self._send(404, b'not found')
+
+    def _send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Clients closing connections early is part of the tests
+        pass
+
+
+@pytest.fixture
+def server():
+    server = Server(('127.0.0.1', 0), Handler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def names(geojson):
+    return [feature['properties']['name'] for feature in geojson.features]
+
+
+def test_pool_reuses_connection(server):
+    server, base = server
+    pool = ConnectionPool(timeout=5)
+    try:
+        for _ in range(3):
+            assert names(fetch_geojson_url(base + '/data.geojson', pool=pool)) == ['a', 'b']
+    finally:
+        pool.close()
+    assert len({client for _, client, _ in server.requests}) == 1
+
+
+def test_cache_revalidates_with_etag(server, tmp_path):
+    server, base = server
+    pool = ConnectionPool(timeout=5)
+    try:
+        first = fetch_geojson_url(base + '/data.geojson', cache_dir=str(tmp_path), pool=pool)
+        second = fetch_geojson_url(base + '/data.geojson', cache_dir=str(tmp_path), pool=pool)
+    finally:
+        pool.close()
+    assert names(first) == names(second) == ['a', 'b']
+    assert [etag for _, _, etag in server.requests] == [None, ETAG]
+
+
+def test_follows_redirects(server):
+    server, base = server
+    pool = ConnectionPool(timeout=5)
+    try:
+        assert names(fetch_geojson_url(base + '/redirect', pool=pool)) == ['a', 'b']
+    finally:
+        pool.close()
+    assert [path for path, _, _ in server.requests] == ['/redirect', '/data.geojson']
+
+
+def test_missing_raises_and_closes_connection(server):
+    server, base = server
+    pool = ConnectionPool(timeout=5)
+    with pytest.raises(HTTPError) as error:
+        fetch_geojson_url(base + '/missing.geojson', pool=pool)
+    assert error.value.code == 404
+    assert not any(pool._idle.values())
+    pool.close()
+
+
+def test_read_geojson_urls_keeps_order(server):
+    server, base = server
+    urls = [base + '/data.geojson', base + '/redirect']
+    assert [names(geojson) for geojson in pdg.read_geojson_urls(urls, concurrency=2)] == [['a', 'b'], ['a', 'b']]
+
+
+def test_interrupted_request_closes_connection(server, monkeypatch):
+    server, base = server
+    pool = ConnectionPool(timeout=5)
+    acquired = []
+    acquire = pool._acquire
+    monkeypatch.setattr(pool, '_acquire', lambda key: acquired.append(acquire(key)) or acquired[-1])
+
+    def interrupt(self):
+        raise KeyboardInterrupt
+    monkeypatch.setattr('http.client.HTTPConnection.getresponse', interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        pool.request(base + '/data.geojson')
+    connection, _ = acquired[0]
+    assert connection.sock is None
+
+
+def test_failed_download_leaves_no_temporary_file(server, tmp_path, monkeypatch):
+    server, base = server
+
+    def fail(source, target):
+        target.write(b'{"type": "Feat')
+        raise ConnectionResetError
+    monkeypatch.setattr('pandas_geojson.remote.shutil.copyfileobj', fail)
+    pool = ConnectionPool(timeout=5)
+    with pytest.raises(ConnectionResetError):
+        fetch_geojson_url(base + '/data.geojson', cache_dir=str(tmp_path), pool=pool)
+    pool.close()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,51 @@
+import json
+import pytest
+import pandas_geojson as pdg
+from pandas_geojson.seq import GeoJSONSeq
+
+
+def feature(name, geometry):
+    return {'type': 'Feature', 'geometry': geometry, 'properties': {'name': name}}
+
+
+POINT = {'type': 'Point', 'coordinates': [1.0, 2.0]}
+OPEN_RING = {'type': 'Polygon', 'coordinates': [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]]}
+FEATURES = [feature('a', POINT), feature('b', POINT), feature('c', None), feature('d', POINT), feature('e', OPEN_RING)]
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / 'features.geojsons'
+    path.write_text(''.join(json.dumps(item) + '\n' for item in FEATURES), encoding='utf8')
+    return str(path)
+
+
+def names(geojson):
+    return [item['properties']['name'] for item in geojson.features]
+
+
+def test_take_keeps_null_geometries(path):
+    with GeoJSONSeq(path) as seq:
+        assert names(seq.take([1, 2, 3])) == ['b', 'c', 'd']
+        assert seq[2]['geometry'] is None
+        assert seq[-2]['properties']['name'] == 'd'
+        with pytest.raises(IndexError):
+            seq[len(FEATURES)]
+
+
+def test_take_reports_file_positions(path):
+    with GeoJSONSeq(path, validate='full') as seq:
+        assert names(seq.take([3, 0])) == ['d', 'a']
+        with pytest.raises(pdg.GeoJSONValidationError) as error:
+            seq.take([2, 4])
+    assert error.value.indices == [4]
+
+
+def test_save_and_read_round_trip(tmp_path):
+    geojson = pdg.GeoJSON.from_dict({'type': 'FeatureCollection', 'features': FEATURES[:4]})
+    path = str(tmp_path / 'saved.geojsons')
+    pdg.save_geojsonseq(geojson, path, rs=True, index=True)
+    assert pdg.read_geojsonseq(path).to_dict()['features'] == geojson.to_dict()['features']
+    with GeoJSONSeq(path) as seq:
+        parts = seq.split(2)
+    assert parts[0][0] == 0 and parts[-1][1] == 3
@@ -0,0 +1,132 @@
+import os
+import numpy as np
+import pytest
+import pandas_geojson as pdg
+from pandas_geojson.tiles import TileSet
+
+mapbox_vector_tile = pytest.importorskip('mapbox_vector_tile')
+pytest.importorskip('shapely')
+from shapely import transform  # noqa: E402
+from shapely.geometry import box, shape  # noqa: E402
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+MIXED = {'type': 'FeatureCollection', 'features': [
+    {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [10.0, 10.0]},
+     'properties': {'name': 'point', 'count': 3, 'negative': -2, 'share': 0.5, 'flag': True,
+                    'tags': ['a', 'b'], 'missing': None}},
+    {'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': [[-20.0, -20.0], [0.0, 5.0], [20.0, -20.0]]},
+     'properties': {'name': 'line'}},
+    {'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': [
+        [[-40.0, 20.0], [-10.0, 20.0], [-10.0, 50.0], [-40.0, 50.0], [-40.0, 20.0]],
+        [[-30.0, 30.0], [-20.0, 30.0], [-20.0, 40.0], [-30.0, 40.0], [-30.0, 30.0]]]},
+     'properties': {'name': 'polygon'}},
+]}
+# Tile over the south-central United States
+TILE = (4, 3, 6)
+
+
+def decode(tile):
+    layers = mapbox_vector_tile.decode(tile, default_options={'y_coord_down': True})
+    return {feature['properties']['name' if 'name' in feature['properties'] else 'NAME']: feature
+            for feature in layers['features']['features']}
+
+
+def tile_projection(z, x, y, extent=4096):
+    '''
+    Longitude and latitude to the integer coordinates of tile ``z/x/y``.
+    '''
+    n = 2 ** z
+
+    def project(coords):
+        world_x = coords[:, 0] / 360 + 0.5
+        world_y = 0.5 - np.log(np.tan(np.pi / 4 + np.radians(coords[:, 1]) / 2)) / (2 * np.pi)
+        return np.column_stack([(world_x * n - x) * extent, (world_y * n - y) * extent])
+    return project
+
+
+def test_tile_matches_clipped_features():
+    geojson = pdg.read_geojson(DATASET)
+    decoded = decode(geojson.to_vector_tile(*TILE))
+    project = tile_projection(*TILE)
+    # Features reaching into the 64 unit buffer around the tile are included
+    clip = box(-64, -64, 4096 + 64, 4096 + 64)
+    expected = {feature['properties']['NAME']: transform(shape(feature['geometry']), project)
+                for feature in geojson.features}
+    expected = {name: polygon for name, polygon in expected.items() if polygon.intersects(clip)}
+    assert set(decoded) == set(expected)
+    assert len(expected) > 10
+    for name, polygon in expected.items():
+        feature = decoded[name]
+        original = next(f for f in geojson.features if f['properties']['NAME'] == name)
+        assert feature['properties'] == dict(original['properties'])
+        assert feature['geometry']['type'] in ('Polygon', 'MultiPolygon')
+        clipped = polygon.intersection(clip)
+        # Vertices are rounded to the tile grid and simplified by up to 3 units
+        assert abs(shape(feature['geometry']).area - clipped.area) <= 3 * clipped.length + 1
+
+
+def test_tile_geometry_types_and_values():
+    geojson = pdg.GeoJSON.from_dict(MIXED)
+    decoded = decode(geojson.to_vector_tile(0, 0, 0, extent=256, buffer=0))
+    assert {name: feature['geometry']['type'] for name, feature in decoded.items()} == \
+        {'point': 'Point', 'line': 'LineString', 'polygon': 'Polygon'}
+    assert decoded['point']['properties'] == {'name': 'point', 'count': 3, 'negative': -2, 'share': 0.5,
+                                              'flag': True, 'tags': '["a","b"]'}
+    project = tile_projection(0, 0, 0, extent=256)
+    assert decoded['point']['geometry']['coordinates'] == np.round(project(np.array([[10.0, 10.0]])))[0].tolist()
+    _, hole = decoded['polygon']['geometry']['coordinates']
+    expected = transform(shape(MIXED['features'][2]['geometry']), project)
+    assert abs(shape(decoded['polygon']['geometry']).area - expected.area) <= expected.length
+    assert len(hole) == 5
+
+
+def test_empty_and_invalid_tiles():
+    geojson = pdg.GeoJSON.from_dict(MIXED)
+    # Tile 2/3/0 covers 90E to 180E in the far north
+    assert geojson.to_vector_tile(2, 3, 0) == b''
+    with pytest.raises(ValueError):
+        geojson.to_vector_tile(2, 4, 0)
+    with pytest.raises(ValueError):
+        pdg.tile_bounds(-1, 0, 0)
+
+
+def test_memory_cache_is_lru(monkeypatch):
+    tiles = TileSet(pdg.read_geojson(DATASET), cache_size=2)
+    encoded = []
+    encode = tiles._encode
+    monkeypatch.setattr(tiles, '_encode', lambda z, x, y: encoded.append((z, x, y)) or encode(z, x, y))
+    first = tiles.get(4, 3, 6)
+    tiles.get(4, 4, 6)
+    assert tiles.get(4, 3, 6) is first
+    tiles.get(4, 3, 5)
+    # 4/4/6 was the least recently used tile when 4/3/5 was added
+    assert list(tiles._cache) == [(4, 3, 6), (4, 3, 5)]
+    tiles.get(4, 4, 6)
+    assert encoded == [(4, 3, 6), (4, 4, 6), (4, 3, 5), (4, 4, 6)]
+    tiles.clear_cache()
+    assert len(tiles._cache) == 0
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    geojson = pdg.read_geojson(DATASET)
+    tiles = TileSet(geojson, cache_dir=str(tmp_path))
+    tile = tiles.get(*TILE)
+    assert (tmp_path / '4' / '3' / '6.mvt').read_bytes() == tile == geojson.to_vector_tile(*TILE)
+    assert [path.name for path in tmp_path.rglob('*') if path.is_file()] == ['6.mvt']
+
+    # A new tile set reads the tile from disk instead of encoding it
+    reopened = TileSet(geojson, cache_dir=str(tmp_path), cache_size=0)
+    monkeypatch.setattr(reopened, '_encode', lambda z, x, y: pytest.fail('tile was encoded again'))
+    assert reopened.get(*TILE) == tile
+
+
+def test_tiles_and_generate(tmp_path):
+    geojson = pdg.GeoJSON.from_dict(MIXED)
+    tiles = TileSet(geojson, cache_dir=str(tmp_path), buffer=0)
+    assert tiles.tiles(0) == [(0, 0)]
+    # The features span both halves of the world in x and y
+    assert tiles.tiles(1) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    count = tiles.generate(0, 2)
+    assert count == len([path for path in tmp_path.rglob('*.mvt') if path.stat().st_size])
+    assert count == sum(len(geojson.to_vector_tile(z, x, y, buffer=0)) > 0 for z in range(3) for x, y in tiles.tiles(z))
@@ -0,0 +1,98 @@
+import json
+import os
+from collections import Counter
+import pytest
+import pandas_geojson as pdg
+
+pytest.importorskip('shapely')
+from shapely.geometry import shape  # noqa: E402
+
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'datasets', 'National_Obesity_By_State.geojson')
+SQUARES = {'type': 'FeatureCollection', 'features': [
+    {'type': 'Feature', 'properties': {'name': 'west'},
+     'geometry': {'type': 'Polygon', 'coordinates': [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]]}},
+    {'type': 'Feature', 'properties': {'name': 'east'},
+     'geometry': {'type': 'Polygon', 'coordinates': [[[1.0, 0.0], [2.0, 0.0], [2.0, 1.0], [1.0, 1.0], [1.0, 0.0]]]}},
+    {'type': 'Feature', 'properties': {'name': 'road'},
+     'geometry': {'type': 'LineString', 'coordinates': [[0.0, 2.0], [1.0, 2.0], [2.0, 2.0]]}},
+    {'type': 'Feature', 'properties': {'name': 'stop'},
+     'geometry': {'type': 'Point', 'coordinates': [0.5, 0.5]}},
+]}
+
+
+def arc_references(topology):
+    '''
+    Every arc index referenced by the geometries, negative ones resolved.
+    '''
+    def walk(value):
+        if isinstance(value, list):
+            for item in value:
+                yield from walk(item)
+        else:
+            yield value if value >= 0 else ~value
+    for geometry in next(iter(topology['objects'].values()))['geometries']:
+        yield from walk(geometry.get('arcs', []))
+
+
+def assert_same_geometries(left, right, tolerance):
+    left, right = left.to_dict()['features'], right.to_dict()['features']
+    assert len(left) == len(right)
+    for a, b in zip(left, right):
+        assert a['properties'] == b['properties']
+        assert a['geometry']['type'] == b['geometry']['type']
+        a, b = shape(a['geometry']), shape(b['geometry'])
+        assert a.hausdorff_distance(b) <= tolerance
+        if a.area:
+            assert a.symmetric_difference(b).area <= a.length * tolerance
+
+
+def test_shared_borders_are_stored_once():
+    geojson = pdg.GeoJSON.from_dict(SQUARES)
+    topology = geojson.to_topojson(quantization=None)
+    west, east, road, stop = topology['objects']['collection']['geometries']
+    shared = set(arc for ring in west['arcs'] for arc in ring) & set(~arc for ring in east['arcs'] for arc in ring)
+    assert len(shared) == 1
+    assert sorted(topology['arcs'][shared.pop()]) == [[1.0, 0.0], [1.0, 1.0]]
+    # The two outer chains, the shared border and the road
+    assert len(topology['arcs']) == 4
+    assert stop == {'type': 'Point', 'coordinates': [0.5, 0.5], 'properties': {'name': 'stop'}}
+    assert_same_geometries(pdg.read_topojson(topology), geojson, 0)
+
+
+def test_round_trip_without_quantization(tmp_path):
+    geojson = pdg.read_geojson(DATASET)
+    path = tmp_path / 'states.topojson'
+    path.write_text(json.dumps(geojson.to_topojson(quantization=None)))
+    assert_same_geometries(pdg.read_topojson(str(path)), geojson, 1e-12)
+
+
+def test_round_trip_with_quantization():
+    geojson = pdg.read_geojson(DATASET)
+    topology = geojson.to_topojson(quantization=10000)
+    scale = max(topology['transform']['scale'])
+    assert all(isinstance(value, int) for arc in topology['arcs'] for position in arc for value in position)
+    assert_same_geometries(pdg.read_topojson(topology), geojson, scale)
+
+
+def test_borders_between_states_are_shared():
+    geojson = pdg.read_geojson(DATASET)
+    topology = geojson.to_topojson()
+    counts = Counter(arc_references(topology))
+    assert set(counts) == set(range(len(topology['arcs'])))
+    # An arc is at most the border between two states
+    assert max(counts.values()) == 2
+    n_arc_positions = sum(len(arc) for arc in topology['arcs'])
+    n_positions = len(geojson._geometry_array().coords)
+    assert n_arc_positions < n_positions
+
+
+def test_invalid_input():
+    geojson = pdg.GeoJSON.from_dict(SQUARES)
+    with pytest.raises(ValueError):
+        geojson.to_topojson(quantization=1)
+    with pytest.raises(ValueError):
+        pdg.read_topojson({'type': 'FeatureCollection', 'features': []})
+    topology = geojson.to_topojson(object_name='squares')
+    assert list(topology['objects']) == ['squares']
+    assert len(pdg.read_topojson(topology, object_name='squares').features) == 4